@@ -11,11 +11,25 @@ Example usage:
     response = messenger.ask("context-manager", "context.query", {"query": "..."})
 """
 
+import os
+import random
+import threading
 import time
 import uuid
 from typing import Dict, List, Optional, Any
 
-from .core import CommunicationSystem, AlreadyClaimedError, MessageNotFoundError
+from .core import CommunicationSystem, Outbox, AlreadyClaimedError, MessageNotFoundError
+
+# Per-thread RNG for backoff jitter (no lock contention on random's global)
+_rng = threading.local()
+
+
+def _thread_rng() -> random.Random:
+    """Get this thread's RNG, seeding it on first use."""
+    rng = getattr(_rng, "rng", None)
+    if rng is None:
+        rng = _rng.rng = random.Random(os.urandom(8))
+    return rng
 
 
 class AgentMessenger:
@@ -29,16 +43,20 @@ class AgentMessenger:
     - Heartbeat management
     """
 
-    def __init__(self, agent_id: str, project_root: str = "."):
+    def __init__(self, agent_id: str, project_root: str = ".", batch_sends: bool = False):
         """
         Initialize messenger for an agent.
 
         Args:
             agent_id: Unique identifier for this agent
             project_root: Path to project root (usually ".")
+            batch_sends: Queue send()/broadcast() in an in-process outbox that
+                is written in batches (call flush() before relying on delivery;
+                close() or interpreter exit writes whatever is left)
         """
         self.agent_id = agent_id
         self.comm = CommunicationSystem(project_root)
+        self.outbox = Outbox(self.comm) if batch_sends else None
 
         # Ensure agent is registered
         self.comm.send_heartbeat(agent_id, "active")
@@ -76,7 +94,7 @@ class AgentMessenger:
         """
         to_agent = to if to else None
 
-        return self.comm.send_message(
+        return self._send(
             from_agent=self.agent_id,
             message_type=message_type,
             payload=data,
@@ -114,7 +132,7 @@ class AgentMessenger:
                 }
             )
         """
-        return self.comm.send_message(
+        return self._send(
             from_agent=self.agent_id,
             message_type=message_type,
             payload=data,
@@ -123,6 +141,32 @@ class AgentMessenger:
             priority=priority
         )
 
+    def flush(self) -> int:
+        """
+        Write any messages queued by batch_sends.
+
+        Returns:
+            Number of messages written (always 0 without batch_sends)
+        """
+        return self.outbox.flush() if self.outbox else 0
+
+    def close(self) -> None:
+        """
+        Write any messages queued by batch_sends and stop batching.
+
+        Later send()/broadcast() calls go straight to the database. A
+        messenger left open still has its queue written at interpreter exit.
+        """
+        if self.outbox:
+            self.outbox.close()
+            self.outbox = None
+
+    def _send(self, **message: Any) -> str:
+        """Send directly, or queue in the outbox when batching."""
+        if self.outbox:
+            return self.outbox.send(**message)
+        return self.comm.send_message(**message)
+
     def receive(
         self,
         limit: int = 10,
@@ -175,6 +219,30 @@ class AgentMessenger:
         except MessageNotFoundError:
             return False
 
+    def claim_next(self, message_type: Optional[str] = None) -> Optional[Dict[str, Any]]:
+        """
+        Receive and claim the next pending message in one step.
+
+        Args:
+            message_type: Optional filter by message type
+
+        Returns:
+            The claimed message, or None if nothing is pending
+
+        Example:
+            msg = messenger.claim_next()
+            if msg:
+                process(msg)
+                messenger.complete(msg['id'])
+        """
+        channels = self.comm.get_subscribed_channels(self.agent_id)
+
+        return self.comm.claim_next(
+            agent_id=self.agent_id,
+            channels=channels,
+            message_type=message_type
+        )
+
     def complete(self, message_id: str, error: Optional[str] = None) -> None:
         """
         Mark a message as processed.
@@ -193,6 +261,30 @@ class AgentMessenger:
         """
         self.comm.complete_message(message_id, error)
 
+    def process(self, message_id: str, error: Optional[str] = None) -> bool:
+        """
+        Claim and complete a message in one step.
+
+        Use for messages that need no further work once read (acks,
+        responses); long-running handlers should claim() then complete().
+
+        Args:
+            message_id: Message ID to process
+            error: Optional error message if processing failed
+
+        Returns:
+            True if processed, False if already taken
+
+        Example:
+            for msg in messenger.receive(message_type="task.claimed"):
+                if messenger.process(msg['id']):
+                    seen_claims.add(msg['payload']['task_id'])
+        """
+        try:
+            return self.comm.process_message(self.agent_id, message_id, error)
+        except MessageNotFoundError:
+            return False
+
     def ask(
         self,
         to: str,
@@ -235,7 +327,7 @@ class AgentMessenger:
         correlation_id = str(uuid.uuid4())
 
         # Send request
-        self.comm.send_message(
+        request_id = self.comm.send_message(
             from_agent=self.agent_id,
             message_type=message_type,
             payload=data,
@@ -245,30 +337,46 @@ class AgentMessenger:
             correlation_id=correlation_id
         )
 
-        # Wait for response with exponential backoff
+        # Wait for response. Responders in this process wake us through the
+        # correlation waiter; polling with full-jitter exponential backoff
+        # catches the rest without concurrent askers waking in lockstep
         start = time.time()
-        backoff = 0.01  # Start at 10ms
+        attempt = 0
+        base_backoff = 0.001  # Start at 1ms
         max_backoff = 1.0  # Max 1 second
+        rng = _thread_rng()
 
         channels = self.comm.get_subscribed_channels(self.agent_id)
+        waiter = self.comm.register_correlation_waiter(correlation_id)
 
-        while time.time() - start < timeout:
-            messages = self.comm.receive_messages(
-                agent_id=self.agent_id,
-                channels=channels,
-                limit=50
-            )
-
-            for msg in messages:
-                if msg.get('correlation_id') == correlation_id:
-                    # Found response!
-                    if self.comm.claim_message(self.agent_id, msg['id']):
-                        self.comm.complete_message(msg['id'])
-                        return msg
-
-            # Exponential backoff
-            time.sleep(backoff)
-            backoff = min(backoff * 2, max_backoff)
+        try:
+            while True:
+                # Only the matching response needs its payload decoded
+                messages = self.comm.receive_messages(
+                    agent_id=self.agent_id,
+                    channels=channels,
+                    limit=50,
+                    decode_payload=False
+                )
+
+                for msg in messages:
+                    if msg.get('correlation_id') == correlation_id and msg['id'] != request_id:
+                        # Found response!
+                        if self.comm.process_message(self.agent_id, msg['id']):
+                            msg['payload'] = self.comm.load_payload(msg['payload'])
+                            return msg
+
+                remaining = timeout - (time.time() - start)
+                if remaining <= 0:
+                    break
+
+                backoff = rng.uniform(0, min(base_backoff * 2 ** attempt, max_backoff))
+                if waiter.wait(min(backoff, remaining)):
+                    waiter.clear()
+                else:
+                    attempt += 1
+        finally:
+            self.comm.unregister_correlation_waiter(correlation_id)
 
         # Timeout
         return None
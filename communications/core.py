@@ -12,16 +12,82 @@ This module implements the fixed, bulletproof communication protocol with:
 Author: Protocol Audit v1.0
 """
 
+import atexit
 import json
+import logging
 import sqlite3
 import threading
 import time
 import uuid
+import weakref
+from collections import deque
 from contextlib import contextmanager
+from functools import lru_cache
 from datetime import datetime, timedelta
 from pathlib import Path
 from typing import Dict, List, Optional, Any
 
+# Channels created by initialize()
+DEFAULT_CHANNELS = ("general", "urgent", "technical", "review")
+
+try:
+    import orjson
+except ImportError:  # Optional speedup; stdlib json is used without it
+    orjson = None
+
+
+def _json_dumps(obj: Any) -> str:
+    """Serialize to JSON text (orjson when installed)."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS).decode()
+    return json.dumps(obj)
+
+
+def _json_loads(data: str) -> Any:
+    """Parse JSON text (orjson when installed)."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+@lru_cache(maxsize=64)
+def _receive_query(channel_count: int, filter_type: bool) -> str:
+    """
+    Build the receive_messages SQL for a channel count and type filter.
+
+    Cached so each poll reuses the identical string, which is what
+    sqlite3's per-connection statement cache is keyed on.
+    """
+    placeholders = ','.join('?' * channel_count)
+    type_filter = "AND m.type = ?" if filter_type else ""
+
+    return f"""
+        SELECT m.* FROM messages m
+        WHERE m.status = 'pending'
+          AND (
+              -- Direct messages to this agent (on any channel)
+              m.to_agent = ?
+              OR
+              -- Broadcast messages in subscribed channels not yet delivered
+              (m.to_agent IS NULL
+               AND m.channel IN ({placeholders})
+               AND EXISTS (
+                   SELECT 1 FROM channel_subscriptions cs
+                   WHERE cs.channel_name = m.channel
+                     AND cs.agent_id = ?
+               )
+               AND NOT EXISTS (
+                   SELECT 1 FROM message_deliveries md
+                   WHERE md.message_id = m.id
+                     AND md.agent_id = ?
+               ))
+          )
+          {type_filter}
+          AND (m.expires_at IS NULL OR datetime(m.expires_at) > datetime('now'))
+        ORDER BY m.priority DESC, m.timestamp ASC
+        LIMIT ?
+    """
+
 
 class CommunicationError(Exception):
     """Base exception for communication errors."""
@@ -53,6 +119,31 @@ class CommunicationSystem:
     # Thread-local storage for connections
     _local = threading.local()
 
+    # (db path, correlation_id) -> Event set when a message with that
+    # correlation_id is written by any instance in this process
+    _correlation_waiters: Dict[tuple, threading.Event] = {}
+    _waiters_lock = threading.Lock()
+
+    # Seconds a cached channel subscriber count stays valid
+    SUBSCRIBER_COUNT_TTL = 10.0
+
+    # Identical heartbeats closer together than this are not rewritten
+    HEARTBEAT_DEBOUNCE = 0.5
+
+    # Seconds a cached get_agent_health() result stays valid
+    HEALTH_TTL = 2.0
+
+    # Seconds the cached list_agents() registry stays valid
+    AGENT_REGISTRY_TTL = 10.0
+
+    # cleanup_expired_messages() deletes this many rows per transaction and
+    # pauses between batches so other writers can take the lock
+    CLEANUP_BATCH_SIZE = 500
+    CLEANUP_BATCH_PAUSE = 0.01
+
+    # Free pages returned to the filesystem after a cleanup
+    INCREMENTAL_VACUUM_PAGES = 1000
+
     def __init__(self, project_root: str = "."):
         """
         Initialize communication system.
@@ -70,19 +161,40 @@ class CommunicationSystem:
         self.comm_dir.mkdir(parents=True, exist_ok=True)
         self.artifacts_dir.mkdir(parents=True, exist_ok=True)
 
+        # channel -> (subscriber count, monotonic expiry)
+        self._subscriber_counts: Dict[str, tuple] = {}
+
+        # agent_id -> (status, current_task, monotonic time) of last heartbeat
+        self._last_heartbeats: Dict[str, tuple] = {}
+
+        # agent_id -> (health dict or None, monotonic expiry)
+        self._health_cache: Dict[str, tuple] = {}
+
+        # (tuple of registered agent_ids, monotonic expiry), None when stale
+        self._agents_cache: Optional[tuple] = None
+
     def _get_connection(self) -> sqlite3.Connection:
-        """Get thread-local database connection."""
-        # Each thread gets its own connection to avoid concurrency issues
-        thread_id = threading.get_ident()
+        """
+        Get thread-local database connection.
+
+        Opened and configured once per thread and database, then reused by
+        every instance (CommunicationSystem, VotingSystem, AgentMessenger)
+        pointing at the same project, so callers need not hold their own.
+        """
+        # Each thread gets its own connection to avoid concurrency issues.
+        # _local is shared by all instances, so key by database: instances
+        # for different project roots must not reuse each other's connection
+        db_key = str(self.db_path)
 
         if not hasattr(self._local, 'connections'):
             self._local.connections = {}
 
-        if thread_id not in self._local.connections:
+        if db_key not in self._local.connections:
             conn = sqlite3.connect(
                 str(self.db_path),
                 timeout=10.0,  # 10 second timeout for locks
-                check_same_thread=False
+                check_same_thread=False,
+                cached_statements=256  # Room for every query variant
             )
 
             # Configure for concurrency
@@ -90,11 +202,12 @@ class CommunicationSystem:
             conn.execute("PRAGMA synchronous=NORMAL")
             conn.execute("PRAGMA busy_timeout=10000")
             conn.execute("PRAGMA cache_size=-64000")  # 64MB cache
+            conn.execute("PRAGMA temp_store=MEMORY")  # ORDER BY / GROUP BY scratch
             conn.row_factory = sqlite3.Row
 
-            self._local.connections[thread_id] = conn
+            self._local.connections[db_key] = conn
 
-        return self._local.connections[thread_id]
+        return self._local.connections[db_key]
 
     @contextmanager
     def _transaction(self, immediate: bool = False):
@@ -127,6 +240,9 @@ class CommunicationSystem:
         """
         # Use a direct connection for initialization to ensure schema is committed
         conn = sqlite3.connect(str(self.db_path), timeout=10.0)
+        # Only takes effect on a new database (before any table exists);
+        # lets cleanup hand deleted pages back with incremental_vacuum
+        conn.execute("PRAGMA auto_vacuum=INCREMENTAL")
         conn.execute("PRAGMA journal_mode=WAL")
         conn.execute("PRAGMA synchronous=NORMAL")
         cursor = conn.cursor()
@@ -153,10 +269,23 @@ class CommunicationSystem:
             )
         """)
 
-        # Indexes for performance
+        # Indexes for performance. Partial on pending rows so claimed and
+        # finished messages drop out of the claim path; replaces
+        # idx_ready_messages, whose status column was constant under its own
+        # WHERE clause
+        cursor.execute("DROP INDEX IF EXISTS idx_ready_messages")
+        cursor.execute("""
+            CREATE INDEX IF NOT EXISTS idx_unclaimed_messages
+            ON messages(channel, priority DESC, timestamp)
+            WHERE status = 'pending'
+        """)
+
+        # Walked in priority order by receive_messages when a poll spans
+        # several channels plus direct messages, so LIMIT stops early
+        # instead of sorting every pending row
         cursor.execute("""
-            CREATE INDEX IF NOT EXISTS idx_ready_messages
-            ON messages(channel, status, priority DESC, timestamp)
+            CREATE INDEX IF NOT EXISTS idx_pending_queue
+            ON messages(priority DESC, timestamp)
             WHERE status = 'pending'
         """)
 
@@ -224,6 +353,44 @@ class CommunicationSystem:
             ON message_deliveries(agent_id, delivered_at)
         """)
 
+        # Votes: one row per vote, casts keyed so each agent votes once
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS votes (
+                vote_id BLOB PRIMARY KEY,
+                status TEXT NOT NULL DEFAULT 'open',
+                proposed_at TEXT NOT NULL,
+                metadata TEXT NOT NULL
+            )
+        """)
+
+        cursor.execute("""
+            CREATE INDEX IF NOT EXISTS idx_open_votes
+            ON votes(proposed_at)
+            WHERE status = 'open'
+        """)
+
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS vote_casts (
+                vote_id BLOB NOT NULL,
+                agent_id TEXT NOT NULL,
+                choice TEXT NOT NULL,
+                reasoning TEXT,
+                timestamp TEXT NOT NULL,
+                PRIMARY KEY (vote_id, agent_id),
+                FOREIGN KEY (vote_id) REFERENCES votes(vote_id) ON DELETE CASCADE
+            )
+        """)
+
+        # Eligible voters per vote, so cast_vote's check is a key lookup
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS vote_eligibility (
+                vote_id BLOB NOT NULL,
+                agent_id TEXT NOT NULL,
+                PRIMARY KEY (vote_id, agent_id),
+                FOREIGN KEY (vote_id) REFERENCES votes(vote_id) ON DELETE CASCADE
+            ) WITHOUT ROWID
+        """)
+
         # Dead letter queue
         cursor.execute("""
             CREATE TABLE IF NOT EXISTS dead_letter_queue (
@@ -252,9 +419,13 @@ class CommunicationSystem:
             )
         """)
 
+        # Covers get_open_tasks' full ORDER BY (priority DESC, created_at);
+        # replaces idx_open_tasks, whose constant status column left the
+        # created_at tiebreak to a sort
+        cursor.execute("DROP INDEX IF EXISTS idx_open_tasks")
         cursor.execute("""
-            CREATE INDEX IF NOT EXISTS idx_open_tasks
-            ON job_board(status, priority DESC)
+            CREATE INDEX IF NOT EXISTS idx_open_task_queue
+            ON job_board(priority DESC, created_at)
             WHERE status = 'open'
         """)
 
@@ -265,12 +436,11 @@ class CommunicationSystem:
         version_file.write_text("1.0")
 
         # Initialize default channels
-        default_channels = ["general", "urgent", "technical", "review"]
-        for channel in default_channels:
-            cursor.execute("""
-                INSERT OR IGNORE INTO channel_subscriptions (channel_name, agent_id, subscribed_at)
-                VALUES (?, 'system', ?)
-            """, (channel, datetime.utcnow().isoformat()))
+        subscribed_at = datetime.utcnow().isoformat()
+        cursor.executemany("""
+            INSERT OR IGNORE INTO channel_subscriptions (channel_name, agent_id, subscribed_at)
+            VALUES (?, 'system', ?)
+        """, [(channel, subscribed_at) for channel in DEFAULT_CHANNELS])
 
         conn.commit()
         conn.close()
@@ -280,7 +450,7 @@ class CommunicationSystem:
             "version": "1.0",
             "db_path": str(self.db_path),
             "artifacts_dir": str(self.artifacts_dir),
-            "default_channels": default_channels
+            "default_channels": list(DEFAULT_CHANNELS)
         }
 
     def send_message(
@@ -313,6 +483,50 @@ class CommunicationSystem:
         Raises:
             CommunicationError: If message cannot be sent
         """
+        row = self._build_message_row(
+            from_agent=from_agent,
+            message_type=message_type,
+            payload=payload,
+            to_agent=to_agent,
+            channel=channel,
+            priority=priority,
+            correlation_id=correlation_id,
+            ttl_seconds=ttl_seconds
+        )
+        self._insert_message_rows([row])
+
+        return row[0]
+
+    def send_messages_batch(self, messages: List[Dict[str, Any]]) -> List[str]:
+        """
+        Send several messages in a single transaction.
+
+        Args:
+            messages: List of send_message() keyword-argument dicts
+
+        Returns:
+            List of message IDs, in the same order as the input
+
+        Raises:
+            CommunicationError: If any message is invalid (nothing is sent)
+        """
+        rows = [self._build_message_row(**message) for message in messages]
+        self._insert_message_rows(rows)
+
+        return [row[0] for row in rows]
+
+    def _build_message_row(
+        self,
+        from_agent: str,
+        message_type: str,
+        payload: Dict[str, Any],
+        to_agent: Optional[str] = None,
+        channel: str = "general",
+        priority: int = 5,
+        correlation_id: Optional[str] = None,
+        ttl_seconds: Optional[int] = None
+    ) -> tuple:
+        """Validate a message and build its messages-table row."""
         if not 1 <= priority <= 10:
             raise CommunicationError(f"Priority must be 1-10, got {priority}")
 
@@ -326,43 +540,87 @@ class CommunicationSystem:
 
         # Serialize payload
         try:
-            payload_json = json.dumps(payload)
+            payload_json = _json_dumps(payload)
         except (TypeError, ValueError) as e:
             raise CommunicationError(f"Payload not JSON-serializable: {e}")
 
+        return (
+            message_id, message_type, timestamp, correlation_id,
+            from_agent, to_agent, channel, priority, payload_json,
+            datetime.utcnow().isoformat(), expires_at
+        )
+
+    def _insert_message_rows(self, rows: List[tuple]) -> None:
+        """Insert prebuilt message rows in one write transaction."""
         with self._transaction(immediate=True) as conn:
-            cursor = conn.cursor()
+            self._write_message_rows(conn, rows)
 
-            # Insert message
-            cursor.execute("""
-                INSERT INTO messages (
-                    id, type, version, timestamp, correlation_id,
-                    from_agent, to_agent, channel, priority, payload,
-                    status, created_at, expires_at
-                )
-                VALUES (?, ?, '1.0', ?, ?, ?, ?, ?, ?, ?, 'pending', ?, ?)
-            """, (
-                message_id, message_type, timestamp, correlation_id,
-                from_agent, to_agent, channel, priority, payload_json,
-                datetime.utcnow().isoformat(), expires_at
-            ))
-
-            # If direct message, update recipient's pending count
+        if self._correlation_waiters:
+            self._notify_waiters(row[3] for row in rows if row[3])
+
+    def _write_message_rows(self, conn: sqlite3.Connection, rows: List[tuple]) -> None:
+        """
+        Insert prebuilt message rows inside the caller's transaction.
+
+        Lets other subsystems (e.g. voting) commit their own rows and the
+        notification messages about them together.
+        """
+        # Direct messages bump their recipient's pending count
+        pending_counts: Dict[str, int] = {}
+        for row in rows:
+            to_agent = row[5]
             if to_agent:
-                cursor.execute("""
-                    UPDATE agent_status
-                    SET messages_pending = messages_pending + 1
-                    WHERE agent_id = ?
-                """, (to_agent,))
+                pending_counts[to_agent] = pending_counts.get(to_agent, 0) + 1
 
-        return message_id
+        conn.executemany("""
+            INSERT INTO messages (
+                id, type, version, timestamp, correlation_id,
+                from_agent, to_agent, channel, priority, payload,
+                status, created_at, expires_at
+            )
+            VALUES (?, ?, '1.0', ?, ?, ?, ?, ?, ?, ?, 'pending', ?, ?)
+        """, rows)
+
+        if pending_counts:
+            conn.executemany("""
+                UPDATE agent_status
+                SET messages_pending = messages_pending + ?
+                WHERE agent_id = ?
+            """, [(count, agent_id) for agent_id, count in pending_counts.items()])
+
+    def register_correlation_waiter(self, correlation_id: str) -> threading.Event:
+        """
+        Get an Event that is set when a message with correlation_id is sent.
+
+        Only sends made in this process can set it; waiters must still poll
+        (less often) for messages written by other processes. Call
+        unregister_correlation_waiter() when done.
+        """
+        key = (str(self.db_path), correlation_id)
+        with self._waiters_lock:
+            return self._correlation_waiters.setdefault(key, threading.Event())
+
+    def unregister_correlation_waiter(self, correlation_id: str) -> None:
+        """Drop the Event registered for correlation_id."""
+        with self._waiters_lock:
+            self._correlation_waiters.pop((str(self.db_path), correlation_id), None)
+
+    def _notify_waiters(self, correlation_ids) -> None:
+        """Wake waiters registered for any of the given correlation IDs."""
+        db_key = str(self.db_path)
+        with self._waiters_lock:
+            for correlation_id in correlation_ids:
+                event = self._correlation_waiters.get((db_key, correlation_id))
+                if event:
+                    event.set()
 
     def receive_messages(
         self,
         agent_id: str,
         channels: List[str],
         limit: int = 10,
-        message_type: Optional[str] = None
+        message_type: Optional[str] = None,
+        decode_payload: bool = True
     ) -> List[Dict[str, Any]]:
         """
         Receive messages for an agent.
@@ -374,60 +632,46 @@ class CommunicationSystem:
             channels: List of channels to check
             limit: Maximum messages to return
             message_type: Optional filter by message type
+            decode_payload: Parse payloads into dicts. Pass False to get the
+                stored JSON text as-is and decode later with load_payload()
+                (saves the parse for messages that are only scanned or forwarded)
 
         Returns:
-            List of message dictionaries with parsed payloads
+            List of message dictionaries with parsed (or raw) payloads
         """
         conn = self._get_connection()
         cursor = conn.cursor()
 
-        # Build query with proper broadcast handling
-        placeholders = ','.join('?' * len(channels))
-        type_filter = "AND m.type = ?" if message_type else ""
         type_params = [message_type] if message_type else []
-
-        query = f"""
-            SELECT m.* FROM messages m
-            WHERE m.status = 'pending'
-              AND (
-                  -- Direct messages to this agent
-                  (m.to_agent = ? AND m.channel IS NULL)
-                  OR
-                  -- Broadcast messages in subscribed channels not yet delivered
-                  (m.to_agent IS NULL
-                   AND m.channel IN ({placeholders})
-                   AND EXISTS (
-                       SELECT 1 FROM channel_subscriptions cs
-                       WHERE cs.channel_name = m.channel
-                         AND cs.agent_id = ?
-                   )
-                   AND NOT EXISTS (
-                       SELECT 1 FROM message_deliveries md
-                       WHERE md.message_id = m.id
-                         AND md.agent_id = ?
-                   ))
-              )
-              {type_filter}
-              AND (m.expires_at IS NULL OR datetime(m.expires_at) > datetime('now'))
-            ORDER BY m.priority DESC, m.timestamp ASC
-            LIMIT ?
-        """
+        query = _receive_query(len(channels), bool(message_type))
 
         params = [agent_id] + channels + [agent_id, agent_id] + type_params + [limit]
         cursor.execute(query, params)
 
-        messages = []
-        for row in cursor.fetchall():
-            msg = dict(row)
-            # Parse payload JSON
-            try:
-                msg['payload'] = json.loads(msg['payload'])
-            except json.JSONDecodeError:
-                msg['payload'] = {"error": "Invalid JSON payload"}
-            messages.append(msg)
+        messages = [dict(row) for row in cursor.fetchall()]
+
+        if decode_payload:
+            for msg in messages:
+                msg['payload'] = self.load_payload(msg['payload'])
 
         return messages
 
+    @staticmethod
+    def load_payload(raw_payload: str) -> Dict[str, Any]:
+        """
+        Decode a stored payload.
+
+        Args:
+            raw_payload: Payload JSON text as stored in the messages table
+
+        Returns:
+            Parsed payload, or an error dict if the JSON is invalid
+        """
+        try:
+            return _json_loads(raw_payload)
+        except json.JSONDecodeError:
+            return {"error": "Invalid JSON payload"}
+
     def claim_message(self, agent_id: str, message_id: str) -> bool:
         """
         Atomically claim a message for processing.
@@ -446,54 +690,7 @@ class CommunicationSystem:
             MessageNotFoundError: If message doesn't exist
         """
         with self._transaction(immediate=True) as conn:
-            cursor = conn.cursor()
-
-            # Check if message exists and get its type
-            cursor.execute("""
-                SELECT to_agent, status FROM messages WHERE id = ?
-            """, (message_id,))
-
-            row = cursor.fetchone()
-            if not row:
-                raise MessageNotFoundError(f"Message {message_id} not found")
-
-            to_agent = row[0]
-            status = row[1]
-
-            if to_agent is None:
-                # Broadcast message - record delivery to this agent
-                try:
-                    cursor.execute("""
-                        INSERT INTO message_deliveries (message_id, agent_id, delivered_at)
-                        VALUES (?, ?, datetime('now'))
-                    """, (message_id, agent_id))
-                    return True
-                except sqlite3.IntegrityError:
-                    # Already delivered to this agent
-                    return False
-
-            else:
-                # Direct message - atomic UPDATE
-                cursor.execute("""
-                    UPDATE messages
-                    SET status = 'processing',
-                        last_delivered_at = datetime('now'),
-                        delivery_count = delivery_count + 1
-                    WHERE id = ?
-                      AND status = 'pending'
-                """, (message_id,))
-
-                if cursor.rowcount == 1:
-                    # Update agent's pending count
-                    cursor.execute("""
-                        UPDATE agent_status
-                        SET messages_pending = messages_pending - 1
-                        WHERE agent_id = ?
-                    """, (agent_id,))
-                    return True
-                else:
-                    # Already claimed
-                    return False
+            return self._claim(conn.cursor(), agent_id, message_id)
 
     def complete_message(
         self,
@@ -507,63 +704,208 @@ class CommunicationSystem:
             message_id: Message ID to complete
             error: Optional error message if processing failed
         """
-        conn = self._get_connection()
-        cursor = conn.cursor()
+        with self._transaction(immediate=True) as conn:
+            self._complete(conn.cursor(), message_id, error)
 
-        new_status = 'failed' if error else 'done'
+    def process_message(
+        self,
+        agent_id: str,
+        message_id: str,
+        error: Optional[str] = None
+    ) -> bool:
+        """
+        Claim and complete a message in one transaction.
+
+        For handlers whose work is already done (acks, counters, reading a
+        response), this replaces claim_message() + complete_message() with a
+        single write and no window between the two. Long-running work should
+        still claim first and complete when finished.
 
+        Args:
+            agent_id: Agent processing the message
+            message_id: Message ID to process
+            error: Optional error message if processing failed
+
+        Returns:
+            True if processed, False if already claimed
+
+        Raises:
+            MessageNotFoundError: If message doesn't exist
+        """
         with self._transaction(immediate=True) as conn:
             cursor = conn.cursor()
 
-            # Get current message info
-            cursor.execute("""
-                SELECT delivery_count, from_agent, to_agent, type, payload
-                FROM messages WHERE id = ?
-            """, (message_id,))
+            if not self._claim(cursor, agent_id, message_id):
+                return False
+
+            self._complete(cursor, message_id, error)
+            return True
+
+    def claim_next(
+        self,
+        agent_id: str,
+        channels: List[str],
+        message_type: Optional[str] = None,
+        decode_payload: bool = True
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Receive and claim the next message for an agent in one call.
+
+        Picks the highest-priority message receive_messages() would return
+        and claims it inside the same write transaction, so no other agent
+        can take it in between. Use receive_messages() for read-only scans.
+
+        Args:
+            agent_id: Agent claiming the message
+            channels: List of channels to check
+            message_type: Optional filter by message type
+            decode_payload: Parse the payload into a dict
+
+        Returns:
+            The claimed message, or None if nothing is pending
+        """
+        type_params = [message_type] if message_type else []
+        query = _receive_query(len(channels), bool(message_type))
+        params = [agent_id] + channels + [agent_id, agent_id] + type_params + [1]
+
+        with self._transaction(immediate=True) as conn:
+            cursor = conn.cursor()
+            cursor.execute(query, params)
 
             row = cursor.fetchone()
             if not row:
-                raise MessageNotFoundError(f"Message {message_id} not found")
+                return None
 
-            delivery_count = row[0]
+            message = dict(row)
+            claimed = self._claim_row(cursor, agent_id, message['id'], message['to_agent'])
+            if claimed is None:
+                return None
 
-            # Update status
-            cursor.execute("""
-                UPDATE messages
-                SET status = ?,
-                    error = ?
-                WHERE id = ?
-            """, (new_status, error, message_id))
-
-            # If failed 3 times, move to DLQ
-            if error and delivery_count >= 3:
-                original_message = {
-                    'id': message_id,
-                    'from_agent': row[1],
-                    'to_agent': row[2],
-                    'type': row[3],
-                    'payload': row[4]
-                }
+        message.update(claimed)
+        if decode_payload:
+            message['payload'] = self.load_payload(message['payload'])
+        return message
+
+    def _claim(self, cursor: sqlite3.Cursor, agent_id: str, message_id: str) -> bool:
+        """Claim a message inside the caller's transaction."""
+        # Check if message exists and get its type
+        cursor.execute("""
+            SELECT to_agent, status FROM messages WHERE id = ?
+        """, (message_id,))
 
+        row = cursor.fetchone()
+        if not row:
+            raise MessageNotFoundError(f"Message {message_id} not found")
+
+        return self._claim_row(cursor, agent_id, message_id, row[0]) is not None
+
+    def _claim_row(
+        self,
+        cursor: sqlite3.Cursor,
+        agent_id: str,
+        message_id: str,
+        to_agent: Optional[str]
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Claim a known message inside the caller's transaction.
+
+        Returns the columns the claim changed ({} for a broadcast delivery),
+        or None if the message was already claimed.
+        """
+        if to_agent is None:
+            # Broadcast message - record delivery to this agent
+            try:
                 cursor.execute("""
-                    INSERT INTO dead_letter_queue (id, original_message, error, moved_at, retry_count)
-                    VALUES (?, ?, ?, datetime('now'), ?)
-                """, (str(uuid.uuid4()), json.dumps(original_message), error, delivery_count))
+                    INSERT INTO message_deliveries (message_id, agent_id, delivered_at)
+                    VALUES (?, ?, datetime('now'))
+                """, (message_id, agent_id))
+                return {}
+            except sqlite3.IntegrityError:
+                # Already delivered to this agent
+                return None
+
+        # Direct message - atomic UPDATE
+        cursor.execute("""
+            UPDATE messages
+            SET status = 'processing',
+                last_delivered_at = datetime('now'),
+                delivery_count = delivery_count + 1
+            WHERE id = ?
+              AND status = 'pending'
+            RETURNING status, last_delivered_at, delivery_count
+        """, (message_id,))
+
+        row = cursor.fetchone()
+        if row is None:
+            # Already claimed
+            return None
+
+        # Update agent's pending count
+        cursor.execute("""
+            UPDATE agent_status
+            SET messages_pending = messages_pending - 1
+            WHERE agent_id = ?
+        """, (agent_id,))
+        return dict(row)
+
+    def _complete(
+        self,
+        cursor: sqlite3.Cursor,
+        message_id: str,
+        error: Optional[str]
+    ) -> None:
+        """Complete a message inside the caller's transaction."""
+        new_status = 'failed' if error else 'done'
+
+        # Get current message info
+        cursor.execute("""
+            SELECT delivery_count, from_agent, to_agent, type, payload
+            FROM messages WHERE id = ?
+        """, (message_id,))
+
+        row = cursor.fetchone()
+        if not row:
+            raise MessageNotFoundError(f"Message {message_id} not found")
+
+        delivery_count = row[0]
 
-                # Delete from messages table
-                cursor.execute("DELETE FROM messages WHERE id = ?", (message_id,))
+        # Update status
+        cursor.execute("""
+            UPDATE messages
+            SET status = ?,
+                error = ?
+            WHERE id = ?
+        """, (new_status, error, message_id))
+
+        # If failed 3 times, move to DLQ
+        if error and delivery_count >= 3:
+            original_message = {
+                'id': message_id,
+                'from_agent': row[1],
+                'to_agent': row[2],
+                'type': row[3],
+                'payload': row[4]
+            }
 
-            # Update agent stats
             cursor.execute("""
-                UPDATE agent_status
-                SET messages_processed = messages_processed + 1,
-                    error_count = error_count + ?
-                WHERE agent_id IN (
-                    SELECT from_agent FROM messages WHERE id = ?
-                    UNION
-                    SELECT to_agent FROM messages WHERE id = ? AND to_agent IS NOT NULL
-                )
-            """, (1 if error else 0, message_id, message_id))
+                INSERT INTO dead_letter_queue (id, original_message, error, moved_at, retry_count)
+                VALUES (?, ?, ?, datetime('now'), ?)
+            """, (str(uuid.uuid4()), _json_dumps(original_message), error, delivery_count))
+
+            # Delete from messages table
+            cursor.execute("DELETE FROM messages WHERE id = ?", (message_id,))
+
+        # Update agent stats
+        cursor.execute("""
+            UPDATE agent_status
+            SET messages_processed = messages_processed + 1,
+                error_count = error_count + ?
+            WHERE agent_id IN (
+                SELECT from_agent FROM messages WHERE id = ?
+                UNION
+                SELECT to_agent FROM messages WHERE id = ? AND to_agent IS NOT NULL
+            )
+        """, (1 if error else 0, message_id, message_id))
 
     def send_response(
         self,
@@ -617,6 +959,8 @@ class CommunicationSystem:
                 VALUES (?, ?, datetime('now'))
             """, (channel_name, agent_id))
 
+        self._subscriber_counts.pop(channel_name, None)
+
     def unsubscribe_from_channel(self, agent_id: str, channel_name: str) -> None:
         """Unsubscribe an agent from a channel."""
         conn = self._get_connection()
@@ -627,6 +971,8 @@ class CommunicationSystem:
                 WHERE channel_name = ? AND agent_id = ?
             """, (channel_name, agent_id))
 
+        self._subscriber_counts.pop(channel_name, None)
+
     def get_subscribed_channels(self, agent_id: str) -> List[str]:
         """Get list of channels an agent is subscribed to."""
         conn = self._get_connection()
@@ -640,21 +986,88 @@ class CommunicationSystem:
 
         return [row[0] for row in cursor.fetchall()]
 
+    def get_subscriber_count(self, channel_name: str) -> int:
+        """
+        Get number of agents subscribed to a channel.
+
+        Counts are cached for SUBSCRIBER_COUNT_TTL seconds; subscribe and
+        unsubscribe calls made through this instance invalidate immediately.
+        """
+        now = time.monotonic()
+        cached = self._subscriber_counts.get(channel_name)
+        if cached and now < cached[1]:
+            return cached[0]
+
+        cursor = self._get_connection().cursor()
+        cursor.execute("""
+            SELECT COUNT(*) FROM channel_subscriptions
+            WHERE channel_name = ?
+        """, (channel_name,))
+        count = cursor.fetchone()[0]
+
+        self._subscriber_counts[channel_name] = (count, now + self.SUBSCRIBER_COUNT_TTL)
+        return count
+
+    def get_broadcast_status(self, message_id: str) -> Dict[str, Any]:
+        """
+        Get delivery progress of a broadcast message.
+
+        Returns:
+            Dict with channel, subscriber count and number of agents that
+            have claimed the message
+
+        Raises:
+            MessageNotFoundError: If message doesn't exist
+            CommunicationError: If message is a direct message
+        """
+        cursor = self._get_connection().cursor()
+
+        cursor.execute("""
+            SELECT channel, to_agent, status FROM messages WHERE id = ?
+        """, (message_id,))
+
+        row = cursor.fetchone()
+        if not row:
+            raise MessageNotFoundError(f"Message {message_id} not found")
+        if row[1] is not None:
+            raise CommunicationError(f"Message {message_id} is not a broadcast")
+
+        cursor.execute("""
+            SELECT COUNT(*) FROM message_deliveries WHERE message_id = ?
+        """, (message_id,))
+
+        return {
+            "message_id": message_id,
+            "channel": row[0],
+            "status": row[2],
+            "subscribers": self.get_subscriber_count(row[0]),
+            "delivered": cursor.fetchone()[0]
+        }
+
     def send_heartbeat(
         self,
         agent_id: str,
         status: str = "active",
         current_task: Optional[str] = None
-    ) -> None:
+    ) -> bool:
         """
         Update agent's heartbeat status.
 
+        Repeated heartbeats with the same status and task within
+        HEARTBEAT_DEBOUNCE seconds are coalesced into the last write.
+
         Args:
             agent_id: Agent ID
             status: Status string (active, idle, degraded, failed)
             current_task: Optional description of current work
+
+        Returns:
+            True if written, False if coalesced
         """
-        conn = self._get_connection()
+        now = time.monotonic()
+        last = self._last_heartbeats.get(agent_id)
+        if last and last[:2] == (status, current_task) and now - last[2] < self.HEARTBEAT_DEBOUNCE:
+            return False
 
         with self._transaction(immediate=True) as conn:
             conn.execute("""
@@ -666,8 +1079,48 @@ class CommunicationSystem:
                     last_heartbeat = excluded.last_heartbeat
             """, (agent_id, status, current_task))
 
+        self._last_heartbeats[agent_id] = (status, current_task, now)
+        self._health_cache.pop(agent_id, None)
+        if self._agents_cache and agent_id not in self._agents_cache[0]:
+            self._agents_cache = None  # First heartbeat registers the agent
+        return True
+
+    def list_agents(self) -> tuple:
+        """
+        Get the IDs of all registered agents.
+
+        The registry is cached for AGENT_REGISTRY_TTL seconds. Agents
+        registered by a heartbeat through this instance invalidate
+        immediately; ones registered by other processes may take up to
+        AGENT_REGISTRY_TTL to appear.
+
+        Returns:
+            Tuple of agent IDs
+        """
+        now = time.monotonic()
+        if self._agents_cache and now < self._agents_cache[1]:
+            return self._agents_cache[0]
+
+        cursor = self._get_connection().cursor()
+        cursor.execute("SELECT agent_id FROM agent_status")
+        agents = tuple(row[0] for row in cursor.fetchall())
+
+        self._agents_cache = (agents, now + self.AGENT_REGISTRY_TTL)
+        return agents
+
     def get_agent_health(self, agent_id: str) -> Optional[Dict[str, Any]]:
-        """Get agent's health status."""
+        """
+        Get agent's health status.
+
+        Results are cached for HEALTH_TTL seconds. Heartbeats sent through
+        this instance invalidate immediately; changes made by other
+        processes (or message counters) may be up to HEALTH_TTL stale.
+        """
+        now = time.monotonic()
+        cached = self._health_cache.get(agent_id)
+        if cached and now < cached[1]:
+            return dict(cached[0]) if cached[0] else None
+
         conn = self._get_connection()
         cursor = conn.cursor()
 
@@ -676,26 +1129,54 @@ class CommunicationSystem:
         """, (agent_id,))
 
         row = cursor.fetchone()
-        return dict(row) if row else None
+        health = dict(row) if row else None
+
+        self._health_cache[agent_id] = (health, now + self.HEALTH_TTL)
+        return dict(health) if health else None
 
     def cleanup_expired_messages(self) -> int:
         """
         Remove expired messages.
 
+        Deletes in batches of CLEANUP_BATCH_SIZE, each in its own short
+        transaction, so a large backlog never holds the write lock for long.
+        Freed pages are then released with an incremental vacuum.
+
         Returns:
             Number of messages deleted
         """
-        with self._transaction(immediate=True) as conn:
-            cursor = conn.cursor()
+        total = 0
 
-            cursor.execute("""
-                DELETE FROM messages
-                WHERE expires_at IS NOT NULL
-                  AND datetime(expires_at) <= datetime('now')
-            """)
+        while True:
+            with self._transaction(immediate=True) as conn:
+                cursor = conn.cursor()
 
-            count = cursor.rowcount
-            return count
+                cursor.execute("""
+                    DELETE FROM messages
+                    WHERE id IN (
+                        SELECT id FROM messages
+                        WHERE expires_at IS NOT NULL
+                          AND datetime(expires_at) <= datetime('now')
+                        LIMIT ?
+                    )
+                """, (self.CLEANUP_BATCH_SIZE,))
+
+                count = cursor.rowcount
+
+            total += count
+            if count < self.CLEANUP_BATCH_SIZE:
+                break
+            time.sleep(self.CLEANUP_BATCH_PAUSE)
+
+        if total:
+            # No-op on databases created before auto_vacuum was enabled.
+            # executescript steps the pragma to completion; execute() would
+            # free a single page
+            self._get_connection().executescript(
+                f"PRAGMA incremental_vacuum({self.INCREMENTAL_VACUUM_PAGES})"
+            )
+
+        return total
 
     # Job board methods (FIXED: Now transactional with messages)
 
@@ -710,7 +1191,7 @@ class CommunicationSystem:
         """Create a new task on the job board."""
         conn = self._get_connection()
 
-        deps_json = json.dumps(dependencies) if dependencies else None
+        deps_json = _json_dumps(dependencies) if dependencies else None
 
         with self._transaction(immediate=True) as conn:
             conn.execute("""
@@ -778,7 +1259,200 @@ class CommunicationSystem:
         for row in cursor.fetchall():
             task = dict(row)
             if task['dependencies']:
-                task['dependencies'] = json.loads(task['dependencies'])
+                task['dependencies'] = _json_loads(task['dependencies'])
             tasks.append(task)
 
         return tasks
+
+
+logger = logging.getLogger(__name__)
+
+# Outboxes not yet closed; each is flushed at interpreter exit so queued
+# messages are not silently dropped
+_open_outboxes: "weakref.WeakSet[Outbox]" = weakref.WeakSet()
+
+
+@atexit.register
+def _close_outboxes() -> None:
+    """Flush and stop every outbox still open at interpreter exit."""
+    for outbox in list(_open_outboxes):
+        outbox.close()
+
+
+class Outbox:
+    """
+    In-process buffer that batches outgoing messages.
+
+    send() validates the message and returns its ID immediately; queued
+    messages are written with one transaction per batch, either when
+    max_batch messages are waiting or max_delay seconds after the first
+    one was queued, from a background thread. Messages are not visible to
+    receivers until flushed, and are lost if the process dies first (a
+    normal interpreter exit still flushes them) - send directly via
+    CommunicationSystem when that matters.
+    """
+
+    # Seconds the background thread waits after an unexpected flush error
+    RETRY_PAUSE = 1.0
+
+    def __init__(
+        self,
+        comm: CommunicationSystem,
+        max_batch: int = 256,
+        max_delay: float = 0.005,
+        max_pending: int = 4096
+    ):
+        """
+        Initialize outbox.
+
+        Args:
+            comm: Communication system to flush into
+            max_batch: Flush synchronously once this many messages are queued
+            max_delay: Seconds a queued message may wait for a background flush
+            max_pending: Senders block on a flush while this many are queued
+        """
+        self.comm = comm
+        self.max_batch = max_batch
+        self.max_delay = max_delay
+        self.max_pending = max_pending
+
+        # (message_id, error) for messages that could not be written
+        self.errors: List[tuple] = []
+
+        self._pending: deque = deque()
+        self._lock = threading.Lock()
+        # Signalled when the queue stops being empty, and on close()
+        self._wakeup = threading.Condition(self._lock)
+        self._flush_lock = threading.Lock()
+        self._closed = False
+        self._thread: Optional[threading.Thread] = None
+
+        _open_outboxes.add(self)
+
+    def send(self, **message: Any) -> str:
+        """
+        Queue a message.
+
+        Args:
+            **message: send_message() keyword arguments
+
+        Returns:
+            message_id the message will be stored under
+
+        Raises:
+            CommunicationError: If the message is invalid or the outbox is closed
+        """
+        row = self.comm._build_message_row(**message)
+
+        # Backpressure: a producer outrunning the writes waits for one
+        while len(self._pending) >= self.max_pending:
+            self.flush()
+
+        with self._lock:
+            if self._closed:
+                raise CommunicationError("Outbox is closed; send directly via CommunicationSystem")
+
+            self._pending.append(row)
+            full = len(self._pending) >= self.max_batch
+            if len(self._pending) == 1:
+                self._wakeup.notify()
+
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._flush_loop, daemon=True)
+                self._thread.start()
+
+        if full:
+            self.flush()
+
+        return row[0]
+
+    def flush(self) -> int:
+        """
+        Write all queued messages.
+
+        Messages that cannot be written for a transient reason (database
+        locked or busy past the timeout) stay queued, ahead of newer ones,
+        for the next flush. Only rows rejected on their own content end up
+        in errors.
+
+        Returns:
+            Number of messages written
+        """
+        with self._flush_lock:
+            with self._lock:
+                rows = list(self._pending)
+                self._pending.clear()
+
+            if not rows:
+                return 0
+
+            try:
+                self.comm._insert_message_rows(rows)
+                return len(rows)
+            except sqlite3.OperationalError:
+                self._requeue(rows)
+                return 0
+            except sqlite3.Error:
+                # One bad row fails the whole batch - retry individually
+                written = 0
+                for i, row in enumerate(rows):
+                    try:
+                        self.comm._insert_message_rows([row])
+                        written += 1
+                    except sqlite3.OperationalError:
+                        self._requeue(rows[i:])
+                        break
+                    except sqlite3.Error as e:
+                        self.errors.append((row[0], str(e)))
+                return written
+            except Exception:
+                self._requeue(rows)
+                raise
+
+    def close(self) -> None:
+        """
+        Flush remaining messages and stop the background thread.
+
+        Messages still unwritable after the final flush are moved to errors.
+        """
+        with self._lock:
+            self._closed = True
+            self._wakeup.notify_all()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+        try:
+            self.flush()
+        finally:
+            with self._lock:
+                unwritten = list(self._pending)
+                self._pending.clear()
+            self.errors.extend((row[0], "Outbox closed before the message could be written")
+                               for row in unwritten)
+            _open_outboxes.discard(self)
+
+    def _requeue(self, rows: List[tuple]) -> None:
+        """Put rows back at the front of the queue, in their original order."""
+        with self._lock:
+            self._pending.extendleft(reversed(rows))
+
+    def _flush_loop(self) -> None:
+        """Background thread: sleep until a message is queued, give the batch
+        max_delay to fill, then flush it."""
+        while True:
+            with self._lock:
+                while not self._pending and not self._closed:
+                    self._wakeup.wait()
+                if not self._closed:
+                    self._wakeup.wait(self.max_delay)
+                if self._closed:
+                    return  # close() does the final flush
+            try:
+                self.flush()
+            except Exception:
+                # Keep the thread alive: queued messages stay for the next
+                # flush, tried after a pause rather than every max_delay
+                logger.exception("Outbox background flush failed")
+                with self._lock:
+                    if not self._closed:
+                        self._wakeup.wait(self.RETRY_PAUSE)
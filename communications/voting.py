@@ -12,21 +12,73 @@ Based on: resources/voting-protocols.md
 """
 
 import json
+import re
 import uuid
-from datetime import datetime, timedelta
+from collections import Counter
+from datetime import datetime, timedelta, timezone
 from pathlib import Path
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, NamedTuple, Optional, Any
 
-from .core import CommunicationSystem
+from .core import CommunicationSystem, CommunicationError, _json_dumps, _json_loads
+
+# Agent IDs containing any of these words get double weight in weighted votes
+_SPECIALIST_RE = re.compile(r"specialist|expert|senior")
+
+# Queries run from several methods share one text, and so one cached
+# prepared statement per connection
+_SQL_SELECT_VOTE = "SELECT vote_id, status, proposed_at, metadata FROM votes WHERE vote_id = ?"
+
+
+def _ok(**fields: Any) -> Dict[str, Any]:
+    """Build a success result dict."""
+    return {"success": True, **fields}
+
+
+def _error(message: str) -> Dict[str, Any]:
+    """Build an error result dict."""
+    return {"error": message}
+
+
+def _vote_key(vote_id: str) -> Optional[bytes]:
+    """Convert a public "vote-<hex>" ID to its BLOB key (None if malformed)."""
+    if not vote_id.startswith("vote-"):
+        return None
+    try:
+        return bytes.fromhex(vote_id[5:])
+    except ValueError:
+        return None
+
+
+def _vote_id(key: bytes) -> str:
+    """Convert a BLOB key back to its public "vote-<hex>" ID."""
+    return f"vote-{key.hex()}"
+
+
+def _utcnow() -> datetime:
+    """Current time as an aware UTC datetime (whole seconds)."""
+    return datetime.now(timezone.utc).replace(microsecond=0)
+
+
+class VoteCounts(NamedTuple):
+    """Summary of a vote without its voter and ballot collections."""
+    vote_id: str
+    topic: str
+    status: str
+    deadline: str
+    votes_cast: int
+    eligible_voters: int
 
 
 class VotingSystem:
     """
     Voting system for multi-agent consensus and decision-making.
 
-    Uses CommunicationSystem for vote broadcasting and collection.
+    Uses CommunicationSystem for vote broadcasting and collection; votes
+    and cast ballots are stored in its database (votes, vote_casts).
     """
 
+    MECHANISMS = ("simple_majority", "weighted", "consensus")
+
     def __init__(self, project_root: str = "."):
         """
         Initialize voting system.
@@ -35,11 +87,13 @@ class VotingSystem:
             project_root: Path to project root (contains .claude/)
         """
         self.project_root = Path(project_root).resolve()
-        self.votes_dir = self.project_root / ".claude" / "votes"
-        self.votes_dir.mkdir(parents=True, exist_ok=True)
-
         self.comm = CommunicationSystem(project_root)
 
+        # Pre-SQLite votes lived in one JSON file each
+        self.votes_dir = self.project_root / ".claude" / "votes"
+        if self.votes_dir.is_dir():
+            self._import_json_votes()
+
     def initiate_vote(
         self,
         proposer_agent: str,
@@ -65,6 +119,10 @@ class VotingSystem:
         Returns:
             vote_id: Unique vote identifier
 
+        Raises:
+            CommunicationError: If mechanism is unknown or fewer than two
+                distinct options are given (checked before anything is written)
+
         Example:
             vote_id = voting.initiate_vote(
                 proposer_agent="frontend-dev-01",
@@ -74,12 +132,22 @@ class VotingSystem:
                 timeout_hours=24
             )
         """
-        vote_id = f"vote-{uuid.uuid4().hex[:8]}"
+        # Reject bad votes up front; tally_vote could never close them
+        if mechanism not in self.MECHANISMS:
+            raise CommunicationError(
+                f"Unknown mechanism: {mechanism}. Must be one of: {list(self.MECHANISMS)}"
+            )
+
+        if len(set(options)) < 2:
+            raise CommunicationError(f"Need at least two distinct options, got {options}")
+
+        vote_id = _vote_id(uuid.uuid4().bytes)
 
         # Get all registered agents if no specific voters provided
         if not eligible_voters:
             eligible_voters = self._get_all_agents()
 
+        now = _utcnow()
         vote_data = {
             "vote_id": vote_id,
             "topic": topic,
@@ -87,18 +155,13 @@ class VotingSystem:
             "options": options,
             "mechanism": mechanism,
             "proposed_by": proposer_agent,
-            "proposed_at": datetime.utcnow().isoformat() + "Z",
-            "deadline": (datetime.utcnow() + timedelta(hours=timeout_hours)).isoformat() + "Z",
+            "proposed_at": now.isoformat(),
+            "deadline": (now + timedelta(hours=timeout_hours)).isoformat(),
             "eligible_voters": eligible_voters,
             "votes_cast": {},
             "status": "open"
         }
 
-        # Save vote record
-        vote_file = self.votes_dir / f"{vote_id}.json"
-        with open(vote_file, 'w') as f:
-            json.dump(vote_data, f, indent=2)
-
         # Broadcast to eligible voters
         vote_message = {
             "vote_id": vote_id,
@@ -110,13 +173,15 @@ class VotingSystem:
             "instructions": "Cast your vote using messenger.send('voting-system', 'vote.cast', {...})"
         }
 
-        self.comm.send_message(
-            from_agent="voting-system",
-            message_type="vote.initiate",
-            payload=vote_message,
-            channel="general",
-            priority=9  # Urgent
-        )
+        # Save vote record and announce it in one commit
+        with self.comm._transaction(immediate=True) as conn:
+            self._insert_vote(conn, vote_data)
+            self._notify(
+                conn,
+                message_type="vote.initiate",
+                payload=vote_message,
+                priority=9  # Urgent
+            )
 
         return vote_id
 
@@ -147,55 +212,62 @@ class VotingSystem:
                 reasoning="Type safety reduces bugs significantly"
             )
         """
-        vote_file = self.votes_dir / f"{vote_id}.json"
-
-        if not vote_file.exists():
-            return {"error": "Vote not found"}
-
-        # Load vote data
-        with open(vote_file, 'r') as f:
-            vote_data = json.load(f)
-
-        # Validate
-        if agent_id not in vote_data["eligible_voters"]:
-            return {"error": "Not eligible to vote"}
-
-        if vote_data["status"] != "open":
-            return {"error": f"Vote is {vote_data['status']}"}
-
-        if choice not in vote_data["options"]:
-            return {"error": f"Invalid choice. Must be one of: {vote_data['options']}"}
-
-        # Check if already voted
-        if agent_id in vote_data["votes_cast"]:
-            return {"error": "Already voted. Cannot change vote."}
-
-        # Record vote
-        vote_data["votes_cast"][agent_id] = {
-            "choice": choice,
-            "reasoning": reasoning,
-            "timestamp": datetime.utcnow().isoformat() + "Z"
-        }
-
-        # Save updated vote
-        with open(vote_file, 'w') as f:
-            json.dump(vote_data, f, indent=2)
-
-        # Notify via communication system
-        self.comm.send_message(
-            from_agent="voting-system",
-            message_type="vote.recorded",
-            payload={
-                "vote_id": vote_id,
-                "voter": agent_id,
-                "votes_received": len(vote_data["votes_cast"]),
-                "votes_needed": len(vote_data["eligible_voters"])
-            },
-            channel="general",
-            priority=5
-        )
+        key = _vote_key(vote_id)
+        if key is None:
+            return _error("Vote not found")
+
+        with self.comm._transaction(immediate=True) as conn:
+            # Validate and record in one statement: the ballot is inserted
+            # only if the vote is open, the agent eligible and the choice
+            # valid; the primary key rejects a second ballot
+            cursor = conn.execute("""
+                INSERT INTO vote_casts (vote_id, agent_id, choice, reasoning, timestamp)
+                SELECT :vote_id, :agent_id, :choice, :reasoning, :timestamp
+                WHERE EXISTS (
+                    SELECT 1 FROM votes v
+                    WHERE v.vote_id = :vote_id
+                      AND v.status = 'open'
+                      AND EXISTS (
+                          SELECT 1 FROM vote_eligibility e
+                          WHERE e.vote_id = :vote_id AND e.agent_id = :agent_id
+                      )
+                      AND :choice IN (
+                          SELECT value FROM json_each(v.metadata, '$.options')
+                      )
+                )
+                ON CONFLICT (vote_id, agent_id) DO NOTHING
+            """, {
+                "vote_id": key,
+                "agent_id": agent_id,
+                "choice": choice,
+                "reasoning": reasoning,
+                "timestamp": _utcnow().isoformat()
+            })
+
+            if cursor.rowcount == 0:
+                return _error(self._cast_rejection(conn, key, agent_id, choice))
+
+            votes_cast, votes_needed = conn.execute("""
+                SELECT
+                    (SELECT COUNT(*) FROM vote_casts WHERE vote_id = :vote_id),
+                    json_array_length(metadata, '$.eligible_voters')
+                FROM votes WHERE vote_id = :vote_id
+            """, {"vote_id": key}).fetchone()
+
+            # Notify via communication system
+            self._notify(
+                conn,
+                message_type="vote.recorded",
+                payload={
+                    "vote_id": vote_id,
+                    "voter": agent_id,
+                    "votes_received": votes_cast,
+                    "votes_needed": votes_needed
+                },
+                priority=5
+            )
 
-        return {"success": True, "votes_cast": len(vote_data["votes_cast"])}
+        return _ok(votes_cast=votes_cast)
 
     def tally_vote(self, vote_id: str, force: bool = False) -> Dict[str, Any]:
         """
@@ -213,19 +285,18 @@ class VotingSystem:
             print(f"Winner: {result['outcome']}")
             print(f"Tally: {result['tally']}")
         """
-        vote_file = self.votes_dir / f"{vote_id}.json"
-
-        if not vote_file.exists():
-            return {"error": "Vote not found"}
+        vote_data = self.get_vote_status(vote_id)
 
-        # Load vote data
-        with open(vote_file, 'r') as f:
-            vote_data = json.load(f)
+        if vote_data is None:
+            return _error("Vote not found")
 
         # Check if can tally
+        now = _utcnow()
+        # Votes imported from the JSON files keep their 'Z' deadlines, which
+        # fromisoformat only accepts from Python 3.11 on
         deadline = datetime.fromisoformat(vote_data["deadline"].replace('Z', '+00:00'))
-        if not force and datetime.utcnow() < deadline.replace(tzinfo=None):
-            return {"error": "Vote still open. Use force=True to tally early."}
+        if not force and now < deadline:
+            return _error("Vote still open. Use force=True to tally early.")
 
         # Tally based on mechanism
         mechanism = vote_data["mechanism"]
@@ -238,66 +309,248 @@ class VotingSystem:
         elif mechanism == "consensus":
             result = self._tally_consensus(votes_cast, vote_data)
         else:
-            return {"error": f"Unknown mechanism: {mechanism}"}
+            return _error(f"Unknown mechanism: {mechanism}")
 
         # Update vote record
         vote_data["status"] = "closed"
         vote_data["result"] = result
-        vote_data["closed_at"] = datetime.utcnow().isoformat() + "Z"
-
-        with open(vote_file, 'w') as f:
-            json.dump(vote_data, f, indent=2)
-
-        # Broadcast result
-        self.comm.send_message(
-            from_agent="voting-system",
-            message_type="vote.result",
-            payload={
-                "vote_id": vote_id,
-                "topic": vote_data["topic"],
-                "outcome": result["outcome"],
-                "tally": result["tally"],
-                "total_votes": result["total_votes"]
-            },
-            channel="general",
-            priority=8
-        )
+        vote_data["closed_at"] = now.isoformat()
+
+        with self.comm._transaction(immediate=True) as conn:
+            conn.execute("""
+                UPDATE votes SET status = ?, metadata = ? WHERE vote_id = ?
+            """, (vote_data["status"], self._dump_metadata(vote_data), _vote_key(vote_id)))
+
+            # Broadcast result
+            self._notify(
+                conn,
+                message_type="vote.result",
+                payload={
+                    "vote_id": vote_id,
+                    "topic": vote_data["topic"],
+                    "outcome": result["outcome"],
+                    "tally": result["tally"],
+                    "total_votes": result["total_votes"]
+                },
+                priority=8
+            )
 
         return result
 
     def get_vote_status(self, vote_id: str) -> Optional[Dict[str, Any]]:
         """Get current status of a vote."""
-        vote_file = self.votes_dir / f"{vote_id}.json"
+        key = _vote_key(vote_id)
+        if key is None:
+            return None
+
+        conn = self.comm._get_connection()
 
-        if not vote_file.exists():
+        row = conn.execute(_SQL_SELECT_VOTE, (key,)).fetchone()
+
+        if not row:
             return None
 
-        with open(vote_file) as f:
-            return json.load(f)
+        vote_data = self._vote_from_row(row)
+        vote_data["votes_cast"] = self._load_casts(conn, key)
+        return vote_data
+
+    def get_vote_counts(self, vote_id: str) -> Optional[VoteCounts]:
+        """
+        Get a vote's status and participation counts.
+
+        Cheaper than get_vote_status() for progress polling: callers get
+        counts instead of the eligible_voters list and votes_cast dict.
+        """
+        key = _vote_key(vote_id)
+        if key is None:
+            return None
+
+        conn = self.comm._get_connection()
+
+        # Counted in SQLite: no ballot rows or voter list are loaded or parsed
+        row = conn.execute("""
+            SELECT
+                json_extract(metadata, '$.topic'),
+                status,
+                json_extract(metadata, '$.deadline'),
+                (SELECT COUNT(*) FROM vote_casts WHERE vote_id = :vote_id),
+                (SELECT COUNT(*) FROM vote_eligibility WHERE vote_id = :vote_id)
+            FROM votes WHERE vote_id = :vote_id
+        """, {"vote_id": key}).fetchone()
+
+        if not row:
+            return None
+
+        return VoteCounts(vote_id, *row)
+
+    def debug_dump(self, vote_id: str) -> Optional[str]:
+        """Get a vote with its ballots as indented JSON, for humans to read."""
+        vote_data = self.get_vote_status(vote_id)
+        return json.dumps(vote_data, indent=2) if vote_data else None
 
     def get_open_votes(self) -> List[Dict[str, Any]]:
-        """Get list of open votes."""
+        """Get list of open votes (newest first)."""
+        conn = self.comm._get_connection()
+
+        rows = conn.execute("""
+            SELECT vote_id, status, proposed_at, metadata FROM votes
+            WHERE status = 'open'
+            ORDER BY proposed_at DESC
+        """).fetchall()
+
+        # Ballots for every open vote in one query rather than one per vote
+        casts: Dict[bytes, Dict[str, Dict[str, str]]] = {}
+        for cast in conn.execute("""
+            SELECT c.vote_id, c.agent_id, c.choice, c.reasoning, c.timestamp
+            FROM votes v JOIN vote_casts c ON c.vote_id = v.vote_id
+            WHERE v.status = 'open'
+            ORDER BY c.timestamp, c.rowid
+        """):
+            casts.setdefault(cast[0], {})[cast[1]] = {
+                "choice": cast[2], "reasoning": cast[3], "timestamp": cast[4]
+            }
+
         open_votes = []
+        for row in rows:
+            vote_data = self._vote_from_row(row)
+            vote_data["votes_cast"] = casts.get(row[0], {})
+            open_votes.append(vote_data)
+
+        return open_votes
+
+    # Helper methods
+
+    # Vote fields kept in their own columns rather than in metadata
+    _VOTE_COLUMNS = ("vote_id", "status", "proposed_at", "votes_cast")
+
+    def _notify(
+        self,
+        conn,
+        message_type: str,
+        payload: Dict[str, Any],
+        priority: int
+    ) -> None:
+        """Broadcast a voting-system message inside the caller's transaction."""
+        row = self.comm._build_message_row(
+            from_agent="voting-system",
+            message_type=message_type,
+            payload=payload,
+            channel="general",
+            priority=priority
+        )
+        self.comm._write_message_rows(conn, [row])
+
+    def _dump_metadata(self, vote_data: Dict[str, Any]) -> str:
+        """Serialize the vote fields that live in the metadata column."""
+        return _json_dumps({
+            key: value for key, value in vote_data.items()
+            if key not in self._VOTE_COLUMNS
+        })
+
+    def _insert_vote(self, conn, vote_data: Dict[str, Any]) -> None:
+        """Insert a vote record, its eligible voters and any ballots already cast."""
+        key = _vote_key(vote_data["vote_id"])
+
+        conn.execute("""
+            INSERT INTO votes (vote_id, status, proposed_at, metadata)
+            VALUES (?, ?, ?, ?)
+        """, (
+            key,
+            vote_data["status"],
+            vote_data["proposed_at"],
+            self._dump_metadata(vote_data)
+        ))
+
+        conn.executemany("""
+            INSERT INTO vote_casts (vote_id, agent_id, choice, reasoning, timestamp)
+            VALUES (?, ?, ?, ?, ?)
+        """, [
+            (key, agent_id, ballot["choice"],
+             ballot.get("reasoning", ""), ballot["timestamp"])
+            for agent_id, ballot in vote_data["votes_cast"].items()
+        ])
+
+        conn.executemany("""
+            INSERT OR IGNORE INTO vote_eligibility (vote_id, agent_id)
+            VALUES (?, ?)
+        """, [(key, agent_id) for agent_id in vote_data["eligible_voters"]])
+
+    def _vote_from_row(self, row) -> Dict[str, Any]:
+        """Rebuild a vote dict (without votes_cast) from a votes row."""
+        return {
+            "vote_id": _vote_id(row[0]),
+            "status": row[1],
+            "proposed_at": row[2],
+            **_json_loads(row[3])
+        }
 
+    def _load_casts(self, conn, key: bytes) -> Dict[str, Dict[str, str]]:
+        """Load ballots for a vote as {agent_id: {choice, reasoning, timestamp}}."""
+        rows = conn.execute("""
+            SELECT agent_id, choice, reasoning, timestamp FROM vote_casts
+            WHERE vote_id = ?
+            ORDER BY timestamp, rowid
+        """, (key,)).fetchall()
+
+        return {
+            row[0]: {"choice": row[1], "reasoning": row[2], "timestamp": row[3]}
+            for row in rows
+        }
+
+    def _cast_rejection(self, conn, key: bytes, agent_id: str, choice: str) -> str:
+        """Explain why cast_vote's conditional insert wrote nothing."""
+        row = conn.execute(_SQL_SELECT_VOTE, (key,)).fetchone()
+
+        if not row:
+            return "Vote not found"
+
+        status = row[1]
+        metadata = _json_loads(row[3])
+
+        eligible = conn.execute("""
+            SELECT 1 FROM vote_eligibility WHERE vote_id = ? AND agent_id = ?
+        """, (key, agent_id)).fetchone()
+
+        if not eligible:
+            return "Not eligible to vote"
+
+        if status != "open":
+            return f"Vote is {status}"
+
+        if choice not in metadata["options"]:
+            return f"Invalid choice. Must be one of: {metadata['options']}"
+
+        return "Already voted. Cannot change vote."
+
+    def _import_json_votes(self) -> None:
+        """
+        Move votes left in .claude/votes/*.json into the database.
+
+        The file store rewrote votes in place, so a crash mid-write could
+        leave a truncated file; those are skipped (and left on disk for
+        manual recovery) rather than blocking startup.
+        """
         for vote_file in self.votes_dir.glob("vote-*.json"):
-            with open(vote_file) as f:
-                vote_data = json.load(f)
-                if vote_data["status"] == "open":
-                    open_votes.append(vote_data)
+            try:
+                with open(vote_file) as f:
+                    vote_data = json.load(f)
+                key = _vote_key(vote_data["vote_id"])
+            except (json.JSONDecodeError, KeyError, TypeError, AttributeError):
+                key = None
 
-        return sorted(open_votes, key=lambda v: v["proposed_at"], reverse=True)
+            if key is None:
+                continue  # Unreadable or foreign file; leave it alone
 
-    # Helper methods
+            with self.comm._transaction(immediate=True) as conn:
+                exists = conn.execute(_SQL_SELECT_VOTE, (key,)).fetchone()
+                if not exists:
+                    self._insert_vote(conn, vote_data)
+
+            vote_file.rename(vote_file.with_suffix(".json.imported"))
 
     def _get_all_agents(self) -> List[str]:
         """Get list of all registered agents."""
-        # Query agent_status table for registered agents
-        conn = self.comm._get_connection()
-        cursor = conn.cursor()
-
-        cursor.execute("SELECT agent_id FROM agent_status")
-        agents = [row[0] for row in cursor.fetchall()]
-
+        agents = list(self.comm.list_agents())
         return agents if agents else ["system"]
 
     def _tally_simple_majority(
@@ -306,22 +559,16 @@ class VotingSystem:
         options: List[str]
     ) -> Dict[str, Any]:
         """Tally using simple majority."""
-        tally = {option: 0 for option in options}
-
-        for vote in votes_cast.values():
-            choice = vote["choice"]
-            tally[choice] = tally.get(choice, 0) + 1
+        # Seed with options so ties go to the earliest listed option
+        tally = Counter(dict.fromkeys(options, 0))
+        tally.update(vote["choice"] for vote in votes_cast.values())
 
         # Find winner
-        if not tally:
-            outcome = "no_votes"
-        else:
-            winner = max(tally, key=tally.get)
-            outcome = winner
+        outcome = tally.most_common(1)[0][0] if tally else "no_votes"
 
         return {
             "outcome": outcome,
-            "tally": tally,
+            "tally": dict(tally),
             "total_votes": len(votes_cast),
             "mechanism": "simple_majority"
         }
@@ -334,24 +581,19 @@ class VotingSystem:
         """Tally using weighted voting (based on expertise)."""
         # For now, implement simple weighted based on agent type
         # Can be enhanced with actual expertise scores
-        tally = {}
+        tally = Counter()
 
         for agent_id, vote in votes_cast.items():
-            choice = vote["choice"]
             # Weight: specialist agents get 2x weight
-            weight = 2 if any(x in agent_id for x in ['specialist', 'expert', 'senior']) else 1
+            weight = 2 if _SPECIALIST_RE.search(agent_id) else 1
 
-            tally[choice] = tally.get(choice, 0) + weight
+            tally[vote["choice"]] += weight
 
-        if not tally:
-            outcome = "no_votes"
-        else:
-            winner = max(tally, key=tally.get)
-            outcome = winner
+        outcome = tally.most_common(1)[0][0] if tally else "no_votes"
 
         return {
             "outcome": outcome,
-            "tally": tally,
+            "tally": dict(tally),
             "total_votes": len(votes_cast),
             "mechanism": "weighted"
         }
@@ -362,11 +604,7 @@ class VotingSystem:
         vote_data: Dict
     ) -> Dict[str, Any]:
         """Tally using consensus (requires unanimous or near-unanimous agreement)."""
-        tally = {}
-
-        for vote in votes_cast.values():
-            choice = vote["choice"]
-            tally[choice] = tally.get(choice, 0) + 1
+        tally = Counter(vote["choice"] for vote in votes_cast.values())
 
         total_votes = len(votes_cast)
         total_eligible = len(vote_data["eligible_voters"])
@@ -377,8 +615,8 @@ class VotingSystem:
         if not tally:
             outcome = "no_consensus"
         else:
-            winner = max(tally, key=tally.get)
-            winner_pct = tally[winner] / total_votes if total_votes > 0 else 0
+            winner, winner_votes = tally.most_common(1)[0]
+            winner_pct = winner_votes / total_votes if total_votes > 0 else 0
 
             if winner_pct >= consensus_threshold:
                 outcome = winner
@@ -387,7 +625,7 @@ class VotingSystem:
 
         return {
             "outcome": outcome,
-            "tally": tally,
+            "tally": dict(tally),
             "total_votes": total_votes,
             "mechanism": "consensus",
             "consensus_threshold": consensus_threshold
@@ -9,11 +9,34 @@ Supports:
 - Creates initial spec if none exists
 """
 
+import hashlib
 import json
 import os
 import sys
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, FrozenSet, List, Optional, Set, Tuple
+
+
+def _split_indicators(indicators: Dict[str, List[str]]) -> Tuple[Dict[str, List[str]], Dict[str, List[str]]]:
+    """Split tech -> patterns into extension -> techs and name -> techs lookups."""
+    ext_map, name_map = {}, {}
+    for tech_name, patterns in indicators.items():
+        for pattern in patterns:
+            if "*" in pattern:
+                ext_map.setdefault(pattern.split("*")[1], []).append(tech_name)
+            else:
+                name_map.setdefault(pattern.rstrip("/"), []).append(tech_name)
+    return ext_map, name_map
+
+
+def _entry_names(path: Path) -> Set[str]:
+    """Names in a directory, or an empty set if it cannot be listed."""
+    try:
+        with os.scandir(path) as entries:
+            return {entry.name for entry in entries}
+    except OSError:
+        return set()
 
 
 class ProjectAnalyzer:
@@ -31,9 +54,45 @@ class ProjectAnalyzer:
         "readme": ["README.md", "readme.md", "Readme.md"]
     }
     
+    # Common indicators of each technology: "*.ext" patterns match files
+    # anywhere in the tree, other entries are paths relative to the root
+    TECH_INDICATORS = {
+        "Python": ["requirements.txt", "setup.py", "pyproject.toml", "*.py"],
+        "Node.js": ["package.json", "yarn.lock", "pnpm-lock.yaml"],
+        "TypeScript": ["tsconfig.json", "*.ts", "*.tsx"],
+        "React": ["package.json"],  # Will check contents
+        "Vue": ["package.json"],
+        "Next.js": ["next.config.js", "next.config.ts"],
+        "Docker": ["Dockerfile", "docker-compose.yml"],
+        "Database": ["*.sql", "prisma/", "migrations/"],
+        "Frontend": ["public/", "src/components/", "styles/"],
+        "Backend": ["api/", "server/", "backend/"]
+    }
+    
+    # Technology-specific agents
+    TECH_AGENTS = {
+        "Python": ["python-pro", "backend-developer"],
+        "Node.js": ["backend-developer", "nodejs-expert"],
+        "TypeScript": ["typescript-pro", "frontend-developer"],
+        "React": ["react-specialist", "frontend-developer"],
+        "Vue": ["vue-specialist", "frontend-developer"],
+        "Next.js": ["nextjs-developer", "frontend-developer"],
+        "Frontend": ["frontend-developer", "ui-designer"],
+        "Backend": ["backend-developer", "api-architect"],
+        "Database": ["database-optimizer", "data-architect"],
+        "Docker": ["devops-engineer", "build-engineer"]
+    }
+    
+    # TECH_INDICATORS split once into lookups for _detect_technologies
+    EXT_INDICATORS, NAME_INDICATORS = _split_indicators(TECH_INDICATORS)
+    
+    # Dependency, VCS and cache directories; not part of the project's own code
+    IGNORED_DIRS = {".git", "node_modules", ".venv", "venv", "__pycache__"}
+    
     def __init__(self, project_root: str = "."):
         self.project_root = Path(project_root).resolve()
         self.claude_dir = self.project_root / ".claude"
+        self.cache_path = self.claude_dir / "analysis.cache.json"
         
     def detect_spec_type(self) -> Tuple[Optional[str], List[Path]]:
         """
@@ -42,60 +101,104 @@ class ProjectAnalyzer:
         Returns:
             (spec_type, found_files) tuple
         """
+        # One listing per directory; candidates are checked against it
+        # instead of stat'ing each one, and Paths are built only for hits
+        root_entries = _entry_names(self.project_root)
+        
         # Check for 5-document system first (most comprehensive)
-        spec_dir = self.project_root / "specs"
-        if spec_dir.exists():
-            found = []
-            for fname in self.SPEC_PATTERNS["specification-architect"]:
-                fpath = spec_dir / fname
-                if fpath.exists():
-                    found.append(fpath)
+        if "specs" in root_entries:
+            spec_dir = self.project_root / "specs"
+            spec_entries = _entry_names(spec_dir)
+            found = [spec_dir / fname
+                     for fname in self.SPEC_PATTERNS["specification-architect"]
+                     if fname in spec_entries]
             if len(found) >= 3:  # At least 3 of 5 docs
                 return ("specification-architect", found)
         
         # Check for master blueprint
         for fname in self.SPEC_PATTERNS["master-blueprint"]:
-            fpath = self.project_root / fname
-            if fpath.exists():
-                return ("master-blueprint", [fpath])
+            if fname in root_entries:
+                return ("master-blueprint", [self.project_root / fname])
         
         # Check for README
         for fname in self.SPEC_PATTERNS["readme"]:
-            fpath = self.project_root / fname
-            if fpath.exists():
-                return ("readme", [fpath])
+            if fname in root_entries:
+                return ("readme", [self.project_root / fname])
         
         return (None, [])
     
-    def analyze(self) -> Dict:
+    def analyze(self, use_cache: bool = True) -> Dict:
         """
         Analyze project and return structured information.
         
+        The result is cached in .claude/analysis.cache.json (when .claude
+        exists) and reused while no top-level entry of the project has been
+        added, removed or modified. Changes deeper in the tree do not touch
+        the top-level mtimes; pass use_cache=False to force a fresh walk.
+        The .claude flags are not part of the signature and are always
+        checked afresh.
+        
+        Args:
+            use_cache: Reuse a cached result whose signature still matches
+        
         Returns:
             Dictionary with project metadata and analysis
         """
+        signature = self._tree_signature()
+        if use_cache and self.cache_path.exists():
+            try:
+                with open(self.cache_path) as f:
+                    cached = json.load(f)
+                if cached.get("signature") == signature:
+                    result = cached["result"]
+                    result.update(self._claude_flags())
+                    return result
+            except (OSError, ValueError, KeyError):
+                pass  # Unreadable cache; analyze again
+        
+        result = self._analyze()
+        
+        if self.claude_dir.is_dir():
+            with open(self.cache_path, "w") as f:
+                json.dump({"signature": signature, "result": result}, f)
+        
+        return result
+    
+    def _tree_signature(self) -> str:
+        """Hash of the names and mtimes of the project's top-level entries."""
+        entries = sorted(
+            (entry.name, entry.stat(follow_symlinks=False).st_mtime_ns)
+            for entry in os.scandir(self.project_root)
+            if entry.name != ".claude"  # Writing the cache must not invalidate it
+        )
+        return hashlib.sha1(repr(entries).encode()).hexdigest()
+    
+    def _claude_flags(self) -> Dict[str, bool]:
+        """Whether .claude, .claude/agents and .claude/skills exist."""
+        has_claude_dir = self.claude_dir.exists()
+        return {
+            "has_claude_dir": has_claude_dir,
+            "has_agents": has_claude_dir and (self.claude_dir / "agents").exists(),
+            "has_skills": has_claude_dir and (self.claude_dir / "skills").exists()
+        }
+    
+    def _analyze(self) -> Dict:
+        """Walk the project and build the analysis result."""
         spec_type, spec_files = self.detect_spec_type()
         
         # Gather project metadata
         project_name = self.project_root.name
-        has_claude_dir = self.claude_dir.exists()
-        has_agents = (self.claude_dir / "agents").exists() if has_claude_dir else False
-        has_skills = (self.claude_dir / "skills").exists() if has_claude_dir else False
-        
-        # Technology detection
-        tech_stack = self._detect_technologies()
         
-        # Count files
-        total_files = sum(1 for _ in self.project_root.rglob("*") if _.is_file())
+        # One walk feeds both technology detection and the file count
+        exts, names, total_files = self._scan_tree()
+        tech_stack = self._detect_technologies(exts, names)
         
         result = {
             "project_name": project_name,
             "project_root": str(self.project_root),
             "spec_type": spec_type,
             "spec_files": [str(f) for f in spec_files],
-            "has_claude_dir": has_claude_dir,
-            "has_agents": has_agents,
-            "has_skills": has_skills,
+            **self._claude_flags(),
             "tech_stack": tech_stack,
             "total_files": total_files,
             "needs_spec_creation": spec_type is None,
@@ -104,43 +207,57 @@ class ProjectAnalyzer:
         
         return result
     
-    def _detect_technologies(self) -> List[str]:
-        """Detect technologies used in the project."""
-        tech = []
+    def _scan_tree(self) -> Tuple[Set[str], Set[str], int]:
+        """
+        Walk the project once, skipping IGNORED_DIRS.
         
-        # Check for common indicators
-        indicators = {
-            "Python": ["requirements.txt", "setup.py", "pyproject.toml", "*.py"],
-            "Node.js": ["package.json", "yarn.lock", "pnpm-lock.yaml"],
-            "TypeScript": ["tsconfig.json", "*.ts", "*.tsx"],
-            "React": ["package.json"],  # Will check contents
-            "Vue": ["package.json"],
-            "Next.js": ["next.config.js", "next.config.ts"],
-            "Docker": ["Dockerfile", "docker-compose.yml"],
-            "Database": ["*.sql", "prisma/", "migrations/"],
-            "Frontend": ["public/", "src/components/", "styles/"],
-            "Backend": ["api/", "server/", "backend/"]
-        }
+        Returns:
+            (file extensions seen, top-level names plus relative paths of all
+            directories, number of files) tuple
+        """
+        exts = set()
+        names = set()
+        total_files = 0
         
-        for tech_name, patterns in indicators.items():
-            for pattern in patterns:
-                if "*" in pattern:
-                    # Glob pattern
-                    ext = pattern.split("*")[1]
-                    if list(self.project_root.rglob(f"*{ext}")):
-                        tech.append(tech_name)
-                        break
-                else:
-                    # File/directory name
-                    if (self.project_root / pattern).exists():
-                        tech.append(tech_name)
-                        break
+        # Explicit scandir stack: DirEntry caches the d_type from the
+        # directory listing, so files are classified without a stat each
+        stack = [(str(self.project_root), "")]
+        while stack:
+            dirpath, rel = stack.pop()
+            try:
+                entries = os.scandir(dirpath)
+            except OSError:
+                continue  # Unreadable directory; os.walk skipped these too
+            
+            with entries:
+                for entry in entries:
+                    if not rel:
+                        names.add(entry.name)
+                    
+                    if entry.is_dir(follow_symlinks=False):
+                        if entry.name not in self.IGNORED_DIRS:
+                            child = f"{rel}/{entry.name}" if rel else entry.name
+                            names.add(child)
+                            stack.append((entry.path, child))
+                    elif entry.is_file():
+                        total_files += 1
+                        exts.add(os.path.splitext(entry.name)[1])
+        
+        return exts, names, total_files
+    
+    def _detect_technologies(self, exts: Set[str], names: Set[str]) -> List[str]:
+        """Detect technologies used in the project from a _scan_tree() result."""
+        # Extensions match anywhere in the tree, names relative to the root
+        tech = []
+        for ext in exts & self.EXT_INDICATORS.keys():
+            tech.extend(self.EXT_INDICATORS[ext])
+        for name in names & self.NAME_INDICATORS.keys():
+            tech.extend(self.NAME_INDICATORS[name])
         
         # Special checks
-        pkg_json = self.project_root / "package.json"
-        if pkg_json.exists():
+        if "package.json" in names:
             try:
-                with open(pkg_json) as f:
+                with open(os.path.join(self.project_root, "package.json")) as f:
                     data = json.load(f)
                     deps = {**data.get("dependencies", {}), **data.get("devDependencies", {})}
                     
@@ -157,41 +274,32 @@ class ProjectAnalyzer:
     
     def _recommend_agents(self, tech_stack: List[str]) -> List[str]:
         """Recommend agents based on detected technologies."""
-        # Core meta-orchestrators (always needed)
-        agents = [
+        return list(self._recommend_for(frozenset(tech_stack)))
+    
+    @staticmethod
+    @lru_cache(maxsize=128)
+    def _recommend_for(tech_stack: FrozenSet[str]) -> Tuple[str, ...]:
+        """Agent recommendations for a tech stack, memoized per distinct stack."""
+        # Insertion-ordered dict as an ordered set: first mention wins,
+        # duplicates are dropped as they arrive
+        agents = dict.fromkeys([
+            # Core meta-orchestrators (always needed)
             "context-manager",
             "agent-manager",  # Handles recruitment and training
             "multi-agent-orchestrator"
-        ]
-        
-        # Technology-specific agents
-        tech_mapping = {
-            "Python": ["python-pro", "backend-developer"],
-            "Node.js": ["backend-developer", "nodejs-expert"],
-            "TypeScript": ["typescript-pro", "frontend-developer"],
-            "React": ["react-specialist", "frontend-developer"],
-            "Vue": ["vue-specialist", "frontend-developer"],
-            "Next.js": ["nextjs-developer", "frontend-developer"],
-            "Frontend": ["frontend-developer", "ui-designer"],
-            "Backend": ["backend-developer", "api-architect"],
-            "Database": ["database-optimizer", "data-architect"],
-            "Docker": ["devops-engineer", "build-engineer"]
-        }
+        ])
         
-        for tech in tech_stack:
-            if tech in tech_mapping:
-                agents.extend(tech_mapping[tech])
+        # Technology-specific agents, in a stable order for a given stack
+        for tech in sorted(tech_stack):
+            for agent in ProjectAnalyzer.TECH_AGENTS.get(tech, ()):
+                agents.setdefault(agent)
         
         # Always useful
-        agents.extend([
-            "code-reviewer",
-            "test-automator",
-            "debugger",
-            "task-distributor",
-            "documentation-engineer"
-        ])
+        for agent in ("code-reviewer", "test-automator", "debugger",
+                      "task-distributor", "documentation-engineer"):
+            agents.setdefault(agent)
         
-        return list(dict.fromkeys(agents))  # Remove duplicates while preserving order
+        return tuple(agents)
 
 
 def main():
@@ -10,12 +10,197 @@ Logs:
 - Task transitions
 """
 
+import atexit
+import gzip
+import itertools
 import json
+import mmap
+import os
+import queue
+import sqlite3
 import sys
+import threading
+import time
+import weakref
+from collections import Counter
+from contextlib import contextmanager
 from datetime import datetime
 from pathlib import Path
 from typing import Dict, Any, Optional
-import uuid
+
+try:
+    import orjson
+except ImportError:  # Optional speedup; stdlib json is used without it
+    orjson = None
+
+try:
+    import fcntl
+except ImportError:  # Windows: rotate() waits for the old trail to stop growing instead
+    fcntl = None
+
+try:
+    import zstandard
+except ImportError:  # Optional; archived segments are gzip-compressed without it
+    zstandard = None
+
+# Event IDs: pid and start time (fixed-width hex) plus a per-process counter.
+# Unique without a getrandom() call per event; reset in forked children,
+# which would otherwise share the parent's prefix and counter.
+_id_prefix = ""
+_id_counter = itertools.count()
+
+
+def _reset_event_ids():
+    """Start a fresh event ID sequence for this process."""
+    global _id_prefix, _id_counter
+    _id_prefix = f"{os.getpid():08x}{time.time_ns():016x}"
+    _id_counter = itertools.count()
+
+
+_reset_event_ids()
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_event_ids)
+
+# (second, "YYYY-MM-DDTHH:MM:SS" local time) of the last timestamp formatted
+_ts_cache = (None, "")
+
+
+def _now_iso() -> str:
+    """Local time as ISO 8601 with microseconds, formatting each second once."""
+    global _ts_cache
+    sec, ns = divmod(time.time_ns(), 1_000_000_000)
+    cached_sec, prefix = _ts_cache
+    if sec != cached_sec:
+        prefix = time.strftime("%Y-%m-%dT%H:%M:%S", time.localtime(sec))
+        _ts_cache = (sec, prefix)
+    return f"{prefix}.{ns // 1000:06d}"
+
+
+def _json_dumps(obj: Any) -> bytes:
+    """Serialize to UTF-8 JSON bytes (orjson when installed)."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(obj).encode()
+
+
+def _json_loads(data: bytes) -> Any:
+    """Parse JSON bytes (orjson when installed)."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+@contextmanager
+def _mapped(path: Path):
+    """Memory-map a file read-only; the kernel pages in only what is touched."""
+    with open(path, 'rb') as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            yield b""  # mmap cannot map an empty file
+            return
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            yield mm
+
+
+def _lines(buf, pos: int = 0):
+    """Yield the lines of a buffer from pos onwards, without line endings."""
+    size = len(buf)
+    while pos < size:
+        end = buf.find(b"\n", pos)
+        if end < 0:
+            end = size
+        yield buf[pos:end]
+        pos = end + 1
+
+
+def _reversed_lines(buf, lo: int = 0):
+    """Yield the lines of a buffer from last to first, stopping at offset lo."""
+    end = len(buf)
+    while end >= lo:
+        newline = buf.rfind(b"\n", lo, end)
+        start = lo if newline < 0 else newline + 1
+        yield buf[start:end]
+        end = start - 1
+
+
+def _raw_timestamp(line: bytes) -> Optional[bytes]:
+    """Slice an event's timestamp out of its JSON line without parsing it."""
+    start = line.find(b'"timestamp":')
+    if start < 0:
+        return None
+    start = line.find(b'"', start + 12) + 1  # Opening quote of the value
+    return line[start:line.find(b'"', start)]
+
+
+def _compact_ts(timestamp: str) -> str:
+    """ISO timestamp cut to seconds without separators, for segment names."""
+    return timestamp[:19].replace("-", "").replace(":", "")
+
+
+def _compress(data: bytes):
+    """Compress an archive segment; returns (compressed bytes, file suffix)."""
+    if zstandard is not None:
+        return zstandard.ZstdCompressor(level=3, write_checksum=True).compress(data), ".zst"
+    return gzip.compress(data, compresslevel=6), ".gz"
+
+
+def _segment_order(path: Path):
+    """Sort key for an archive segment: (first, last, collision number)."""
+    parts = path.name.split(".")[0].split("-")
+    return parts[1], parts[2], int(parts[3]) if len(parts) > 3 else 0
+
+
+def _decompress(path: Path) -> bytes:
+    """Read back an archive segment written by _compress."""
+    data = path.read_bytes()
+    if path.suffix == ".zst":
+        if zstandard is None:
+            raise RuntimeError(f"Reading {path.name} requires the zstandard package")
+        return zstandard.ZstdDecompressor().decompress(data)
+    return gzip.decompress(data)
+
+
+def _first_line_since(buf, since: bytes) -> int:
+    """
+    Binary-search the offset of the first line stamped at or after since.
+    
+    Relies on the trail being appended in time order. Each probe reads only
+    the head of one line, where the timestamp sits.
+    """
+    lo, hi = 0, len(buf)
+    while lo < hi:
+        mid = (lo + hi) // 2
+        start = buf.rfind(b"\n", 0, mid) + 1
+        if (_raw_timestamp(buf[start:start + 128]) or b"") < since:
+            end = buf.find(b"\n", start)
+            lo = len(buf) if end < 0 else end + 1
+        else:
+            hi = start
+    return lo
+
+
+# Loggers whose writer thread is running; weak, so the exit hook keeps no
+# logger alive once it is closed and dropped
+_running_loggers = weakref.WeakSet()
+
+
+def _close_running_loggers():
+    """Exit hook: drain every running writer, bounded by SHUTDOWN_TIMEOUT."""
+    for logger in list(_running_loggers):
+        logger.close(logger.SHUTDOWN_TIMEOUT)
+
+
+atexit.register(_close_running_loggers)
+
+
+class _Rotation:
+    """Writer queue marker: move the trail aside once earlier lines are written."""
+    
+    __slots__ = ("done", "moved", "error")
+    
+    def __init__(self):
+        self.done = threading.Event()
+        self.moved = False
+        self.error = None  # OSError from the move, re-raised by rotate()
 
 
 class AuditLogger:
@@ -27,10 +212,43 @@ class AuditLogger:
         "human_escalation", "system_event"
     ]
     
+    # log() waits for events of these severities to reach the file
+    FLUSH_SEVERITIES = ("error", "critical")
+    
+    # Most queued lines the writer thread joins into one write
+    WRITE_BATCH = 256
+    
+    # Bytes before the binary-searched since offset that scans also cover
+    SINCE_MARGIN = 1 << 16
+    
+    # Longest the exit hook waits for the writer to drain, in seconds
+    SHUTDOWN_TIMEOUT = 5.0
+    
+    # Queued by close() to stop the writer thread
+    _STOP = object()
+    
+    # Seconds rotate() waits between size checks where flock is unavailable
+    ROTATE_SETTLE = 0.05
+    
     def __init__(self, project_root: str = "."):
         self.project_root = Path(project_root).resolve()
         self.claude_dir = self.project_root / ".claude"
         self.audit_path = self.claude_dir / "audit-trail.jsonl"
+        self.index_path = self.claude_dir / "audit-trail.idx.sqlite"
+        self.archive_dir = self.claude_dir / "audit-archive"
+        
+        # Sidecar index of (agent_id, event_type, timestamp) -> line offset,
+        # opened by the first filtered query
+        self._index = None
+        self._index_lock = threading.Lock()
+        
+        # Lines are queued by log() and written by a background thread,
+        # started on first use, through a file handle it keeps open
+        self._queue = queue.SimpleQueue()
+        self._writer = None
+        self._writer_pid = None
+        self._fh = None
+        self._lock = threading.Lock()
         
     def log(self, event_type: str, agent_id: str, action: str, 
             details: Optional[Dict[str, Any]] = None,
@@ -48,8 +266,8 @@ class AuditLogger:
         Returns:
             event_id
         """
-        event_id = str(uuid.uuid4())
-        timestamp = datetime.now().isoformat()
+        event_id = f"{_id_prefix}{next(_id_counter):08x}"
+        timestamp = _now_iso()
         
         event = {
             "id": event_id,
@@ -62,12 +280,10 @@ class AuditLogger:
             "trace_id": details.get("trace_id") if details else None
         }
         
-        # Ensure audit file exists
-        self.claude_dir.mkdir(parents=True, exist_ok=True)
-        
-        # Append to JSONL file
-        with open(self.audit_path, 'a') as f:
-            f.write(json.dumps(event) + '\n')
+        self._ensure_writer()
+        self._queue.put(_json_dumps(event) + b'\n')
+        if severity in self.FLUSH_SEVERITIES:
+            self.flush()
         
         # If critical, create alert file
         if severity == "critical":
@@ -75,6 +291,242 @@ class AuditLogger:
         
         return event_id
     
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """
+        Block until every event logged so far is written to the audit file.
+        
+        Args:
+            timeout: Seconds to wait at most; None waits as long as it takes
+        
+        Returns:
+            True if everything was written, False if the wait timed out
+        """
+        with self._lock:
+            running = self._writer_pid == os.getpid()
+        if not running:
+            return True
+        done = threading.Event()
+        self._queue.put(done)
+        return done.wait(timeout)
+    
+    def close(self, timeout: Optional[float] = None):
+        """
+        Write queued events, stop the writer thread and close the index.
+        
+        The writer blocks on its queue rather than polling, so it stops as
+        soon as the lines ahead of the stop marker are written. Called at
+        exit, for loggers still running, with SHUTDOWN_TIMEOUT so a stalled
+        disk cannot hang the interpreter.
+        
+        Args:
+            timeout: Seconds to wait for the writer; None waits as long as it takes
+        """
+        with self._lock:
+            if self._writer_pid == os.getpid():
+                self._queue.put(self._STOP)
+                self._writer.join(timeout)
+            self._writer = self._writer_pid = None
+        _running_loggers.discard(self)
+        with self._index_lock:
+            if self._index:
+                self._index.close()
+                self._index = None
+    
+    def _ensure_writer(self):
+        """Start the writer thread for this process if it is not running."""
+        with self._lock:
+            if self._writer_pid == os.getpid():
+                return
+            # First use, or a forked child: the parent's thread did not survive
+            # the fork, and neither should the lines it had not yet written
+            self._queue = queue.SimpleQueue()
+            self._fh = None
+            self._writer = threading.Thread(target=self._write_loop, name="audit-writer", daemon=True)
+            self._writer_pid = os.getpid()
+            self._writer.start()
+        _running_loggers.add(self)
+    
+    def _write_loop(self):
+        """Writer thread: drain the queue in batches until _STOP arrives."""
+        while True:
+            batch = [self._queue.get()]
+            while len(batch) < self.WRITE_BATCH:
+                try:
+                    batch.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+            
+            # Markers are released only after the lines queued before them are written
+            lines = []
+            for item in batch:
+                if isinstance(item, bytes):
+                    lines.append(item)
+                    continue
+                self._write_lines(lines)
+                lines = []
+                if item is self._STOP:
+                    if self._fh:
+                        self._fh.close()
+                        self._fh = None
+                    return
+                if isinstance(item, _Rotation):
+                    # Close first so nothing this writer holds points at the moved file
+                    if self._fh:
+                        self._fh.close()
+                        self._fh = None
+                    try:
+                        item.moved = self._move_trail_aside()
+                    except OSError as e:
+                        item.error = e
+                    item.done.set()
+                else:
+                    item.set()
+            self._write_lines(lines)
+    
+    def _write_lines(self, lines: list):
+        """Writer thread: append lines to the live trail in one write."""
+        if not lines:
+            return
+        try:
+            self._write_to_live_trail(b''.join(lines))
+        except OSError as e:
+            # Keep running so flush() callers are never left waiting
+            print(f"audit-writer: dropped {len(lines)} event(s): {e}", file=sys.stderr)
+    
+    def _write_to_live_trail(self, data: bytes):
+        """
+        Append data to the trail file currently at audit_path.
+        
+        The write holds a shared flock on the handle, taken before checking
+        that the handle is still the live trail: rotate() takes the
+        exclusive lock after moving the file, so once it has the lock no
+        writer in any process can still append to the moved file.
+        """
+        while True:
+            if self._fh is None:
+                # Ensure audit file exists
+                self.claude_dir.mkdir(parents=True, exist_ok=True)
+                self._fh = open(self.audit_path, 'ab', buffering=1 << 16)
+            if fcntl is not None:
+                fcntl.flock(self._fh.fileno(), fcntl.LOCK_SH)
+            if self._fh_is_current():
+                break
+            # rotate() moved the file away; start a new one
+            self._fh.close()
+            self._fh = None
+        try:
+            self._fh.write(data)
+            self._fh.flush()
+        finally:
+            if fcntl is not None:
+                fcntl.flock(self._fh.fileno(), fcntl.LOCK_UN)
+    
+    def _fh_is_current(self) -> bool:
+        """Whether the writer's open handle still refers to the live trail."""
+        try:
+            return os.stat(self.audit_path).st_ino == os.fstat(self._fh.fileno()).st_ino
+        except FileNotFoundError:
+            return False
+    
+    def rotate(self) -> Optional[Path]:
+        """
+        Move the live trail into a compressed archive segment.
+        
+        Segments live in .claude/audit-archive and are named by the
+        timestamps (to the second) of their first and last events, so reads
+        bounded by since skip older segments by name. They are zstd frames
+        with checksums when zstandard is installed, gzip otherwise.
+        
+        The move goes through this logger's writer queue, after the lines
+        already queued. Other loggers and processes notice it before their
+        next batch and start a fresh trail; the moved file is only read
+        once their in-flight writes to it have finished.
+        
+        Returns:
+            Path of the new segment, or None if the trail was empty
+        """
+        self._ensure_writer()
+        rotation = _Rotation()
+        self._queue.put(rotation)
+        rotation.done.wait()
+        if rotation.error:
+            raise rotation.error
+        if not rotation.moved:
+            return None
+        
+        rotating = self.audit_path.with_suffix(".rotating")
+        with open(rotating, 'rb') as f:
+            if fcntl is not None:
+                # Held until the unlink below
+                fcntl.flock(f.fileno(), fcntl.LOCK_EX)
+            else:
+                self._wait_until_settled(rotating)
+            data = f.read()
+            segment = self._archive(data)
+            rotating.unlink()
+        
+        # Offsets in the index referred to the file just archived
+        with self._index_lock:
+            conn = self._get_index()
+            with conn:
+                conn.execute("DELETE FROM events")
+                conn.execute("UPDATE progress SET indexed_to = 0")
+        
+        return segment
+    
+    def _move_trail_aside(self) -> bool:
+        """Rename a non-empty live trail to .rotating; whether it was moved."""
+        try:
+            if self.audit_path.stat().st_size == 0:
+                return False
+            os.replace(self.audit_path, self.audit_path.with_suffix(".rotating"))
+        except FileNotFoundError:
+            return False
+        return True
+    
+    def _wait_until_settled(self, path: Path):
+        """Without flock: wait until path stops growing, as writers that
+        still hold it finish their current batch."""
+        size = -1
+        while size != path.stat().st_size:
+            size = path.stat().st_size
+            time.sleep(self.ROTATE_SETTLE)
+    
+    def _archive(self, data: bytes) -> Path:
+        """Write trail contents as a new compressed segment; returns its path."""
+        stamps = [ts for ts in map(_raw_timestamp, _lines(data)) if ts]
+        now = _compact_ts(_now_iso())
+        first = _compact_ts(stamps[0].decode()) if stamps else now
+        last = _compact_ts(stamps[-1].decode()) if stamps else now
+        
+        compressed, suffix = _compress(data)
+        self.archive_dir.mkdir(parents=True, exist_ok=True)
+        segment = self.archive_dir / f"audit-{first}-{last}.jsonl{suffix}"
+        n = 1
+        while segment.exists():
+            segment = self.archive_dir / f"audit-{first}-{last}-{n}.jsonl{suffix}"
+            n += 1
+        
+        tmp = segment.with_name(segment.name + ".tmp")
+        tmp.write_bytes(compressed)
+        os.replace(tmp, segment)
+        return segment
+    
+    def _segments(self, since: Optional[str] = None) -> list:
+        """Archive segments, oldest first, that may hold events at or after since."""
+        if not self.archive_dir.exists():
+            return []
+        
+        floor = _compact_ts(since) if since else ""
+        segments = []
+        paths = [path for path in self.archive_dir.glob("audit-*.jsonl.*")
+                 if not path.name.endswith(".tmp")]
+        for path in sorted(paths, key=_segment_order):
+            last = path.name.split(".")[0].split("-")[2]
+            if last >= floor:
+                segments.append(path)
+        return segments
+    
     def log_decision(self, agent_id: str, decision: str, reasoning: str,
                     alternatives: Optional[list] = None, context: Optional[Dict] = None):
         """Log a decision with full reasoning."""
@@ -144,34 +596,158 @@ class AuditLogger:
             limit: Max results
             
         Returns:
-            List of matching events
+            List of matching events, newest first
         """
-        if not self.audit_path.exists():
-            return []
+        self.flush()
+        since_b = since.encode() if since else None
+        events = []
+        
+        if self.audit_path.exists():
+            if agent_id or event_type:
+                events = self._query_index(agent_id, event_type, since, limit)
+            else:
+                with _mapped(self.audit_path) as buf:
+                    events = self._scan_reversed(buf, since_b, limit)
+        
+        # Older events continue in the archive, newest segment first
+        for segment in reversed(self._segments(since)):
+            if len(events) >= limit:
+                break
+            events.extend(self._scan_reversed(_decompress(segment), since_b,
+                                              limit - len(events), agent_id, event_type))
+        
+        return events
+    
+    def _scan_reversed(self, buf, since_b: Optional[bytes], limit: int,
+                       agent_id: Optional[str] = None,
+                       event_type: Optional[str] = None) -> list:
+        """
+        Walk a buffer of JSONL events from the end, newest first.
+        
+        "Last N" walks stop after N matches. A since bound stops the walk at
+        its binary-searched offset, and lines older than since are dropped
+        on their raw timestamp, unparsed.
+        """
+        lo = 0
+        if since_b:
+            lo = _first_line_since(buf, since_b)
+            lo = buf.rfind(b"\n", 0, max(0, lo - self.SINCE_MARGIN)) + 1
         
         events = []
-        with open(self.audit_path) as f:
-            for line in f:
-                try:
-                    event = json.loads(line.strip())
-                    
-                    # Apply filters
-                    if agent_id and event["agent_id"] != agent_id:
-                        continue
-                    if event_type and event["event_type"] != event_type:
-                        continue
-                    if since and event["timestamp"] < since:
-                        continue
-                    
-                    events.append(event)
-                    
-                    if len(events) >= limit:
-                        break
-                except json.JSONDecodeError:
-                    continue
+        for line in _reversed_lines(buf, lo):
+            if not line.strip():
+                continue
+            if since_b and (_raw_timestamp(line) or b"") < since_b:
+                continue
+            try:
+                event = _json_loads(line)
+            except json.JSONDecodeError:
+                continue
+            if agent_id and event.get("agent_id") != agent_id:
+                continue
+            if event_type and event.get("event_type") != event_type:
+                continue
+            
+            events.append(event)
+            if len(events) >= limit:
+                break
+        
+        return events
+    
+    def _query_index(self, agent_id: Optional[str], event_type: Optional[str],
+                     since: Optional[str], limit: int) -> list:
+        """Answer a filtered query from the sidecar index, newest first."""
+        clauses, params = [], []
+        if agent_id:
+            clauses.append("agent_id = ?")
+            params.append(agent_id)
+        if event_type:
+            clauses.append("event_type = ?")
+            params.append(event_type)
+        if since:
+            clauses.append("timestamp >= ?")
+            params.append(since)
+        
+        with self._index_lock:
+            conn = self._get_index()
+            self._update_index(conn)
+            rows = conn.execute(f"""
+                SELECT offset, length FROM events
+                WHERE {' AND '.join(clauses)}
+                ORDER BY offset DESC
+                LIMIT ?
+            """, params + [limit]).fetchall()
+        
+        events = []
+        with open(self.audit_path, 'rb') as f:
+            for offset, length in rows:
+                f.seek(offset)
+                events.append(_json_loads(f.read(length)))
+        
+        return events
+    
+    def _get_index(self) -> sqlite3.Connection:
+        """Open (and create if needed) the sidecar index; caller holds _index_lock."""
+        if self._index is None:
+            conn = sqlite3.connect(str(self.index_path), check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.executescript("""
+                CREATE TABLE IF NOT EXISTS events (
+                    offset INTEGER PRIMARY KEY,
+                    length INTEGER NOT NULL,
+                    agent_id TEXT,
+                    event_type TEXT,
+                    timestamp TEXT,
+                    severity TEXT
+                );
+                CREATE INDEX IF NOT EXISTS idx_events_agent ON events(agent_id);
+                CREATE INDEX IF NOT EXISTS idx_events_type ON events(event_type);
+                CREATE INDEX IF NOT EXISTS idx_events_timestamp ON events(timestamp);
+                
+                -- Byte offset up to which the trail has been indexed
+                CREATE TABLE IF NOT EXISTS progress (
+                    id INTEGER PRIMARY KEY CHECK (id = 0),
+                    indexed_to INTEGER NOT NULL
+                );
+                INSERT OR IGNORE INTO progress (id, indexed_to) VALUES (0, 0);
+            """)
+            self._index = conn
+        return self._index
+    
+    def _update_index(self, conn: sqlite3.Connection):
+        """
+        Index lines appended to the trail since the last update.
         
-        # Return newest first
-        return list(reversed(events))
+        Catching up at query time, rather than in log(), keeps logging cheap
+        and also covers events written by other processes.
+        """
+        with conn:
+            conn.execute("BEGIN IMMEDIATE")
+            indexed_to = conn.execute("SELECT indexed_to FROM progress").fetchone()[0]
+            
+            if indexed_to > self.audit_path.stat().st_size:
+                # Trail was truncated or replaced; start over
+                conn.execute("DELETE FROM events")
+                indexed_to = 0
+            
+            rows = []
+            with open(self.audit_path, 'rb') as f:
+                f.seek(indexed_to)
+                for line in f:
+                    if not line.endswith(b"\n"):
+                        break  # Partial line still being written
+                    try:
+                        event = _json_loads(line)
+                        rows.append((indexed_to, len(line), event["agent_id"],
+                                     event["event_type"], event["timestamp"],
+                                     event["severity"]))
+                    except (json.JSONDecodeError, KeyError):
+                        pass
+                    indexed_to += len(line)
+            
+            conn.executemany("INSERT OR IGNORE INTO events VALUES (?, ?, ?, ?, ?, ?)", rows)
+            conn.execute("UPDATE progress SET indexed_to = ?", (indexed_to,))
     
     def get_agent_timeline(self, agent_id: str, limit: int = 50) -> list:
         """Get chronological timeline of agent actions."""
@@ -190,52 +766,70 @@ class AuditLogger:
         alerts_dir = self.claude_dir / "alerts"
         alerts_dir.mkdir(exist_ok=True)
         
-        alert_file = alerts_dir / f"{event['timestamp'].replace(':', '-')}_{event['id'][:8]}.json"
+        alert_file = alerts_dir / f"{event['timestamp'].replace(':', '-')}_{event['id'][-8:]}.json"
         with open(alert_file, 'w') as f:
             json.dump(event, f, indent=2)
     
     def generate_report(self, since: Optional[str] = None) -> Dict:
-        """Generate audit report."""
-        events = self.query(since=since, limit=10000)
+        """
+        Generate audit report.
         
-        report = {
+        Counts are accumulated in one streaming pass over the archive
+        segments that overlap the period, then the memory-mapped trail.
+        With since, each scan starts at a binary-searched offset (less
+        SINCE_MARGIN bytes, for lines flushed slightly out of order) and
+        older lines are skipped on their raw timestamp, unparsed.
+        """
+        self.flush()
+        counters = (Counter(), Counter(), Counter())
+        since_b = since.encode() if since else None
+        
+        for segment in self._segments(since):
+            self._count_events(_decompress(segment), since_b, counters)
+        if self.audit_path.exists():
+            with _mapped(self.audit_path) as buf:
+                self._count_events(buf, since_b, counters)
+        
+        by_type, by_agent, by_severity = counters
+        return {
             "generated_at": datetime.now().isoformat(),
             "period_start": since or "all_time",
-            "total_events": len(events),
-            "by_type": {},
-            "by_agent": {},
-            "by_severity": {},
-            "errors": 0,
-            "escalations": 0
+            "total_events": sum(by_type.values()),
+            "by_type": dict(by_type),
+            "by_agent": dict(by_agent),
+            "by_severity": dict(by_severity),
+            "errors": by_type["error"],
+            "escalations": by_type["human_escalation"]
         }
+    
+    def _count_events(self, buf, since_b: Optional[bytes], counters):
+        """Add a buffer's events to the (by_type, by_agent, by_severity) counters."""
+        by_type, by_agent, by_severity = counters
+        start = 0
+        if since_b:
+            start = _first_line_since(buf, since_b)
+            start = buf.rfind(b"\n", 0, max(0, start - self.SINCE_MARGIN)) + 1
         
-        for event in events:
-            # Count by type
-            etype = event["event_type"]
-            report["by_type"][etype] = report["by_type"].get(etype, 0) + 1
+        for line in _lines(buf, start):
+            if since_b and (_raw_timestamp(line) or b"") < since_b:
+                continue
+            try:
+                event = _json_loads(line)
+                etype, agent, severity = (event["event_type"], event["agent_id"],
+                                          event["severity"])
+            except (json.JSONDecodeError, KeyError):
+                continue
             
-            # Count by agent
-            agent = event["agent_id"]
-            report["by_agent"][agent] = report["by_agent"].get(agent, 0) + 1
-            
-            # Count by severity
-            severity = event["severity"]
-            report["by_severity"][severity] = report["by_severity"].get(severity, 0) + 1
-            
-            # Special counts
-            if etype == "error":
-                report["errors"] += 1
-            if etype == "human_escalation":
-                report["escalations"] += 1
-        
-        return report
+            by_type[etype] += 1
+            by_agent[agent] += 1
+            by_severity[severity] += 1
 
 
 def main():
     """CLI entry point."""
     if len(sys.argv) < 2:
         print("Usage: python audit_logger.py <command> [args...]")
-        print("Commands: log, query, report")
+        print("Commands: log, query, report, errors, escalations, rotate")
         sys.exit(1)
     
     command = sys.argv[1]
@@ -272,6 +866,10 @@ def main():
         escalations = logger.get_escalations()
         print(json.dumps(escalations, indent=2))
     
+    elif command == "rotate":
+        segment = logger.rotate()
+        print(json.dumps({"segment": str(segment) if segment else None}, indent=2))
+    
     else:
         print(f"Unknown command: {command}")
         sys.exit(1)
@@ -1,3 +1,6 @@
+import hashlib
+from pathlib import Path
+
 from reportlab.lib.colors import HexColor
 from reportlab.lib.pagesizes import A4
 from reportlab.pdfgen import canvas
@@ -7,26 +10,57 @@ beige = HexColor("#f8f4ed")        # light beige background
 blue = HexColor("#91a8d0")         # pastel French blue accent
 black = HexColor("#000000")
 
-c = canvas.Canvas("Page_de_couverture.pdf", pagesize=A4)
+TITLE = "Cahier d’étude du français"
+SUBTITLE = "Apprendre, écouter, lire, progresser chaque jour"
+OUT_PATH = "Page_de_couverture.pdf"
+
+
+def cover_hash(title, subtitle):
+    """Hash of the cover inputs and of this script, so layout edits also count."""
+    h = hashlib.sha256(Path(__file__).read_bytes())
+    h.update(f"\0{title}\0{subtitle}".encode())
+    return h.hexdigest()
+
+
+def build_cover(title, subtitle, out_path):
+    """Draw the cover to out_path unless it is already up to date.
+
+    Returns True if the PDF was (re)built, False if skipped.
+    """
+    out = Path(out_path)
+    hash_file = out.with_suffix(".cover.hash")
+    digest = cover_hash(title, subtitle)
+    if out.exists() and hash_file.exists() and hash_file.read_text() == digest:
+        return False
+
+    c = canvas.Canvas(str(out), pagesize=A4, pageCompression=1)
+
+    # background
+    c.setFillColor(beige)
+    c.rect(0, 0, width, height, fill=1, stroke=0)
+
+    # title
+    c.setFillColor(black)
+    c.setFont("Times-Bold", 36)
+    c.drawCentredString(width/2, height/2 + 40, title)
 
-# background
-c.setFillColor(beige)
-c.rect(0, 0, width, height, fill=1, stroke=0)
+    # subtitle
+    c.setFont("Times-Italic", 18)
+    c.drawCentredString(width/2, height/2 - 5, subtitle)
 
-# title
-c.setFillColor(black)
-c.setFont("Times-Bold", 36)
-c.drawCentredString(width/2, height/2 + 40, "Cahier d’étude du français")
+    # accent line
+    c.setStrokeColor(blue)
+    c.setLineWidth(3)
+    c.line(width/3, height/2 - 20, 2*width/3, height/2 - 20)
 
-# subtitle
-c.setFont("Times-Italic", 18)
-c.drawCentredString(width/2, height/2 - 5, "Apprendre, écouter, lire, progresser chaque jour")
+    c.showPage()
+    c.save()
+    hash_file.write_text(digest)
+    return True
 
-# accent line
-c.setStrokeColor(blue)
-c.setLineWidth(3)
-c.line(width/3, height/2 - 20, 2*width/3, height/2 - 20)
 
-c.showPage()
-c.save()
-print("✅  Page_de_couverture.pdf created!")
+if __name__ == "__main__":
+    if build_cover(TITLE, SUBTITLE, OUT_PATH):
+        print(f"✅  {OUT_PATH} created!")
+    else:
+        print(f"✅  {OUT_PATH} is up to date")
@@ -9,12 +9,76 @@ Provides:
 - Conflict detection
 """
 
+import argparse
+import heapq
 import json
+import os
+import secrets
+import sqlite3
 import sys
+from collections import deque
+from contextlib import contextmanager
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Optional
-import uuid
+from typing import Any, Dict, List, Optional
+
+try:
+    import fcntl
+except ImportError:  # Windows: byte-range locks via msvcrt instead
+    fcntl = None
+    import msvcrt
+
+try:
+    import orjson
+except ImportError:  # Optional speedup; stdlib json is used without it
+    orjson = None
+
+try:
+    import ijson
+except ImportError:  # Optional; single-task/stats reads parse the whole board without it
+    ijson = None
+
+
+def _dumps(obj: Any) -> bytes:
+    """Serialize to indented UTF-8 JSON bytes (orjson when installed)."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    return json.dumps(obj, indent=2).encode()
+
+
+def _json_line(obj: Any) -> bytes:
+    """Serialize to one compact JSONL line (orjson when installed)."""
+    if orjson is not None:
+        return orjson.dumps(obj) + b"\n"
+    return json.dumps(obj).encode() + b"\n"
+
+
+def _loads(data: bytes) -> Any:
+    """Parse JSON bytes (orjson when installed)."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+class _TaskColumns:
+    """
+    Column-wise view of a board's tasks for full scans.
+    
+    Parallel lists (one entry per task, in board order) replace repeated
+    per-task dict lookups of the same few keys; tasks[i] is the task dict
+    itself, returned to callers unchanged.
+    """
+    
+    __slots__ = ("tasks", "statuses", "assignees", "ranks", "created", "dependencies")
+    
+    def __init__(self, board: Dict, priority_order: Dict[str, int]):
+        self.tasks = list(board["tasks"].values())
+        self.statuses = [t["status"] for t in self.tasks]
+        self.assignees = [t["assigned_to"] for t in self.tasks]
+        default_rank = priority_order["normal"]
+        self.ranks = [priority_order.get(t["priority"], default_rank) for t in self.tasks]
+        self.created = [t["created_at"] for t in self.tasks]
+        self.dependencies = [t["dependencies"] for t in self.tasks]
 
 
 class JobBoard:
@@ -22,11 +86,23 @@ class JobBoard:
     
     VALID_STATUSES = ["open", "assigned", "in-progress", "review", "done", "blocked"]
     VALID_PRIORITIES = ["critical", "high", "normal", "low"]
+    # Sort rank per priority; unknown priorities rank as "normal"
+    PRIORITY_ORDER = {p: rank for rank, p in enumerate(VALID_PRIORITIES)}
+    # History entries kept inline per task; older ones move to history.log
+    HISTORY_CAP = 32
     
     def __init__(self, project_root: str = "."):
         self.project_root = Path(project_root).resolve()
         self.claude_dir = self.project_root / ".claude"
         self.board_path = self.claude_dir / "job-board.json"
+        self.history_log_path = self.claude_dir / "history.log"
+        self.lock_path = self.claude_dir / "job-board.lock"
+        # Parsed board plus the (inode, mtime_ns, size) it was read at; reused while
+        # the file on disk is unchanged.
+        self._cache = None
+        self._cache_stat = None
+        # (board, _TaskColumns) for the cached board; dropped on every save
+        self._columns = None
         
     def initialize(self):
         """Initialize empty job board."""
@@ -34,18 +110,17 @@ class JobBoard:
             "version": "1.0",
             "created_at": datetime.now().isoformat(),
             "tasks": {},
+            "by_agent": {},
+            "dependents": {},
             "stats": {
                 "total": 0,
-                "open": 0,
-                "in_progress": 0,
-                "done": 0
+                **{self._stat_key(status): 0 for status in self.VALID_STATUSES}
             }
         }
         
         self.claude_dir.mkdir(parents=True, exist_ok=True)
         
-        with open(self.board_path, 'w') as f:
-            json.dump(board, f, indent=2)
+        self._save_board(board)
         
         return {"status": "initialized", "path": str(self.board_path)}
     
@@ -58,10 +133,28 @@ class JobBoard:
         
         Returns:
             task_id
+        
+        Raises:
+            ValueError: If a dependency does not exist or the dependencies
+                form a cycle (the task could never become available)
         """
-        task_id = f"task-{str(uuid.uuid4())[:8]}"
+        with self._locked():
+            board = self._load_board()
+            task_id = self._create_task_inplace(board, title, description, priority,
+                                                dependencies, assigned_to, tags)
+            self._save_board(board)
         
-        board = self._load_board()
+        return task_id
+    
+    def _create_task_inplace(self, board: Dict, title: str, description: str,
+                             priority: str = "normal",
+                             dependencies: Optional[List[str]] = None,
+                             assigned_to: Optional[str] = None,
+                             tags: Optional[List[str]] = None) -> str:
+        """Add a task to an already-loaded board without saving it."""
+        task_id = f"task-{secrets.token_hex(4)}"
+        self._validate_dependencies(board, task_id, dependencies or [])
+        now = datetime.now().isoformat()
         
         board["tasks"][task_id] = {
             "id": task_id,
@@ -72,36 +165,50 @@ class JobBoard:
             "assigned_to": assigned_to,
             "dependencies": dependencies or [],
             "tags": tags or [],
-            "created_at": datetime.now().isoformat(),
-            "updated_at": datetime.now().isoformat(),
+            "created_at": now,
+            "updated_at": now,
             "started_at": None,
             "completed_at": None,
             "blocked_reason": None,
             "history": [
                 {
-                    "timestamp": datetime.now().isoformat(),
+                    "timestamp": now,
                     "action": "created",
                     "by": assigned_to or "system"
                 }
             ]
         }
         
-        board["stats"]["total"] += 1
-        board["stats"]["open"] += 0 if assigned_to else 1
+        if assigned_to:
+            board["by_agent"].setdefault(assigned_to, []).append(task_id)
+        for dep_id in dependencies or []:
+            board["dependents"].setdefault(dep_id, []).append(task_id)
         
-        self._save_board(board)
+        board["stats"]["total"] += 1
+        self._transition(board["stats"], None, board["tasks"][task_id]["status"])
         
         return task_id
     
     def assign_task(self, task_id: str, agent_id: str) -> Dict:
         """Assign a task to an agent."""
-        board = self._load_board()
-        
+        with self._locked():
+            board = self._load_board()
+            result = self._assign_task_inplace(board, task_id, agent_id)
+            if "success" in result and not result.get("noop"):
+                self._save_board(board)
+        return result
+    
+    def _assign_task_inplace(self, board: Dict, task_id: str, agent_id: str) -> Dict:
+        """Assign a task on an already-loaded board without saving it."""
         if task_id not in board["tasks"]:
             return {"error": "Task not found"}
         
         task = board["tasks"][task_id]
         
+        # Already assigned to this agent: nothing to change or save
+        if task["assigned_to"] == agent_id and task["status"] == "assigned":
+            return {"success": True, "task": task, "noop": True}
+        
         # Check if task is already assigned
         if task["assigned_to"] and task["assigned_to"] != agent_id:
             return {
@@ -118,113 +225,264 @@ class JobBoard:
             }
         
         # Update task
+        now = datetime.now().isoformat()
         old_status = task["status"]
+        if task["assigned_to"] != agent_id:
+            self._index_assignee(board, task_id, task["assigned_to"], agent_id)
         task["assigned_to"] = agent_id
         task["status"] = "assigned"
-        task["updated_at"] = datetime.now().isoformat()
+        task["updated_at"] = now
         
-        task["history"].append({
-            "timestamp": datetime.now().isoformat(),
+        self._append_history(task, {
+            "timestamp": now,
             "action": "assigned",
             "by": agent_id
         })
         
-        # Update stats
-        if old_status == "open":
-            board["stats"]["open"] -= 1
-        
-        self._save_board(board)
+        self._transition(board["stats"], old_status, "assigned")
         
         return {"success": True, "task": task}
     
     def update_status(self, task_id: str, new_status: str, agent_id: str,
                      blocked_reason: Optional[str] = None) -> Dict:
         """Update task status."""
+        with self._locked():
+            board = self._load_board()
+            result = self._update_status_inplace(board, task_id, new_status, agent_id,
+                                                 blocked_reason)
+            if "success" in result and not result.get("noop"):
+                self._save_board(board)
+        return result
+    
+    def _update_status_inplace(self, board: Dict, task_id: str, new_status: str,
+                               agent_id: str,
+                               blocked_reason: Optional[str] = None) -> Dict:
+        """Update task status on an already-loaded board without saving it."""
         if new_status not in self.VALID_STATUSES:
             return {"error": f"Invalid status: {new_status}"}
         
-        board = self._load_board()
-        
         if task_id not in board["tasks"]:
             return {"error": "Task not found"}
         
         task = board["tasks"][task_id]
+        if self._is_noop_update(task["status"], task["blocked_reason"],
+                                new_status, blocked_reason):
+            return {"success": True, "task": task, "noop": True}
+        
         old_status = task["status"]
+        now = datetime.now().isoformat()
         
         task["status"] = new_status
-        task["updated_at"] = datetime.now().isoformat()
+        task["updated_at"] = now
         
         if new_status == "in-progress" and not task["started_at"]:
-            task["started_at"] = datetime.now().isoformat()
+            task["started_at"] = now
         
         if new_status == "done":
-            task["completed_at"] = datetime.now().isoformat()
-            board["stats"]["done"] += 1
-            if old_status == "in-progress":
-                board["stats"]["in_progress"] -= 1
+            task["completed_at"] = now
         
-        if new_status == "in-progress" and old_status != "in-progress":
-            board["stats"]["in_progress"] += 1
+        self._transition(board["stats"], old_status, new_status)
         
         if new_status == "blocked":
             task["blocked_reason"] = blocked_reason
         
-        task["history"].append({
-            "timestamp": datetime.now().isoformat(),
+        self._append_history(task, {
+            "timestamp": now,
             "action": f"status_change: {old_status} -> {new_status}",
             "by": agent_id,
             "reason": blocked_reason if blocked_reason else None
         })
         
-        self._save_board(board)
+        result = {"success": True, "task": task}
+        if new_status == "done" and old_status != "done":
+            result["unblocked"] = self._unblocked_by(board, task_id)
         
-        return {"success": True, "task": task}
+        return result
+    
+    def run_batch(self, ops: List[Dict]) -> List[Dict]:
+        """
+        Apply a sequence of operations with a single load and a single save.
+        
+        Each op is a dict with an "op" key ("create", "assign" or "update")
+        plus the keyword arguments of the matching method, e.g.
+        {"op": "update", "task_id": "task-1234abcd", "new_status": "done",
+        "agent_id": "backend-dev"}.
+        
+        Returns:
+            One result dict per op, in order
+        """
+        with self._locked():
+            board = self._load_board()
+            results = self._apply_ops(board, ops)
+            self._save_board(board)
+        
+        return results
     
-    def get_available_tasks(self, agent_id: Optional[str] = None) -> List[Dict]:
-        """Get tasks available for work."""
+    def _apply_ops(self, board: Dict, ops: List[Dict]) -> List[Dict]:
+        """Run batch ops against an already-loaded board without saving it."""
+        results = []
+        
+        for op in ops:
+            args = dict(op)
+            name = args.pop("op", None)
+            try:
+                if name == "create":
+                    results.append({"task_id": self._create_task_inplace(board, **args)})
+                elif name == "assign":
+                    results.append(self._assign_task_inplace(board, **args))
+                elif name == "update":
+                    results.append(self._update_status_inplace(board, **args))
+                else:
+                    results.append({"error": f"Unknown op: {name}"})
+            except TypeError as e:
+                results.append({"error": f"Bad arguments for {name}: {e}"})
+            except ValueError as e:
+                results.append({"error": str(e)})
+        
+        return results
+    
+    def get_available_tasks(self, agent_id: Optional[str] = None,
+                            limit: Optional[int] = None) -> List[Dict]:
+        """
+        Get tasks available for work, highest priority (then oldest) first.
+        
+        Args:
+            agent_id: Include tasks assigned to this agent
+            limit: Only return the top `limit` tasks
+        """
         board = self._load_board()
+        cols = self._task_columns(board)
+        
+        # Missing dependencies are never in done_ids, so one set lookup per
+        # edge covers both "not done" and "doesn't exist".
+        done_ids = {tid for tid, status in zip(board["tasks"], cols.statuses)
+                    if status == "done"}
         
+        # (rank, created_at, position): position breaks ties so equal keys
+        # keep board order.
         available = []
-        for task in board["tasks"].values():
+        for i, (status, assignee) in enumerate(zip(cols.statuses, cols.assignees)):
             # Must be open or assigned to this agent
-            if task["status"] in ["open", "assigned"]:
-                # Check if assigned to someone else
-                if task["assigned_to"] and task["assigned_to"] != agent_id:
-                    continue
-                
-                # Check dependencies
-                unmet_deps = self._check_dependencies(board, task["id"])
-                if not unmet_deps:
-                    available.append(task)
-        
-        # Sort by priority
-        priority_order = {"critical": 0, "high": 1, "normal": 2, "low": 3}
-        available.sort(key=lambda t: priority_order.get(t["priority"], 2))
-        
-        return available
+            if status != "open" and status != "assigned":
+                continue
+            # Check if assigned to someone else
+            if assignee and assignee != agent_id:
+                continue
+            # Check dependencies
+            if all(dep_id in done_ids for dep_id in cols.dependencies[i]):
+                available.append((cols.ranks[i], cols.created[i], i))
+        
+        if limit is not None:
+            ranked = heapq.nsmallest(limit, available)
+        else:
+            ranked = sorted(available)
+        
+        return [cols.tasks[i] for _, _, i in ranked]
+    
+    def tasks_unblocked_by(self, task_id: str) -> List[str]:
+        """IDs of unfinished tasks that depend on task_id and have no unmet dependencies."""
+        return self._unblocked_by(self._load_board(), task_id)
+    
+    def _unblocked_by(self, board: Dict, task_id: str) -> List[str]:
+        """Walk only task_id's dependents, via the reverse dependency index."""
+        tasks = board["tasks"]
+        unblocked = []
+        for dependent_id in board["dependents"].get(task_id, []):
+            dependent = tasks.get(dependent_id)
+            if dependent is None or dependent["status"] == "done":
+                continue
+            if all(dep_id in tasks and tasks[dep_id]["status"] == "done"
+                   for dep_id in dependent["dependencies"]):
+                unblocked.append(dependent_id)
+        return unblocked
     
     def get_task(self, task_id: str) -> Optional[Dict]:
         """Get a specific task."""
+        if self._should_stream():
+            with open(self.board_path, 'rb') as f:
+                return next(ijson.items(f, f"tasks.{task_id}", use_float=True), None)
+        
         board = self._load_board()
         return board["tasks"].get(task_id)
     
     def get_agent_tasks(self, agent_id: str, status_filter: Optional[str] = None) -> List[Dict]:
         """Get all tasks for an agent."""
         board = self._load_board()
+        all_tasks = board["tasks"]
         
         tasks = []
-        for task in board["tasks"].values():
-            if task["assigned_to"] == agent_id:
-                if status_filter is None or task["status"] == status_filter:
-                    tasks.append(task)
+        for task_id in board["by_agent"].get(agent_id, []):
+            task = all_tasks[task_id]
+            if status_filter is None or task["status"] == status_filter:
+                tasks.append(task)
         
         return tasks
     
     def get_stats(self) -> Dict:
         """Get board statistics."""
+        if self._should_stream():
+            with open(self.board_path, 'rb') as f:
+                stats = dict(ijson.kvitems(f, "stats", use_float=True))
+            # Boards from before per-status counters need the full load to recount
+            if all(self._stat_key(status) in stats for status in self.VALID_STATUSES):
+                return stats
+        
         board = self._load_board()
         return board["stats"]
     
+    def _append_history(self, task: Dict, entry: Dict):
+        """
+        Append a history entry, keeping only the newest HISTORY_CAP inline.
+        
+        Overflowed entries are appended to history.log as JSONL (tagged with
+        the task id) so the full trail survives without bloating the board.
+        """
+        history = task["history"]
+        history.append(entry)
+        overflow = len(history) - self.HISTORY_CAP
+        if overflow <= 0:
+            return
+        
+        with open(self.history_log_path, 'ab') as f:
+            f.write(b"".join(
+                _json_line({"task_id": task["id"], **old}) for old in history[:overflow]
+            ))
+        del history[:overflow]
+    
+    @staticmethod
+    def _is_noop_update(old_status: str, old_reason: Optional[str],
+                        new_status: str, blocked_reason: Optional[str]) -> bool:
+        """
+        Whether a status update would change nothing (e.g. a polling agent
+        re-reporting its status). blocked_reason only matters for "blocked",
+        the one status that stores it.
+        """
+        if new_status != old_status:
+            return False
+        return new_status != "blocked" or blocked_reason == old_reason
+    
+    @staticmethod
+    def _stat_key(status: str) -> str:
+        """Stats key for a status ("in-progress" is counted as "in_progress")."""
+        return status.replace("-", "_")
+    
+    @classmethod
+    def _transition(cls, stats: Dict, old: Optional[str], new: Optional[str]):
+        """
+        Move one task's count from status `old` to status `new` in `stats`.
+        
+        Either side may be None (task created / removed). Keeping every
+        status count in step here lets get_stats stay a plain lookup.
+        """
+        if old == new:
+            return
+        if old:
+            key = cls._stat_key(old)
+            stats[key] = stats.get(key, 0) - 1
+        if new:
+            key = cls._stat_key(new)
+            stats[key] = stats.get(key, 0) + 1
+    
     def _check_dependencies(self, board: Dict, task_id: str) -> List[str]:
         """Check if task dependencies are met."""
         task = board["tasks"][task_id]
@@ -240,64 +498,652 @@ class JobBoard:
         
         return unmet
     
+    @staticmethod
+    def _validate_dependencies(board: Dict, task_id: str, dependencies: List[str]):
+        """
+        Reject dependencies that are missing or would leave task_id in a cycle.
+        
+        Runs Kahn's algorithm over task_id plus everything it transitively
+        depends on: any node never reaching in-degree zero sits on (or behind)
+        a cycle.
+        
+        Raises:
+            ValueError: Describing the missing dependencies or the cycle
+        """
+        tasks = board["tasks"]
+        missing = [dep_id for dep_id in dependencies if dep_id not in tasks]
+        if missing:
+            raise ValueError(f"Unknown dependencies: {', '.join(missing)}")
+        
+        # Subgraph reachable from the new task; dangling ids on older tasks
+        # are unmet, not cyclic, so they are left out.
+        deps_of = {task_id: list(dependencies)}
+        stack = list(dependencies)
+        while stack:
+            node = stack.pop()
+            if node in deps_of:
+                continue
+            deps_of[node] = [d for d in tasks[node]["dependencies"] if d in tasks]
+            stack.extend(deps_of[node])
+        
+        in_degree = {node: len(deps) for node, deps in deps_of.items()}
+        dependents = {}
+        for node, deps in deps_of.items():
+            for dep_id in deps:
+                dependents.setdefault(dep_id, []).append(node)
+        
+        queue = deque(node for node, degree in in_degree.items() if degree == 0)
+        while queue:
+            node = queue.popleft()
+            for dependent_id in dependents.get(node, ()):
+                in_degree[dependent_id] -= 1
+                if in_degree[dependent_id] == 0:
+                    queue.append(dependent_id)
+        
+        stuck = sorted(node for node, degree in in_degree.items()
+                       if degree > 0 and node != task_id)
+        if stuck:
+            raise ValueError(f"Dependency cycle involving: {', '.join(stuck)}")
+    
+    @staticmethod
+    def _index_assignee(board: Dict, task_id: str, old: Optional[str], new: Optional[str]):
+        """Move task_id between agents' lists in the by_agent index."""
+        by_agent = board["by_agent"]
+        if old and task_id in by_agent.get(old, ()):
+            by_agent[old].remove(task_id)
+            if not by_agent[old]:
+                del by_agent[old]
+        if new:
+            by_agent.setdefault(new, []).append(task_id)
+    
+    @classmethod
+    def _ensure_indexes(cls, board: Dict):
+        """Build the derived indexes and counters on boards saved before they existed."""
+        if "by_agent" not in board:
+            by_agent = {}
+            for task_id, task in board["tasks"].items():
+                if task["assigned_to"]:
+                    by_agent.setdefault(task["assigned_to"], []).append(task_id)
+            board["by_agent"] = by_agent
+        if "dependents" not in board:
+            dependents = {}
+            for task_id, task in board["tasks"].items():
+                for dep_id in task["dependencies"]:
+                    dependents.setdefault(dep_id, []).append(task_id)
+            board["dependents"] = dependents
+        stats = board.get("stats", {})
+        if any(cls._stat_key(status) not in stats for status in cls.VALID_STATUSES):
+            # Older boards only counted some statuses, and not consistently:
+            # recount so _transition starts from true per-status totals
+            stats = {"total": len(board["tasks"]),
+                     **{cls._stat_key(status): 0 for status in cls.VALID_STATUSES}}
+            for task in board["tasks"].values():
+                cls._transition(stats, None, task["status"])
+            board["stats"] = stats
+    
+    def _task_columns(self, board: Dict) -> _TaskColumns:
+        """Column view of board, rebuilt only after the board changes."""
+        if self._columns is None or self._columns[0] is not board:
+            self._columns = (board, _TaskColumns(board, self.PRIORITY_ORDER))
+        return self._columns[1]
+    
+    @contextmanager
+    def _locked(self):
+        """
+        Hold an exclusive advisory lock for a load-modify-save cycle.
+        
+        Locks a sibling lock file rather than the board itself, since saves
+        replace the board file (and its inode). Not reentrant.
+        """
+        self.claude_dir.mkdir(parents=True, exist_ok=True)
+        fd = os.open(self.lock_path, os.O_RDWR | os.O_CREAT)
+        try:
+            if fcntl is not None:
+                fcntl.flock(fd, fcntl.LOCK_EX)
+            else:
+                msvcrt.locking(fd, msvcrt.LK_LOCK, 1)
+            try:
+                yield
+            finally:
+                if fcntl is not None:
+                    fcntl.flock(fd, fcntl.LOCK_UN)
+                else:
+                    os.lseek(fd, 0, os.SEEK_SET)
+                    msvcrt.locking(fd, msvcrt.LK_UNLCK, 1)
+        finally:
+            os.close(fd)
+    
     def _load_board(self) -> Dict:
-        """Load job board from file."""
+        """Load job board from file, reusing the cached copy if it is unchanged.
+        
+        The returned dict is shared with the cache: callers that modify it
+        must pass it to _save_board (or drop it) rather than keep it dirty.
+        """
         if not self.board_path.exists():
             self.initialize()
         
-        with open(self.board_path) as f:
-            return json.load(f)
+        stat_key = self._file_stat_key()
+        if self._cache is not None and stat_key == self._cache_stat:
+            return self._cache
+        
+        board = _loads(self.board_path.read_bytes())
+        self._ensure_indexes(board)
+        self._cache = board
+        self._cache_stat = stat_key
+        return board
+    
+    def _file_stat_key(self) -> tuple:
+        """(inode, mtime_ns, size) of the board file, the cache validity key."""
+        st = self.board_path.stat()
+        return (st.st_ino, st.st_mtime_ns, st.st_size)
+    
+    def _should_stream(self) -> bool:
+        """
+        Whether a small read should stream-parse the file with ijson.
+        
+        Only when ijson is installed and there is no up-to-date cached board;
+        a warm cache answers faster than any parse.
+        """
+        if ijson is None or not self.board_path.exists():
+            return False
+        return self._cache is None or self._file_stat_key() != self._cache_stat
     
     def _save_board(self, board: Dict):
-        """Save job board to file."""
-        with open(self.board_path, 'w') as f:
-            json.dump(board, f, indent=2)
+        """
+        Save job board to file and keep it as the cached copy.
+        
+        Writes a sibling temp file and renames it over the board, so a crash
+        mid-write leaves the previous board intact rather than a truncated one.
+        """
+        tmp_path = self.board_path.with_suffix(".json.tmp")
+        with open(tmp_path, 'wb') as f:
+            f.write(_dumps(board))
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, self.board_path)
+        self._columns = None
+        self._cache = board
+        self._cache_stat = self._file_stat_key()
 
 
-def main():
-    """CLI entry point."""
-    if len(sys.argv) < 2:
-        print("Usage: python create_job_board.py <command> [args...]")
-        print("Commands: init, create, assign, update, list, get")
-        sys.exit(1)
+class SQLiteJobBoard:
+    """
+    Job board stored in SQLite (.claude/job-board.db) instead of JSON.
+    
+    Same public methods and task dict shape as JobBoard, but each query reads
+    only the matching rows (indexed on status, assignee and dependency edges)
+    and each write is a single BEGIN IMMEDIATE transaction, so there is no
+    whole-file rewrite and no separate file lock. JobBoard remains the
+    default because agents read .claude/job-board.json directly.
+    """
+    
+    VALID_STATUSES = JobBoard.VALID_STATUSES
+    VALID_PRIORITIES = JobBoard.VALID_PRIORITIES
+    PRIORITY_ORDER = JobBoard.PRIORITY_ORDER
+    # Ids per IN (...) query, well under SQLite's bound-parameter limit
+    IN_CHUNK = 500
+    
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS tasks (
+            id TEXT PRIMARY KEY,
+            title TEXT NOT NULL,
+            description TEXT,
+            status TEXT NOT NULL,
+            priority TEXT NOT NULL,
+            assigned_to TEXT,
+            tags TEXT NOT NULL DEFAULT '[]',
+            created_at TEXT NOT NULL,
+            updated_at TEXT NOT NULL,
+            started_at TEXT,
+            completed_at TEXT,
+            blocked_reason TEXT
+        );
+        CREATE TABLE IF NOT EXISTS dependencies (
+            task_id TEXT NOT NULL,
+            dep_id TEXT NOT NULL,
+            PRIMARY KEY (task_id, dep_id)
+        );
+        CREATE TABLE IF NOT EXISTS history (
+            id INTEGER PRIMARY KEY,
+            task_id TEXT NOT NULL,
+            timestamp TEXT NOT NULL,
+            action TEXT NOT NULL,
+            by_agent TEXT,
+            reason TEXT
+        );
+        CREATE INDEX IF NOT EXISTS idx_tasks_status ON tasks(status);
+        CREATE INDEX IF NOT EXISTS idx_tasks_assigned ON tasks(assigned_to, status);
+        CREATE INDEX IF NOT EXISTS idx_tasks_priority_status ON tasks(priority, status);
+        CREATE INDEX IF NOT EXISTS idx_dependencies_dep ON dependencies(dep_id);
+        CREATE INDEX IF NOT EXISTS idx_history_task ON history(task_id, id);
+    """
     
-    command = sys.argv[1]
-    board = JobBoard()
+    # Sort rank per priority for ORDER BY; unknown priorities rank as "normal"
+    RANK_SQL = "CASE priority {} ELSE {} END".format(
+        " ".join(f"WHEN '{p}' THEN {rank}" for p, rank in PRIORITY_ORDER.items()),
+        PRIORITY_ORDER["normal"],
+    )
     
-    if command == "init":
-        result = board.initialize()
-        print(json.dumps(result, indent=2))
+    # True when task {task} still waits on a dependency (missing counts too)
+    UNMET_DEPS_SQL = """
+        SELECT 1 FROM dependencies d
+        LEFT JOIN tasks p ON p.id = d.dep_id
+        WHERE d.task_id = {task} AND (p.status IS NULL OR p.status <> 'done')
+    """
     
-    elif command == "create":
-        if len(sys.argv) < 4:
-            print("Usage: create <title> <description> [priority] [assigned_to]")
-            sys.exit(1)
+    def __init__(self, project_root: str = "."):
+        self.project_root = Path(project_root).resolve()
+        self.claude_dir = self.project_root / ".claude"
+        self.db_path = self.claude_dir / "job-board.db"
+        self._conn = None
+    
+    def _get_connection(self) -> sqlite3.Connection:
+        """Open (once) and configure the database, creating the schema."""
+        if self._conn is None:
+            self.claude_dir.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(str(self.db_path), timeout=10.0)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute("PRAGMA busy_timeout=10000")
+            conn.row_factory = sqlite3.Row
+            conn.executescript(self.SCHEMA)
+            self._conn = conn
+        return self._conn
+    
+    @contextmanager
+    def _transaction(self):
+        """Write transaction; BEGIN IMMEDIATE serializes concurrent writers."""
+        conn = self._get_connection()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            yield conn
+            conn.commit()
+        except Exception:
+            conn.rollback()
+            raise
+    
+    def initialize(self):
+        """Create the database and schema if missing."""
+        self._get_connection()
+        return {"status": "initialized", "path": str(self.db_path)}
+    
+    def create_task(self, title: str, description: str, priority: str = "normal",
+                   dependencies: Optional[List[str]] = None,
+                   assigned_to: Optional[str] = None,
+                   tags: Optional[List[str]] = None) -> str:
+        """
+        Create a new task.
+        
+        Returns:
+            task_id
+        
+        Raises:
+            ValueError: If a dependency does not exist
+        """
+        with self._transaction() as conn:
+            return self._create_task_inplace(conn, title, description, priority,
+                                             dependencies, assigned_to, tags)
+    
+    def _create_task_inplace(self, conn: sqlite3.Connection, title: str, description: str,
+                             priority: str = "normal",
+                             dependencies: Optional[List[str]] = None,
+                             assigned_to: Optional[str] = None,
+                             tags: Optional[List[str]] = None) -> str:
+        """Insert a task inside the caller's transaction."""
+        dependencies = dependencies or []
+        # Edges only ever point at tasks that already exist, so checking
+        # existence is enough to rule out cycles here.
+        known = set(self._existing_ids(conn, dependencies))
+        missing = [dep_id for dep_id in dependencies if dep_id not in known]
+        if missing:
+            raise ValueError(f"Unknown dependencies: {', '.join(missing)}")
+        
+        task_id = f"task-{secrets.token_hex(4)}"
+        now = datetime.now().isoformat()
+        
+        conn.execute("""
+            INSERT INTO tasks (id, title, description, status, priority,
+                               assigned_to, tags, created_at, updated_at)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+        """, (task_id, title, description, "assigned" if assigned_to else "open",
+              priority, assigned_to, json.dumps(tags or []), now, now))
+        conn.executemany(
+            "INSERT OR IGNORE INTO dependencies (task_id, dep_id) VALUES (?, ?)",
+            [(task_id, dep_id) for dep_id in dependencies]
+        )
+        self._add_history(conn, task_id, now, "created", assigned_to or "system")
+        
+        return task_id
+    
+    def assign_task(self, task_id: str, agent_id: str) -> Dict:
+        """Assign a task to an agent."""
+        with self._transaction() as conn:
+            return self._assign_task_inplace(conn, task_id, agent_id)
+    
+    def _assign_task_inplace(self, conn: sqlite3.Connection, task_id: str,
+                             agent_id: str) -> Dict:
+        """Assign a task inside the caller's transaction."""
+        row = conn.execute(
+            "SELECT assigned_to, status FROM tasks WHERE id = ?", (task_id,)
+        ).fetchone()
+        if row is None:
+            return {"error": "Task not found"}
+        
+        if row["assigned_to"] == agent_id and row["status"] == "assigned":
+            return {"success": True, "task": self._fetch_task(conn, task_id), "noop": True}
+        
+        if row["assigned_to"] and row["assigned_to"] != agent_id:
+            return {
+                "error": "Task already assigned",
+                "assigned_to": row["assigned_to"]
+            }
+        
+        unmet_deps = self._unmet_dependencies(conn, task_id)
+        if unmet_deps:
+            return {
+                "error": "Unmet dependencies",
+                "dependencies": unmet_deps
+            }
+        
+        now = datetime.now().isoformat()
+        conn.execute("""
+            UPDATE tasks SET assigned_to = ?, status = 'assigned', updated_at = ?
+            WHERE id = ?
+        """, (agent_id, now, task_id))
+        self._add_history(conn, task_id, now, "assigned", agent_id)
+        
+        return {"success": True, "task": self._fetch_task(conn, task_id)}
+    
+    def update_status(self, task_id: str, new_status: str, agent_id: str,
+                     blocked_reason: Optional[str] = None) -> Dict:
+        """Update task status."""
+        with self._transaction() as conn:
+            return self._update_status_inplace(conn, task_id, new_status, agent_id,
+                                               blocked_reason)
+    
+    def _update_status_inplace(self, conn: sqlite3.Connection, task_id: str,
+                               new_status: str, agent_id: str,
+                               blocked_reason: Optional[str] = None) -> Dict:
+        """Update task status inside the caller's transaction."""
+        if new_status not in self.VALID_STATUSES:
+            return {"error": f"Invalid status: {new_status}"}
+        
+        row = conn.execute(
+            "SELECT status, blocked_reason FROM tasks WHERE id = ?", (task_id,)
+        ).fetchone()
+        if row is None:
+            return {"error": "Task not found"}
+        
+        if JobBoard._is_noop_update(row["status"], row["blocked_reason"],
+                                    new_status, blocked_reason):
+            return {"success": True, "task": self._fetch_task(conn, task_id), "noop": True}
         
-        title = sys.argv[2]
-        description = sys.argv[3]
-        priority = sys.argv[4] if len(sys.argv) > 4 else "normal"
-        assigned_to = sys.argv[5] if len(sys.argv) > 5 else None
+        old_status = row["status"]
+        now = datetime.now().isoformat()
         
-        task_id = board.create_task(title, description, priority, assigned_to=assigned_to)
-        print(json.dumps({"task_id": task_id}, indent=2))
+        conn.execute("""
+            UPDATE tasks SET
+                status = :status,
+                updated_at = :now,
+                started_at = CASE WHEN :status = 'in-progress' AND started_at IS NULL
+                                  THEN :now ELSE started_at END,
+                completed_at = CASE WHEN :status = 'done' THEN :now ELSE completed_at END,
+                blocked_reason = CASE WHEN :status = 'blocked'
+                                      THEN :reason ELSE blocked_reason END
+            WHERE id = :id
+        """, {"status": new_status, "now": now, "reason": blocked_reason, "id": task_id})
+        self._add_history(conn, task_id, now,
+                          f"status_change: {old_status} -> {new_status}",
+                          agent_id, blocked_reason if blocked_reason else None)
+        
+        result = {"success": True, "task": self._fetch_task(conn, task_id)}
+        if new_status == "done" and old_status != "done":
+            result["unblocked"] = self._unblocked_by(conn, task_id)
+        
+        return result
+    
+    def run_batch(self, ops: List[Dict]) -> List[Dict]:
+        """
+        Apply a sequence of operations (see JobBoard.run_batch) in one transaction.
+        
+        Returns:
+            One result dict per op, in order
+        """
+        with self._transaction() as conn:
+            return self._apply_ops(conn, ops)
+    
+    # Same dispatch as JobBoard; the "board" it threads through is the
+    # connection, which the _*_inplace methods above take instead.
+    _apply_ops = JobBoard._apply_ops
+    
+    def get_available_tasks(self, agent_id: Optional[str] = None,
+                            limit: Optional[int] = None) -> List[Dict]:
+        """
+        Get tasks available for work, highest priority (then oldest) first.
+        
+        Args:
+            agent_id: Include tasks assigned to this agent
+            limit: Only return the top `limit` tasks
+        """
+        conn = self._get_connection()
+        rows = conn.execute(f"""
+            SELECT * FROM tasks t
+            WHERE t.status IN ('open', 'assigned')
+              AND (t.assigned_to IS NULL OR t.assigned_to = '' OR t.assigned_to = ?)
+              AND NOT EXISTS ({self.UNMET_DEPS_SQL.format(task="t.id")})
+            ORDER BY {self.RANK_SQL}, t.created_at, t.rowid
+            LIMIT ?
+        """, (agent_id, -1 if limit is None else limit)).fetchall()
+        return self._task_dicts(conn, rows)
+    
+    def tasks_unblocked_by(self, task_id: str) -> List[str]:
+        """IDs of unfinished tasks that depend on task_id and have no unmet dependencies."""
+        return self._unblocked_by(self._get_connection(), task_id)
     
-    elif command == "list":
-        agent_id = sys.argv[2] if len(sys.argv) > 2 else None
-        tasks = board.get_available_tasks(agent_id)
-        print(json.dumps(tasks, indent=2))
+    def _unblocked_by(self, conn: sqlite3.Connection, task_id: str) -> List[str]:
+        """Walk only task_id's dependents, via the dep_id index."""
+        rows = conn.execute(f"""
+            SELECT t.id FROM dependencies e
+            JOIN tasks t ON t.id = e.task_id
+            WHERE e.dep_id = ? AND t.status <> 'done'
+              AND NOT EXISTS ({self.UNMET_DEPS_SQL.format(task="t.id")})
+            ORDER BY e.rowid
+        """, (task_id,))
+        return [row[0] for row in rows]
     
-    elif command == "get":
-        task_id = sys.argv[2]
-        task = board.get_task(task_id)
-        print(json.dumps(task, indent=2))
+    def get_task(self, task_id: str) -> Optional[Dict]:
+        """Get a specific task."""
+        return self._fetch_task(self._get_connection(), task_id)
     
-    elif command == "stats":
-        stats = board.get_stats()
-        print(json.dumps(stats, indent=2))
+    def get_agent_tasks(self, agent_id: str, status_filter: Optional[str] = None) -> List[Dict]:
+        """Get all tasks for an agent."""
+        conn = self._get_connection()
+        if status_filter is None:
+            rows = conn.execute(
+                "SELECT * FROM tasks WHERE assigned_to = ? ORDER BY rowid", (agent_id,)
+            ).fetchall()
+        else:
+            rows = conn.execute(
+                "SELECT * FROM tasks WHERE assigned_to = ? AND status = ? ORDER BY rowid",
+                (agent_id, status_filter)
+            ).fetchall()
+        return self._task_dicts(conn, rows)
     
-    else:
-        print(f"Unknown command: {command}")
+    def get_stats(self) -> Dict:
+        """Get board statistics (counted from the status index)."""
+        stats = {"total": 0}
+        stats.update((JobBoard._stat_key(status), 0) for status in self.VALID_STATUSES)
+        
+        rows = self._get_connection().execute(
+            "SELECT status, COUNT(*) FROM tasks GROUP BY status"
+        )
+        for status, count in rows:
+            stats[JobBoard._stat_key(status)] = count
+            stats["total"] += count
+        
+        return stats
+    
+    def _existing_ids(self, conn: sqlite3.Connection, task_ids: List[str]) -> List[str]:
+        """The subset of task_ids present in the tasks table."""
+        found = []
+        for start in range(0, len(task_ids), self.IN_CHUNK):
+            chunk = task_ids[start:start + self.IN_CHUNK]
+            placeholders = ",".join("?" * len(chunk))
+            found.extend(row[0] for row in conn.execute(
+                f"SELECT id FROM tasks WHERE id IN ({placeholders})", chunk
+            ))
+        return found
+    
+    def _unmet_dependencies(self, conn: sqlite3.Connection, task_id: str) -> List[str]:
+        """Dependencies of task_id that are missing or not done."""
+        rows = conn.execute("""
+            SELECT d.dep_id FROM dependencies d
+            LEFT JOIN tasks p ON p.id = d.dep_id
+            WHERE d.task_id = ? AND (p.status IS NULL OR p.status <> 'done')
+            ORDER BY d.rowid
+        """, (task_id,))
+        return [row[0] for row in rows]
+    
+    @staticmethod
+    def _add_history(conn: sqlite3.Connection, task_id: str, timestamp: str,
+                     action: str, by: str, reason: Optional[str] = None):
+        """Append one history row."""
+        conn.execute("""
+            INSERT INTO history (task_id, timestamp, action, by_agent, reason)
+            VALUES (?, ?, ?, ?, ?)
+        """, (task_id, timestamp, action, by, reason))
+    
+    def _fetch_task(self, conn: sqlite3.Connection, task_id: str) -> Optional[Dict]:
+        """One task as a dict, or None."""
+        rows = conn.execute("SELECT * FROM tasks WHERE id = ?", (task_id,)).fetchall()
+        tasks = self._task_dicts(conn, rows)
+        return tasks[0] if tasks else None
+    
+    def _task_dicts(self, conn: sqlite3.Connection, rows: List[sqlite3.Row]) -> List[Dict]:
+        """
+        Build JobBoard-shaped task dicts for rows, keeping their order.
+        
+        Dependencies and history for all rows are fetched with one IN query
+        per chunk rather than one query per task.
+        """
+        ids = [row["id"] for row in rows]
+        dependencies = {}
+        history = {}
+        for start in range(0, len(ids), self.IN_CHUNK):
+            chunk = ids[start:start + self.IN_CHUNK]
+            placeholders = ",".join("?" * len(chunk))
+            for task_id, dep_id in conn.execute(
+                f"SELECT task_id, dep_id FROM dependencies "
+                f"WHERE task_id IN ({placeholders}) ORDER BY rowid", chunk
+            ):
+                dependencies.setdefault(task_id, []).append(dep_id)
+            for entry in conn.execute(
+                f"SELECT * FROM history WHERE task_id IN ({placeholders}) ORDER BY id", chunk
+            ):
+                item = {
+                    "timestamp": entry["timestamp"],
+                    "action": entry["action"],
+                    "by": entry["by_agent"]
+                }
+                if entry["action"].startswith("status_change"):
+                    item["reason"] = entry["reason"]
+                history.setdefault(entry["task_id"], []).append(item)
+        
+        return [{
+            "id": row["id"],
+            "title": row["title"],
+            "description": row["description"],
+            "status": row["status"],
+            "priority": row["priority"],
+            "assigned_to": row["assigned_to"],
+            "dependencies": dependencies.get(row["id"], []),
+            "tags": json.loads(row["tags"]),
+            "created_at": row["created_at"],
+            "updated_at": row["updated_at"],
+            "started_at": row["started_at"],
+            "completed_at": row["completed_at"],
+            "blocked_reason": row["blocked_reason"],
+            "history": history.get(row["id"], [])
+        } for row in rows]
+
+
+def _read_ops(path: str) -> List[Dict]:
+    """Batch ops from a JSONL file, one op per non-blank line."""
+    with open(path) as f:
+        return [json.loads(line) for line in f if line.strip()]
+
+
+# Subcommand -> handler(args, board); each returns the JSON-printable result
+COMMANDS = {
+    "init": lambda args, board: board.initialize(),
+    "create": lambda args, board: {"task_id": board.create_task(
+        args.title, args.description, args.priority, dependencies=args.depends,
+        assigned_to=args.assigned_to, tags=args.tags)},
+    "assign": lambda args, board: board.assign_task(args.task_id, args.agent_id),
+    "update": lambda args, board: board.update_status(
+        args.task_id, args.status, args.agent_id, args.reason),
+    "list": lambda args, board: board.get_available_tasks(args.agent_id, limit=args.limit),
+    "get": lambda args, board: board.get_task(args.task_id),
+    "stats": lambda args, board: board.get_stats(),
+    "batch": lambda args, board: board.run_batch(_read_ops(args.file)),
+}
+
+
+def _build_parser() -> argparse.ArgumentParser:
+    """Argument parser with one subcommand per COMMANDS entry."""
+    parser = argparse.ArgumentParser(description="Job board for multi-agent task coordination")
+    parser.add_argument("--sqlite", action="store_true",
+                        help="Use .claude/job-board.db instead of job-board.json")
+    sub = parser.add_subparsers(dest="command", required=True)
+    
+    sub.add_parser("init", help="Create an empty board")
+    
+    create = sub.add_parser("create", help="Create a task")
+    create.add_argument("title")
+    create.add_argument("description")
+    create.add_argument("priority", nargs="?", default="normal",
+                        choices=JobBoard.VALID_PRIORITIES)
+    create.add_argument("assigned_to", nargs="?")
+    create.add_argument("--depends", nargs="+", metavar="TASK_ID", help="Dependency task ids")
+    create.add_argument("--tags", nargs="+", metavar="TAG")
+    
+    assign = sub.add_parser("assign", help="Assign a task to an agent")
+    assign.add_argument("task_id")
+    assign.add_argument("agent_id")
+    
+    update = sub.add_parser("update", help="Change a task's status")
+    update.add_argument("task_id")
+    update.add_argument("status", choices=JobBoard.VALID_STATUSES)
+    update.add_argument("agent_id")
+    update.add_argument("reason", nargs="?", help="Blocked reason")
+    
+    list_cmd = sub.add_parser("list", help="Tasks available for work")
+    list_cmd.add_argument("agent_id", nargs="?")
+    list_cmd.add_argument("limit", nargs="?", type=int)
+    
+    get = sub.add_parser("get", help="Show one task")
+    get.add_argument("task_id")
+    
+    sub.add_parser("stats", help="Board statistics")
+    
+    batch = sub.add_parser("batch", help="Apply JSONL ops with one load/save")
+    batch.add_argument("file", help="JSONL file of {\"op\": ..., ...} lines")
+    
+    return parser
+
+
+def main():
+    """CLI entry point."""
+    args = _build_parser().parse_args()
+    board = SQLiteJobBoard() if args.sqlite else JobBoard()
+    
+    try:
+        result = COMMANDS[args.command](args, board)
+    except ValueError as e:
+        print(json.dumps({"error": str(e)}, indent=2))
         sys.exit(1)
+    
+    print(json.dumps(result, indent=2))
 
 
 if __name__ == "__main__":
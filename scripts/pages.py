@@ -1,6 +1,17 @@
 # -- coding: utf-8 --
+import hashlib
+import io
+import math
+import multiprocessing
+import os
+import sys
+from array import array
+from functools import lru_cache
+from pathlib import Path
+
 from reportlab.lib.pagesizes import A4
 from reportlab.lib.colors import HexColor
+from reportlab.pdfbase.pdfmetrics import stringWidth
 from reportlab.pdfgen import canvas
 
 width, height = A4
@@ -15,13 +26,77 @@ black = HexColor("#000000")
 MARGIN = 40  # general margin
 GRID_STEP = 18  # grid spacing (must match set_background step)
 TEXT_PADDING = 3  # padding between text baseline and grid line (in points)
+GRID_FORM = "gridBG"  # form XObject name of the gridded background
+ECOUTE_FORM = "ecouteEntry"  # form XObject name of one écoute entry
+LECTURE_FORM = "lectureEntry"  # form XObject name of one lecture entry
+
+
+# Grid line positions inside the margins (the xlist/ylist of canvas.grid)
+GRID_XS = range(MARGIN, int(width - MARGIN) + 1, GRID_STEP)
+GRID_YS = range(MARGIN, int(height - MARGIN) + 1, GRID_STEP)
+
+# Background grid segments (x1, y1, x2, y2): horizontal then vertical lines.
+# Unlike canvas.grid(), which stops the lattice at the last x/y position and
+# rebuilds this list on every call, lines run all the way to the margins.
+GRID_LINES = (
+    [(MARGIN, y, width - MARGIN, y) for y in GRID_YS]
+    + [(x, MARGIN, x, height - MARGIN) for x in GRID_XS]
+)
+
+
+@lru_cache(maxsize=None)
+def string_width(text, font, size):
+    """Width of text in font/size; the labels are fixed, so each is measured once."""
+    return stringWidth(text, font, size)
+
+
+# Labels that may overflow the right margin: key -> (x, full, short, font,
+# size). The text and font never change, so whichever fits is decided once
+# at import; a short of None means nothing is drawn if the full one won't fit.
+_LABELS = {
+    "objectif": (width / 2 + 10, u"Objectif du jour :", None, "Times-Bold", 12),
+    "ecoute": (MARGIN, u"Écoute / Vidéos : (titre, chaîne, notes)",
+               u"Écoute / Vidéos :", "Times-Bold", 12),
+    "notes": (MARGIN + 420, u"Notes", None, "Times-Bold", 11),  # col4
+    "type": (MARGIN, u"Type (YouTube, podcast, etc.) :", u"Type :",
+             "Times-Bold", 11),
+    "date": (MARGIN + 170, u"Date :", None, "Times-Bold", 11),
+    "mots": (MARGIN, u"Mots / expressions intéressants :",
+             u"Mots / expressions :", "Times-Bold", 11),
+    "resume_ecoute": (MARGIN, u"Résumé / Compréhension :", u"Résumé :",
+                      "Times-Bold", 11),
+    "auteur": (MARGIN, u"Auteur / Source :", u"Auteur :", "Times-Bold", 11),
+    "pages": (MARGIN, u"Pages / Partie lue :", u"Pages :", "Times-Bold", 11),
+    "vocab": (MARGIN, u"Vocabulaire nouveau :", u"Vocabulaire :",
+              "Times-Bold", 11),
+    "resume_lecture": (MARGIN, u"Résumé / Idées principales :", u"Résumé :",
+                       "Times-Bold", 11),
+    "difficultes": (MARGIN, u"Difficultés / Points à revoir :",
+                    u"Difficultés :", "Times-Bold", 11),
+}
+_CHOSEN = {
+    key: full if x + string_width(full, font, size) < width - MARGIN else short
+    for key, (x, full, short, font, size) in _LABELS.items()
+}
+
+
+def _snap(v):
+    """Nearest grid line to v (grid lines sit every GRID_STEP from MARGIN)."""
+    return MARGIN + round((v - MARGIN) / GRID_STEP) * GRID_STEP
+
+
+# Snapped value for every whole point on the page. Layout positions are
+# mostly ints after the first snap, so most calls become one index; floats
+# (and anything off the page) still take the arithmetic path.
+_SNAP_Y = array("h", [_snap(i) for i in range(int(height) + 1)])
+_SNAP_X = array("h", [_snap(i) for i in range(int(width) + 1)])
 
 
 def snap_to_grid(y):
     """Snap y position to the nearest grid line."""
-    offset = y - MARGIN
-    snapped = round(offset / GRID_STEP) * GRID_STEP
-    return MARGIN + snapped
+    if type(y) is int and 0 <= y < len(_SNAP_Y):
+        return _SNAP_Y[y]
+    return _snap(y)
 
 
 def text_above_grid(y):
@@ -32,12 +107,62 @@ def text_above_grid(y):
 
 def snap_x_to_grid(x):
     """Snap x position to the nearest vertical grid line."""
-    offset = x - MARGIN
-    snapped = round(offset / GRID_STEP) * GRID_STEP
-    return MARGIN + snapped
+    if type(x) is int and 0 <= x < len(_SNAP_X):
+        return _SNAP_X[x]
+    return _snap(x)
+
+
+def draw_hlines(c, y, stop, max_lines=None):
+    """Draw full-width writing lines on grid line y and every grid line below
+    it while above stop (at most max_lines), as one path.
+
+    Returns the grid line just below the last one drawn.
+    """
+    ys = range(y, math.floor(stop), -GRID_STEP)[:max_lines]
+    if ys:
+        c.lines([(MARGIN, line_y, width - MARGIN, line_y) for line_y in ys])
+    return y - len(ys) * GRID_STEP
 
 
 def set_background(c, with_grid=True):
+    if with_grid:
+        # Drawn once per canvas as a form XObject; every gridded page then
+        # references it instead of repeating the rectangle and grid path
+        if not c.hasForm(GRID_FORM):
+            c.beginForm(GRID_FORM)
+            draw_background(c, with_grid=True)
+            c.endForm()
+        c.doForm(GRID_FORM)
+    else:
+        draw_background(c, with_grid=False)
+
+    c.setFillColor(black)
+
+
+# Depth of each entry block, by form name (the same on every canvas)
+_BLOCK_DEPTHS = {}
+
+
+def draw_block(c, name, draw, y):
+    """Draw a repeated block with its top grid line at y and return the grid
+    line just below it.
+
+    The block is drawn once per canvas as a form XObject, with draw(c)
+    working down from y=0; every use then just translates and references
+    it. The caller must have checked that the block fits above the margin.
+    """
+    if not c.hasForm(name):
+        c.beginForm(name, lowery=-height, uppery=GRID_STEP)
+        _BLOCK_DEPTHS[name] = draw(c)
+        c.endForm()
+    c.saveState()
+    c.translate(0, y)
+    c.doForm(name)
+    c.restoreState()
+    return y + _BLOCK_DEPTHS[name]
+
+
+def draw_background(c, with_grid=True):
     # beige background
     c.setFillColor(beige)
     c.rect(0, 0, width, height, fill=1, stroke=0)
@@ -46,16 +171,7 @@ def set_background(c, with_grid=True):
         # subtle grid inside margins
         c.setStrokeColor(grid)
         c.setLineWidth(0.25)
-        y = MARGIN
-        while y <= height - MARGIN:
-            c.line(MARGIN, y, width - MARGIN, y)
-            y += GRID_STEP
-        x = MARGIN
-        while x <= width - MARGIN:
-            c.line(x, MARGIN, x, height - MARGIN)
-            x += GRID_STEP
-
-    c.setFillColor(black)
+        c.lines(GRID_LINES)
 
 
 def header_title(c, text):
@@ -70,8 +186,7 @@ def header_title(c, text):
 
 
 # 1. Page d’introduction
-def make_page_introduction():
-    c = canvas.Canvas("Page_d_introduction.pdf", pagesize=A4)
+def draw_page_introduction(c):
     set_background(c, with_grid=False)
     header_title(c, u"Mes objectifs en français")
 
@@ -97,18 +212,14 @@ def make_page_introduction():
         c.setStrokeColor(underline)
         c.setLineWidth(0.5)
         for _ in range(lines):
-            y = snap_to_grid(y - GRID_STEP)
+            y -= GRID_STEP  # y is already on the grid
             c.line(MARGIN, y, width - MARGIN, y)
-        y = snap_to_grid(y - GRID_STEP)  # Space after section
+        y -= GRID_STEP  # Space after section
         c.setFont("Times-Roman", 14)
 
-    c.showPage()
-    c.save()
-
 
 # 2. Journal quotidien
-def make_journal_quotidien():
-    c = canvas.Canvas("Journal_quotidien.pdf", pagesize=A4)
+def draw_journal_quotidien(c):
     set_background(c, with_grid=True)
     header_title(c, u"Journal quotidien")
 
@@ -126,11 +237,9 @@ def make_journal_quotidien():
     c.line(MARGIN + 40, line_y, width / 2, line_y)
 
     c.setFont("Times-Bold", 12)
-    # Ensure text doesn't overflow - check if there's enough space
-    obj_text = u"Objectif du jour :"
-    obj_width = c.stringWidth(obj_text, "Times-Bold", 12)
-    if width / 2 + 10 + obj_width < width - MARGIN:
-        c.drawString(width / 2 + 10, text_y, obj_text)
+    # Only drawn if it fits (see _LABELS)
+    if _CHOSEN["objectif"]:
+        c.drawString(width / 2 + 10, text_y, _CHOSEN["objectif"])
     c.setFont("Times-Roman", 12)
     c.line(width / 2 + 140, line_y, width - MARGIN, line_y)
 
@@ -150,9 +259,7 @@ def make_journal_quotidien():
 
     # allocate block
     block_height = 120
-    while y > height - MARGIN - 35 - block_height and y > MARGIN + 320:
-        c.line(MARGIN, y, width - MARGIN, y)
-        y = snap_to_grid(y - GRID_STEP)
+    y = draw_hlines(c, y, max(height - MARGIN - 35 - block_height, MARGIN + 320))
 
     y = snap_to_grid(y - 12)
 
@@ -168,23 +275,15 @@ def make_journal_quotidien():
     c.setLineWidth(0.5)
     y = snap_to_grid(y - 8)
 
-    while y > MARGIN + 190:
-        c.line(MARGIN, y, width - MARGIN, y)
-        y = snap_to_grid(y - GRID_STEP)
+    y = draw_hlines(c, y, MARGIN + 190)
 
     y = snap_to_grid(y - 12)
 
     # Écoute / Vidéos
     c.setFont("Times-Bold", 12)
     text_y = text_above_grid(y)
-    # Ensure text doesn't overflow
-    ecoute_text = u"Écoute / Vidéos : (titre, chaîne, notes)"
-    ecoute_width = c.stringWidth(ecoute_text, "Times-Bold", 12)
-    if MARGIN + ecoute_width < width - MARGIN:
-        c.drawString(MARGIN, text_y, ecoute_text)
-    else:
-        # Truncate if too long
-        c.drawString(MARGIN, text_y, u"Écoute / Vidéos :")
+    # Shortened if it would overflow (see _LABELS)
+    c.drawString(MARGIN, text_y, _CHOSEN["ecoute"])
     y = snap_to_grid(y - 10)
     c.setStrokeColor(blue)
     c.setLineWidth(1)
@@ -193,9 +292,7 @@ def make_journal_quotidien():
     c.setLineWidth(0.5)
     y = snap_to_grid(y - 8)
 
-    while y > MARGIN + 90:
-        c.line(MARGIN, y, width - MARGIN, y)
-        y = snap_to_grid(y - GRID_STEP)
+    y = draw_hlines(c, y, MARGIN + 90)
 
     y = snap_to_grid(y - 12)
 
@@ -211,17 +308,11 @@ def make_journal_quotidien():
     c.setLineWidth(0.5)
     y = snap_to_grid(y - 8)
 
-    while y > MARGIN:
-        c.line(MARGIN, y, width - MARGIN, y)
-        y = snap_to_grid(y - GRID_STEP)
-
-    c.showPage()
-    c.save()
+    y = draw_hlines(c, y, MARGIN)
 
 
 # 3. Journal de vocabulaire par thème
-def make_journal_vocabulaire():
-    c = canvas.Canvas("Journal_vocabulaire_par_theme.pdf", pagesize=A4)
+def draw_journal_vocabulaire(c):
     set_background(c, with_grid=True)
     header_title(c, u"Vocabulaire par thème")
 
@@ -247,10 +338,9 @@ def make_journal_vocabulaire():
     c.drawString(col1, text_y, u"Mot / expression")
     c.drawString(col2, text_y, u"Traduction (IT/EN)")
     c.drawString(col3, text_y, u"Exemple")
-    # Check if Notes fits
-    notes_width = c.stringWidth(u"Notes", "Times-Bold", 11)
-    if col4 + notes_width < width - MARGIN:
-        c.drawString(col4, text_y, u"Notes")
+    # Only drawn if it fits (see _LABELS)
+    if _CHOSEN["notes"]:
+        c.drawString(col4, text_y, _CHOSEN["notes"])
 
     y = snap_to_grid(y - 6)
     c.setStrokeColor(blue)
@@ -268,21 +358,82 @@ def make_journal_vocabulaire():
         c.line(x, header_sep_y, x, MARGIN)
 
     # rows
-    while y > MARGIN:
-        c.line(MARGIN, y, width - MARGIN, y)
-        y = snap_to_grid(y - GRID_STEP)
-
-    c.showPage()
-    c.save()
+    y = draw_hlines(c, y, MARGIN)
 
 
 # 4. Journal d'écoute
-def make_journal_ecoute():
-    c = canvas.Canvas("Journal_d_ecoute.pdf", pagesize=A4)
+def draw_ecoute_entry(c):
+    """Draw one listening entry with its title line at y=0.
+
+    Returns the grid line just below its last writing line.
+    """
+    c.setFont("Times-Bold", 11)
+    c.setStrokeColor(underline)
+    c.setLineWidth(0.5)
+    y = 0
+
+    text_y = y + TEXT_PADDING
+    line_y = y
+    c.drawString(MARGIN, text_y, u"Titre / Source :")
+    c.line(MARGIN + 80, line_y, width - MARGIN, line_y)
+    y -= GRID_STEP
+
+    text_y = y + TEXT_PADDING
+    line_y = y
+    c.drawString(MARGIN, text_y, _CHOSEN["type"])
+    c.line(MARGIN + 170, line_y, width - MARGIN, line_y)
+    y -= GRID_STEP
+
+    text_y = y + TEXT_PADDING
+    line_y = y
+    c.drawString(MARGIN, text_y, u"Durée :")
+    c.line(MARGIN + 45, line_y, MARGIN + 150, line_y)
+
+    if _CHOSEN["date"]:
+        c.drawString(MARGIN + 170, text_y, _CHOSEN["date"])
+    c.line(MARGIN + 210, line_y, width - MARGIN, line_y)
+    y -= GRID_STEP
+
+    # Sujets / Thèmes - line starts right after the text
+    text_y = y + TEXT_PADDING
+    line_y = y
+    sujets_text = u"Sujets / Thèmes :"
+    sujets_width = string_width(sujets_text, "Times-Bold", 11)
+    c.drawString(MARGIN, text_y, sujets_text)
+    c.line(MARGIN + sujets_width + 5, line_y, width - MARGIN, line_y)
+    y -= GRID_STEP
+    # Then writing lines
+    y = draw_hlines(c, y, -height, max_lines=2)
+
+    # Mots / expressions intéressants - first line starts right after the text
+    text_y = y + TEXT_PADDING
+    line_y = y
+    mots_text = _CHOSEN["mots"]
+    mots_width = string_width(mots_text, "Times-Bold", 11)
+    c.drawString(MARGIN, text_y, mots_text)
+    # First line starts right after text
+    c.line(MARGIN + mots_width + 5, line_y, width - MARGIN, line_y)
+    y -= GRID_STEP
+    # Then remaining writing lines
+    y = draw_hlines(c, y, -height, max_lines=1)  # One more line
+
+    # Résumé / Compréhension - first line starts right after the text
+    text_y = y + TEXT_PADDING
+    line_y = y
+    resume_text = _CHOSEN["resume_ecoute"]
+    resume_width = string_width(resume_text, "Times-Bold", 11)
+    c.drawString(MARGIN, text_y, resume_text)
+    # First line starts right after text
+    c.line(MARGIN + resume_width + 5, line_y, width - MARGIN, line_y)
+    y -= GRID_STEP
+    # Then remaining writing lines
+    return draw_hlines(c, y, -height, max_lines=2)  # Two more lines
+
+
+def draw_journal_ecoute(c):
     set_background(c, with_grid=True)
     header_title(c, u"Journal d'écoute")
 
-    c.setFont("Times-Bold", 11)
     # Start closer to header - remove extra space at top
     y = height - MARGIN - 30
 
@@ -294,118 +445,84 @@ def make_journal_ecoute():
 
         # For second and subsequent entries, start one square above (reduce spacing)
         if entry_num > 0:
-            y = snap_to_grid(y - GRID_STEP)  # One square less spacing
-
-        text_y = text_above_grid(y)
-        line_y = snap_to_grid(y)
-        c.drawString(MARGIN, text_y, u"Titre / Source :")
-        c.setStrokeColor(underline)
-        c.setLineWidth(0.5)
-        c.line(MARGIN + 80, line_y, width - MARGIN, line_y)
-        y = snap_to_grid(y - GRID_STEP)
-
-        text_y = text_above_grid(y)
-        line_y = snap_to_grid(y)
-        type_text = u"Type (YouTube, podcast, etc.) :"
-        type_width = c.stringWidth(type_text, "Times-Bold", 11)
-        if MARGIN + type_width < width - MARGIN:
-            c.drawString(MARGIN, text_y, type_text)
-        else:
-            c.drawString(MARGIN, text_y, u"Type :")
-        c.line(MARGIN + 170, line_y, width - MARGIN, line_y)
-        y = snap_to_grid(y - GRID_STEP)
-
-        text_y = text_above_grid(y)
-        line_y = snap_to_grid(y)
-        c.drawString(MARGIN, text_y, u"Durée :")
-        c.line(MARGIN + 45, line_y, MARGIN + 150, line_y)
-
-        date_width = c.stringWidth(u"Date :", "Times-Bold", 11)
-        if MARGIN + 170 + date_width < width - MARGIN:
-            c.drawString(MARGIN + 170, text_y, u"Date :")
-        c.line(MARGIN + 210, line_y, width - MARGIN, line_y)
-        y = snap_to_grid(y - GRID_STEP)
-
-        # Sujets / Thèmes - line starts right after the text
-        text_y = text_above_grid(y)
-        line_y = snap_to_grid(y)
-        sujets_text = u"Sujets / Thèmes :"
-        sujets_width = c.stringWidth(sujets_text, "Times-Bold", 11)
-        c.drawString(MARGIN, text_y, sujets_text)
-        c.setStrokeColor(underline)
-        c.setLineWidth(0.5)
-        c.line(MARGIN + sujets_width + 5, line_y, width - MARGIN, line_y)
-        y = snap_to_grid(y - GRID_STEP)
-        # Then writing lines
-        for _ in range(2):
-            if y <= MARGIN:
-                break
-            c.line(MARGIN, y, width - MARGIN, y)
-            y = snap_to_grid(y - GRID_STEP)
-
-        # Mots / expressions intéressants - first line starts right after the text
-        text_y = text_above_grid(y)
-        line_y = snap_to_grid(y)
-        mots_text = u"Mots / expressions intéressants :"
-        mots_width = c.stringWidth(mots_text, "Times-Bold", 11)
-        if MARGIN + mots_width < width - MARGIN:
-            c.drawString(MARGIN, text_y, mots_text)
-        else:
-            mots_text = u"Mots / expressions :"
-            mots_width = c.stringWidth(mots_text, "Times-Bold", 11)
-            c.drawString(MARGIN, text_y, mots_text)
-        # First line starts right after text
-        c.line(MARGIN + mots_width + 5, line_y, width - MARGIN, line_y)
-        y = snap_to_grid(y - GRID_STEP)
-        # Then remaining writing lines
-        for _ in range(1):  # One more line
-            if y <= MARGIN:
-                break
-            c.line(MARGIN, y, width - MARGIN, y)
-            y = snap_to_grid(y - GRID_STEP)
-
-        # Résumé / Compréhension - first line starts right after the text
-        text_y = text_above_grid(y)
-        line_y = snap_to_grid(y)
-        resume_text = u"Résumé / Compréhension :"
-        resume_width = c.stringWidth(resume_text, "Times-Bold", 11)
-        if MARGIN + resume_width < width - MARGIN:
-            c.drawString(MARGIN, text_y, resume_text)
-        else:
-            resume_text = u"Résumé :"
-            resume_width = c.stringWidth(resume_text, "Times-Bold", 11)
-            c.drawString(MARGIN, text_y, resume_text)
-        # First line starts right after text
-        c.line(MARGIN + resume_width + 5, line_y, width - MARGIN, line_y)
-        y = snap_to_grid(y - GRID_STEP)
-        # Then remaining writing lines
-        for _ in range(2):  # Two more lines
-            if y <= MARGIN:
-                break
-            c.line(MARGIN, y, width - MARGIN, y)
-            y = snap_to_grid(y - GRID_STEP)
+            y -= GRID_STEP  # One square less spacing
+        y = draw_block(c, ECOUTE_FORM, draw_ecoute_entry, snap_to_grid(y))
 
         # Blue separator - one square above (reduce spacing before it)
-        y = snap_to_grid(y - GRID_STEP)  # One square before separator
+        y -= GRID_STEP  # One square before separator
         # Only draw separator if we have space - same format as Journal_de_lecture
         if y > MARGIN + 10:
             c.setStrokeColor(blue)
             c.setLineWidth(1.5)  # Thicker blue separator like Journal_de_lecture
             c.line(MARGIN, y, width - MARGIN, y)
         # Space between entries - one square above next entry
-        y = snap_to_grid(y - GRID_STEP)
-
-    c.showPage()
-    c.save()
+        y -= GRID_STEP
 
 
 # 5. Journal de lecture
-def make_journal_lecture():
-    c = canvas.Canvas("Journal_de_lecture.pdf", pagesize=A4)
+def draw_lecture_entry(c):
+    """Draw one reading entry with its title line at y=0.
+
+    Returns the grid line just below its last writing line.
+    """
+    c.setFont("Times-Bold", 11)
+    c.setStrokeColor(underline)
+    c.setLineWidth(0.5)
+    y = 0
+
+    text_y = y + TEXT_PADDING
+    line_y = y
+    c.drawString(MARGIN, text_y, u"Titre :")
+    c.line(MARGIN + 40, line_y, width - MARGIN, line_y)
+    y -= GRID_STEP
+
+    text_y = y + TEXT_PADDING
+    line_y = y
+    c.drawString(MARGIN, text_y, _CHOSEN["auteur"])
+    c.line(MARGIN + 95, line_y, width - MARGIN, line_y)
+    y -= GRID_STEP
+
+    text_y = y + TEXT_PADDING
+    line_y = y
+    c.drawString(MARGIN, text_y, _CHOSEN["pages"])
+    c.line(MARGIN + 115, line_y, width - MARGIN, line_y)
+    y -= GRID_STEP
+
+    # Vocabulaire nouveau - first line starts just after the words
+    text_y = y + TEXT_PADDING
+    line_y = y
+    vocab_text = _CHOSEN["vocab"]
+    vocab_width = string_width(vocab_text, "Times-Bold", 11)
+    c.drawString(MARGIN, text_y, vocab_text)
+    # First line starts right after the text
+    c.line(MARGIN + vocab_width + 5, line_y, width - MARGIN, line_y)
+    y -= GRID_STEP
+    # Then regular spacing for remaining lines
+    y = draw_hlines(c, y, -height, max_lines=1)  # One more line
+
+    # Résumé / Idées principales - first line starts just after the words
+    text_y = y + TEXT_PADDING
+    line_y = y
+    resume_text = _CHOSEN["resume_lecture"]
+    resume_width = string_width(resume_text, "Times-Bold", 11)
+    c.drawString(MARGIN, text_y, resume_text)
+    # First line starts right after the text
+    c.line(MARGIN + resume_width + 5, line_y, width - MARGIN, line_y)
+    y -= GRID_STEP
+    # Then regular spacing for remaining lines
+    y = draw_hlines(c, y, -height, max_lines=2)  # Two more lines
+
+    text_y = y + TEXT_PADDING
+    c.drawString(MARGIN, text_y, _CHOSEN["difficultes"])
+    # Only 1 grid square before first line (not 2)
+    y -= GRID_STEP
+    return draw_hlines(c, y, -height, max_lines=2)
+
+
+def draw_journal_lecture(c):
     set_background(c, with_grid=True)
     header_title(c, u"Journal de lecture")
 
-    c.setFont("Times-Bold", 11)
     y = height - MARGIN - 35
 
     # Use 3 entries for better spacing
@@ -413,118 +530,29 @@ def make_journal_lecture():
         # Check if we have enough space before drawing entry
         if y < MARGIN + 200:
             break
+        y = draw_block(c, LECTURE_FORM, draw_lecture_entry, snap_to_grid(y))
 
-        text_y = text_above_grid(y)
-        line_y = snap_to_grid(y)
-        c.drawString(MARGIN, text_y, u"Titre :")
-        c.setStrokeColor(underline)
-        c.setLineWidth(0.5)
-        c.line(MARGIN + 40, line_y, width - MARGIN, line_y)
-        y = snap_to_grid(y - GRID_STEP)
-
-        text_y = text_above_grid(y)
-        line_y = snap_to_grid(y)
-        auteur_text = u"Auteur / Source :"
-        auteur_width = c.stringWidth(auteur_text, "Times-Bold", 11)
-        if MARGIN + auteur_width < width - MARGIN:
-            c.drawString(MARGIN, text_y, auteur_text)
-        else:
-            c.drawString(MARGIN, text_y, u"Auteur :")
-        c.line(MARGIN + 95, line_y, width - MARGIN, line_y)
-        y = snap_to_grid(y - GRID_STEP)
-
-        text_y = text_above_grid(y)
-        line_y = snap_to_grid(y)
-        pages_text = u"Pages / Partie lue :"
-        pages_width = c.stringWidth(pages_text, "Times-Bold", 11)
-        if MARGIN + pages_width < width - MARGIN:
-            c.drawString(MARGIN, text_y, pages_text)
-        else:
-            c.drawString(MARGIN, text_y, u"Pages :")
-        c.line(MARGIN + 115, line_y, width - MARGIN, line_y)
-        y = snap_to_grid(y - GRID_STEP)
-
-        # Vocabulaire nouveau - first line starts just after the words
-        text_y = text_above_grid(y)
-        line_y = snap_to_grid(y)
-        vocab_text = u"Vocabulaire nouveau :"
-        vocab_width = c.stringWidth(vocab_text, "Times-Bold", 11)
-        if MARGIN + vocab_width < width - MARGIN:
-            c.drawString(MARGIN, text_y, vocab_text)
-        else:
-            vocab_text = u"Vocabulaire :"
-            vocab_width = c.stringWidth(vocab_text, "Times-Bold", 11)
-            c.drawString(MARGIN, text_y, vocab_text)
-        # First line starts right after the text
-        c.setStrokeColor(underline)
-        c.setLineWidth(0.5)
-        c.line(MARGIN + vocab_width + 5, line_y, width - MARGIN, line_y)
-        y = snap_to_grid(y - GRID_STEP)
-        # Then regular spacing for remaining lines
-        for _ in range(1):  # One more line
-            if y <= MARGIN:
-                break
-            c.line(MARGIN, y, width - MARGIN, y)
-            y = snap_to_grid(y - GRID_STEP)
-
-        # Résumé / Idées principales - first line starts just after the words
-        text_y = text_above_grid(y)
-        line_y = snap_to_grid(y)
-        resume_text = u"Résumé / Idées principales :"
-        resume_width = c.stringWidth(resume_text, "Times-Bold", 11)
-        if MARGIN + resume_width < width - MARGIN:
-            c.drawString(MARGIN, text_y, resume_text)
-        else:
-            c.drawString(MARGIN, text_y, u"Résumé :")
-            resume_width = c.stringWidth(u"Résumé :", "Times-Bold", 11)
-        # First line starts right after the text
-        c.line(MARGIN + resume_width + 5, line_y, width - MARGIN, line_y)
-        y = snap_to_grid(y - GRID_STEP)
-        # Then regular spacing for remaining lines
-        for _ in range(2):  # Two more lines
-            if y <= MARGIN:
-                break
-            c.line(MARGIN, y, width - MARGIN, y)
-            y = snap_to_grid(y - GRID_STEP)
-
-        text_y = text_above_grid(y)
-        diffic_text = u"Difficultés / Points à revoir :"
-        diffic_width = c.stringWidth(diffic_text, "Times-Bold", 11)
-        if MARGIN + diffic_width < width - MARGIN:
-            c.drawString(MARGIN, text_y, diffic_text)
-        else:
-            c.drawString(MARGIN, text_y, u"Difficultés :")
-        # Only 1 grid square before first line (not 2)
-        y = snap_to_grid(y - GRID_STEP)
-        for _ in range(2):
-            if y <= MARGIN:
-                break
-            c.line(MARGIN, y, width - MARGIN, y)
-            y = snap_to_grid(y - GRID_STEP)
-
-        y = snap_to_grid(y - GRID_STEP)  # Space before separator
+        y -= GRID_STEP  # Space before separator
         # Only draw separator if we have space - make it thicker
         if y > MARGIN + 10:
             c.setStrokeColor(blue)
             c.setLineWidth(1.5)  # Thicker blue separator
             c.line(MARGIN, y, width - MARGIN, y)
-        y = snap_to_grid(y - GRID_STEP * 2)  # More space between entries
-
-    c.showPage()
-    c.save()
+        y -= GRID_STEP * 2  # More space between entries
 
 
 # 6. Suivi des progrès
-def make_suivi_progres():
-    c = canvas.Canvas("Suivi_des_progres.pdf", pagesize=A4)
-    set_background(c, with_grid=True)
-    header_title(c, u"Suivi des progrès")
+SUIVI_HEADERS = (u"Semaine", u"Ressource principale", u"Nouveau vocabulaire",
+                 u"Thèmes étudiés", u"Confiance /10")
 
-    c.setFont("Times-Bold", 11)
-    y = height - MARGIN - 40
 
-    headers = [u"Semaine", u"Ressource principale", u"Nouveau vocabulaire",
-               u"Thèmes étudiés", u"Confiance /10"]
+@lru_cache(maxsize=1)
+def _suivi_xs():
+    """Column boundaries of the progress table, from MARGIN to width - MARGIN.
+
+    Depends only on module constants, so it is worked out once.
+    """
+    headers = SUIVI_HEADERS
     num_cols = len(headers)
 
     # Define proportional widths based on content needs:
@@ -535,14 +563,10 @@ def make_suivi_progres():
 
     # Calculate column boundaries proportionally, then snap to grid
     available_width = width - 2 * MARGIN
-    num_grid_steps = int((available_width) / GRID_STEP)
 
     # First, ensure minimum widths based on header text
-    c.setFont("Times-Bold", 11)
-    min_widths = []
-    for h_text in headers:
-        text_width = c.stringWidth(h_text, "Times-Bold", 11)
-        min_widths.append(text_width + 10)  # Add padding
+    min_widths = [string_width(h_text, "Times-Bold", 11) + 10  # Add padding
+                  for h_text in headers]
 
     # Calculate proportional positions
     xs = [MARGIN]  # Start at left margin
@@ -570,13 +594,26 @@ def make_suivi_progres():
             if new_right <= xs[i + 1] or (i == num_cols - 1):
                 xs[i + 1] = new_right
 
+    return tuple(xs)
+
+
+def draw_suivi_progres(c):
+    set_background(c, with_grid=True)
+    header_title(c, u"Suivi des progrès")
+
+    c.setFont("Times-Bold", 11)
+    y = height - MARGIN - 40
+
+    headers = SUIVI_HEADERS
+    xs = _suivi_xs()
+
     # header row - center align text in each column
     text_y = text_above_grid(y)
     for i, h_text in enumerate(headers):
         col_start = xs[i]
         col_end = xs[i + 1]
         col_center = (col_start + col_end) / 2
-        text_width = c.stringWidth(h_text, "Times-Bold", 11)
+        text_width = string_width(h_text, "Times-Bold", 11)
         # Center the text in the column
         text_x = col_center - (text_width / 2)
         # Ensure text doesn't overflow
@@ -605,29 +642,124 @@ def make_suivi_progres():
         c.line(grid_x, header_sep_y, grid_x, MARGIN)
 
     # rows
-    while y > MARGIN:
-        c.line(MARGIN, y, width - MARGIN, y)
-        y = snap_to_grid(y - GRID_STEP)
-
-    c.showPage()
-    c.save()
+    y = draw_hlines(c, y, MARGIN)
 
 
 # 7. Page quadrillée libre
-def make_page_quadrillee_libre():
-    c = canvas.Canvas("Page_quadrillee_libre.pdf", pagesize=A4)
+def draw_page_quadrillee_libre(c):
     set_background(c, with_grid=True)
     header_title(c, u"Page quadrillée libre")
-    c.showPage()
-    c.save()
+
+
+# Output file and drawing function per template, in workbook order
+TEMPLATES = [
+    ("Page_d_introduction.pdf", draw_page_introduction),
+    ("Journal_quotidien.pdf", draw_journal_quotidien),
+    ("Journal_vocabulaire_par_theme.pdf", draw_journal_vocabulaire),
+    ("Journal_d_ecoute.pdf", draw_journal_ecoute),
+    ("Journal_de_lecture.pdf", draw_journal_lecture),
+    ("Suivi_des_progres.pdf", draw_suivi_progres),
+    ("Page_quadrillee_libre.pdf", draw_page_quadrillee_libre),
+]
+
+WORKBOOK_PATH = "Cahier_d_etude.pdf"
+
+
+def template_hash(filename):
+    """Hash of this script and the output name, so layout edits also count."""
+    h = hashlib.sha256(Path(__file__).read_bytes())
+    h.update(f"\0{filename}".encode())
+    return h.hexdigest()
+
+
+def build_if_stale(filename, render):
+    """Run render(buf) unless filename was already built from this exact script.
+
+    render draws the whole PDF into an in-memory buffer; it then lands on
+    disk in one write and an atomic rename, so a killed build never leaves
+    a truncated PDF behind. Returns True if the PDF was (re)built, False if
+    skipped.
+    """
+    out = Path(filename)
+    hash_file = out.with_suffix(".template.hash")
+    digest = template_hash(filename)
+    if out.exists() and hash_file.exists() and hash_file.read_text() == digest:
+        return False
+
+    buf = io.BytesIO()
+    render(buf)
+    tmp_path = out.with_suffix(".pdf.tmp")
+    with open(tmp_path, "wb") as f:
+        f.write(buf.getbuffer())
+    os.replace(tmp_path, out)
+    hash_file.write_text(digest)
+    return True
+
+
+def build_pdf(filename, draw):
+    """Draw one template into its own single-page PDF, unless up to date."""
+    def render(buf):
+        c = canvas.Canvas(buf, pagesize=A4, pageCompression=1)
+        draw(c)
+        c.showPage()
+        c.save()
+
+    return build_if_stale(filename, render)
+
+
+def make_workbook(filename=WORKBOOK_PATH):
+    """Draw every template as consecutive pages of one PDF (a single save),
+    unless up to date."""
+    def render(buf):
+        c = canvas.Canvas(buf, pagesize=A4, pageCompression=1)
+        for _, draw in TEMPLATES:
+            draw(c)
+            c.showPage()
+        c.save()
+
+    return build_if_stale(filename, render)
+
+
+def make_page_introduction():
+    build_pdf("Page_d_introduction.pdf", draw_page_introduction)
+
+
+def make_journal_quotidien():
+    build_pdf("Journal_quotidien.pdf", draw_journal_quotidien)
+
+
+def make_journal_vocabulaire():
+    build_pdf("Journal_vocabulaire_par_theme.pdf", draw_journal_vocabulaire)
+
+
+def make_journal_ecoute():
+    build_pdf("Journal_d_ecoute.pdf", draw_journal_ecoute)
+
+
+def make_journal_lecture():
+    build_pdf("Journal_de_lecture.pdf", draw_journal_lecture)
+
+
+def make_suivi_progres():
+    build_pdf("Suivi_des_progres.pdf", draw_suivi_progres)
+
+
+def make_page_quadrillee_libre():
+    build_pdf("Page_quadrillee_libre.pdf", draw_page_quadrillee_libre)
 
 
 if __name__ == "__main__":
-    make_page_introduction()
-    make_journal_quotidien()
-    make_journal_vocabulaire()
-    make_journal_ecoute()
-    make_journal_lecture()
-    make_suivi_progres()
-    make_page_quadrillee_libre()
-    print(u"✅ Tous les templates ont été créés.")
+    if "--workbook" in sys.argv[1:]:
+        if make_workbook():
+            print(u"✅ " + WORKBOOK_PATH + u" a été créé.")
+        else:
+            print(u"✅ " + WORKBOOK_PATH + u" est à jour.")
+    else:
+        # Templates share no state and each writes its own file, so build
+        # them in parallel processes
+        with multiprocessing.Pool(min(len(TEMPLATES), os.cpu_count() or 1)) as pool:
+            built = pool.starmap(build_pdf, TEMPLATES)
+        if any(built):
+            print(u"✅ Tous les templates ont été créés.")
+        else:
+            print(u"✅ Tous les templates sont à jour.")
@@ -7,112 +7,231 @@ Priority:
 2. If not found, create from pattern analysis
 """
 
+import http.client
 import json
+import os
 import re
+import shutil
 import sys
-from pathlib import Path
-from typing import Dict, List, Optional
+import threading
+import time
+import urllib.parse
 import urllib.request
-import urllib.error
+from base64 import b64encode
+from concurrent.futures import ThreadPoolExecutor
+from functools import cached_property, lru_cache
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
 
 
-class AgentRecruiter:
-    """Recruits agents from templates or creates new ones."""
+try:
+    import orjson
+except ImportError:  # Optional speedup; stdlib json is used without it
+    orjson = None
+
+
+def _dumps(obj: Any) -> bytes:
+    """Serialize to indented UTF-8 JSON bytes (orjson when installed)."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    return json.dumps(obj, indent=2).encode()
+
+
+def _loads(data: bytes) -> Any:
+    """Parse JSON bytes (orjson when installed)."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+# Keep-alive connections by (scheme, host), reused by every fetch so all
+# templates after the first skip the TCP and TLS handshake. http.client
+# connections are not thread-safe, so each fetch thread keeps its own.
+_POOL = threading.local()
+
+RETRY_STATUSES = (502, 503, 504)
+REDIRECT_STATUSES = (301, 302, 303, 307, 308)
+MAX_REDIRECTS = 5
+MAX_FETCH_WORKERS = 16  # concurrent GitHub fetches in deploy_recruited_agents
+
+_HYPHEN_TO_SPACE = str.maketrans('-', ' ')  # agent-name -> role words
+
+
+def _connections() -> Dict[Tuple[str, str], http.client.HTTPConnection]:
+    """This thread's keep-alive connections."""
+    try:
+        return _POOL.connections
+    except AttributeError:
+        _POOL.connections = {}
+        return _POOL.connections
+
+
+def _open_connection(parts: urllib.parse.SplitResult, timeout: float) -> http.client.HTTPConnection:
+    """
+    New connection for a URL's scheme and host, through the proxy the
+    environment names for it (HTTP(S)_PROXY, minus NO_PROXY) if any.
     
-    GITHUB_REPO = "https://raw.githubusercontent.com/VoltAgent/awesome-claude-code-subagents/main"
+    HTTPS goes through a CONNECT tunnel; plain HTTP is sent to the proxy
+    with the absolute URL as the request target (see _request_target).
+    """
+    conn_class = http.client.HTTPConnection if parts.scheme == "http" else http.client.HTTPSConnection
+    proxy = urllib.request.getproxies().get(parts.scheme)
+    if not proxy or urllib.request.proxy_bypass(parts.hostname or ""):
+        return conn_class(parts.netloc, timeout=timeout)
     
-    def __init__(self, project_root: str = "."):
-        self.project_root = Path(project_root).resolve()
-        self.claude_dir = self.project_root / ".claude"
-        self.agents_pending = self.claude_dir / "agents" / "pending"
-        self.local_templates = Path(__file__).parent.parent / "templates" / "agents"
-        
-    def recruit(self, agent_name: str, required_capabilities: Optional[List[str]] = None) -> Dict:
-        """
-        Recruit an agent - try GitHub first, then create.
-        
-        Args:
-            agent_name: Name of agent to recruit
-            required_capabilities: Specific capabilities needed
-            
-        Returns:
-            Dict with status and agent info
-        """
-        # Try local templates first
-        local_path = self.local_templates / f"{agent_name}.md"
-        if local_path.exists():
-            with open(local_path) as f:
-                content = f.read()
-            return {
-                "status": "found_local",
-                "agent": agent_name,
-                "source": "local_template",
-                "content": content
-            }
-        
-        # Try GitHub repo
-        github_result = self._fetch_from_github(agent_name)
-        if github_result["status"] == "success":
-            return github_result
-        
-        # Create new agent
-        return self._create_agent(agent_name, required_capabilities)
+    proxy_parts = urllib.parse.urlsplit(proxy if "://" in proxy else f"http://{proxy}")
+    proxy_headers = {}
+    if proxy_parts.username:
+        user = urllib.parse.unquote(proxy_parts.username)
+        password = urllib.parse.unquote(proxy_parts.password or "")
+        credentials = f"{user}:{password}"
+        proxy_headers["Proxy-Authorization"] = f"Basic {b64encode(credentials.encode()).decode()}"
+    proxy_class = http.client.HTTPSConnection if proxy_parts.scheme == "https" else http.client.HTTPConnection
     
-    def _fetch_from_github(self, agent_name: str) -> Dict:
-        """Attempt to fetch agent from GitHub repo."""
-        url = f"{self.GITHUB_REPO}/{agent_name}.md"
-        
-        try:
-            with urllib.request.urlopen(url, timeout=10) as response:
-                content = response.read().decode('utf-8')
-                
-                return {
-                    "status": "success",
-                    "agent": agent_name,
-                    "source": "github_repo",
-                    "content": content,
-                    "url": url
-                }
-        except urllib.error.HTTPError as e:
-            return {
-                "status": "not_found",
-                "agent": agent_name,
-                "error": f"HTTP {e.code}",
-                "attempted_url": url
-            }
-        except Exception as e:
-            return {
-                "status": "error",
-                "agent": agent_name,
-                "error": str(e),
-                "attempted_url": url
-            }
+    if parts.scheme == "http":
+        conn = proxy_class(proxy_parts.hostname, proxy_parts.port, timeout=timeout)
+        conn.proxy_headers = proxy_headers
+        return conn
+    conn = http.client.HTTPSConnection(proxy_parts.hostname, proxy_parts.port or 80, timeout=timeout)
+    conn.set_tunnel(parts.hostname, parts.port, headers=proxy_headers)
+    return conn
+
+
+def _request_target(parts: urllib.parse.SplitResult, conn: http.client.HTTPConnection) -> str:
+    """Path to request: the absolute URL when conn is a plain-HTTP proxy."""
+    path = parts.path + (f"?{parts.query}" if parts.query else "")
+    if hasattr(conn, "proxy_headers"):
+        return f"{parts.scheme}://{parts.netloc}{path}"
+    return path
+
+
+def _http_get(url: str, headers: Optional[Dict[str, str]] = None, timeout: float = 10,
+              retries: int = 3, backoff: float = 0.3) -> Tuple[int, http.client.HTTPMessage, bytes]:
+    """
+    GET url over a pooled keep-alive connection, following redirects.
     
-    def _create_agent(self, agent_name: str, capabilities: Optional[List[str]]) -> Dict:
-        """Create new agent based on patterns."""
-        # Parse agent name to extract role
-        role = agent_name.replace('-', ' ').title()
-        role_slug = agent_name.lower()
-        
-        # Derive description
-        if capabilities:
-            cap_str = ", ".join(capabilities[:3])
-            description = f"Expert {role.lower()} specializing in {cap_str}"
+    Dropped connections and 502/503/504 responses are retried with
+    exponential backoff; up to MAX_REDIRECTS Location headers are
+    followed. Returns (status, response headers, body) of the final response.
+    """
+    for _ in range(MAX_REDIRECTS + 1):
+        status, response_headers, body = _get_once(url, headers, timeout, retries, backoff)
+        location = response_headers.get("Location")
+        if status not in REDIRECT_STATUSES or not location:
+            return status, response_headers, body
+        url = urllib.parse.urljoin(url, location)
+    raise http.client.HTTPException(f"More than {MAX_REDIRECTS} redirects, last to {url}")
+
+
+def _get_once(url: str, headers: Optional[Dict[str, str]], timeout: float,
+              retries: int, backoff: float) -> Tuple[int, http.client.HTTPMessage, bytes]:
+    """One GET of url, with retries but without following redirects."""
+    parts = urllib.parse.urlsplit(url)
+    key = (parts.scheme, parts.netloc)
+    connections = _connections()
+    
+    for attempt in range(retries + 1):
+        conn = connections.get(key)
+        if conn is None:
+            conn = connections[key] = _open_connection(parts, timeout)
+        try:
+            request_headers = dict(headers or {})
+            request_headers.update(getattr(conn, "proxy_headers", {}))
+            conn.request("GET", _request_target(parts, conn), headers=request_headers)
+            response = conn.getresponse()
+            body = response.read()
+        except (http.client.HTTPException, OSError):
+            # Stale keep-alive socket or network blip: reconnect and retry
+            conn.close()
+            del connections[key]
+            if attempt == retries:
+                raise
         else:
-            description = f"Expert {role.lower()} agent"
-        
-        # Generate agent template
-        content = f"""---
+            if response.status not in RETRY_STATUSES or attempt == retries:
+                return response.status, response.headers, body
+        time.sleep(backoff * 2 ** attempt)
+
+
+def _tmp_path(path: Path) -> str:
+    """Sibling tmp name unique to this process and thread, so concurrent
+    writers of the same path (fetch threads, other recruiters) never share one."""
+    return f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+
+
+def _atomic_write(path: Path, data: bytes):
+    """Write data to path in one write(2) via a tmp file and os.replace."""
+    tmp_path = _tmp_path(path)
+    fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        view = memoryview(data)
+        while view:  # os.write may write less than asked
+            view = view[os.write(fd, view):]
+    finally:
+        os.close(fd)
+    os.replace(tmp_path, path)
+
+
+def _atomic_copy(src: Path, dst: Path):
+    """Copy src to dst byte for byte (in-kernel where the OS allows) via a tmp
+    file and os.replace."""
+    tmp_path = _tmp_path(dst)
+    shutil.copyfile(src, tmp_path)
+    os.replace(tmp_path, dst)
+
+
+@lru_cache(maxsize=256)
+def _render_capabilities(role: str, capabilities: Tuple[str, ...]) -> str:
+    """Generate capabilities section based on role."""
+    if capabilities:
+        caps_list = "\n".join([f"- {cap}" for cap in capabilities])
+        return f"""
+Primary capabilities:
+{caps_list}
+
+Additional expertise:
+- Best practices and standards
+- Quality assurance
+- Team collaboration
+- Documentation
+"""
+    else:
+        return """
+- Domain expertise in {role}
+- Best practices and standards
+- Quality assurance
+- Team collaboration
+- Continuous improvement
+- Documentation
+"""
+
+
+@lru_cache(maxsize=256)
+def _render_agent(agent_name: str, capabilities: Tuple[str, ...]) -> str:
+    """Generated agent definition; pure in its arguments, so memoized."""
+    # Parse agent name to extract role, munging each spelling once
+    role = agent_name.translate(_HYPHEN_TO_SPACE).title()
+    role_words = role.lower()
+    role_slug = agent_name.lower()
+    
+    # Derive description
+    if capabilities:
+        cap_str = ", ".join(capabilities[:3])
+        description = f"Expert {role_words} specializing in {cap_str}"
+    else:
+        description = f"Expert {role_words} agent"
+    
+    # Generate agent template
+    content = f"""---
 name: {role_slug}
 description: {description}. Masters specialized workflows and best practices with focus on delivering high-quality results.
 tools: Read, Write, Edit, Bash, Glob, Grep
 ---
 
-You are a senior {role.lower()} with expertise in delivering exceptional results. Your focus spans quality, efficiency, and collaboration with emphasis on best practices and continuous improvement.
+You are a senior {role_words} with expertise in delivering exceptional results. Your focus spans quality, efficiency, and collaboration with emphasis on best practices and continuous improvement.
 
 ## Core Capabilities
 
-{self._generate_capabilities_section(role, capabilities)}
+{_render_capabilities(role, capabilities)}
 
 ## Communication Protocol
 
@@ -126,7 +245,7 @@ Context query:
   "requesting_agent": "{role_slug}",
   "request_type": "get_context",
   "payload": {{
-    "query": "Context needed for {role.lower()} work: project requirements, relevant docs, and team conventions."
+    "query": "Context needed for {role_words} work: project requirements, relevant docs, and team conventions."
   }}
 }}
 ```
@@ -192,37 +311,263 @@ Delivery notification:
 
 Always prioritize quality, communication, and continuous improvement while delivering exceptional results that meet project requirements.
 """
+    return content
+
+
+class AgentRecruiter:
+    """Recruits agents from templates or creates new ones."""
+    
+    GITHUB_REPO = "https://raw.githubusercontent.com/VoltAgent/awesome-claude-code-subagents/main"
+    CACHE_MAX_ENTRIES = 512  # GitHub templates kept on disk (least recently used dropped)
+    
+    def __init__(self, project_root: str = "."):
+        self._project_root = project_root
+        self._etags_dirty = False
+        # Fetch threads share _etags: every access, including the first
+        # (loading) one, holds this lock
+        self._etags_lock = threading.Lock()
+        self._dirs_ready = False
+    
+    # Paths are resolved on first use and then kept
+    @cached_property
+    def project_root(self) -> Path:
+        return Path(self._project_root).resolve()
+    
+    @cached_property
+    def claude_dir(self) -> Path:
+        return self.project_root / ".claude"
+    
+    @cached_property
+    def agents_pending(self) -> Path:
+        return self.claude_dir / "agents" / "pending"
+    
+    @cached_property
+    def local_templates(self) -> Path:
+        return Path(__file__).parent.parent / "templates" / "agents"
+    
+    @cached_property
+    def _cache_dir(self) -> Path:
+        return self.claude_dir / ".cache" / "agents"
+    
+    @cached_property
+    def _etag_index_path(self) -> Path:
+        return self.claude_dir / ".cache" / "agents.etags.json"
+    
+    @cached_property
+    def _etags(self) -> Dict[str, Dict[str, str]]:
+        """Revalidation headers of every cached agent, read once per recruiter."""
+        try:
+            return _loads(self._etag_index_path.read_bytes())
+        except (FileNotFoundError, ValueError):
+            return {}
+    
+    def recruit(self, agent_name: str, required_capabilities: Optional[List[str]] = None) -> Dict:
+        """
+        Recruit an agent - try GitHub first, then create.
+        
+        Args:
+            agent_name: Name of agent to recruit
+            required_capabilities: Specific capabilities needed
+            
+        Returns:
+            Dict with status and agent info
+        """
+        local_path = self.local_templates / f"{agent_name}.md"
+        return self._recruit(agent_name, required_capabilities,
+                             is_local=local_path.exists(), prefetched=None)
+    
+    def _recruit(self, agent_name: str, required_capabilities: Optional[List[str]],
+                 is_local: bool, prefetched: Optional[Dict]) -> Dict:
+        """
+        recruit(), for callers that already know whether the agent has a
+        local template and may have fetched it from GitHub (prefetched,
+        a _fetch_from_github result) in bulk.
+        """
+        # Try local templates first
+        local_path = self.local_templates / f"{agent_name}.md"
+        if is_local:
+            with open(local_path) as f:
+                content = f.read()
+            return {
+                "status": "found_local",
+                "agent": agent_name,
+                "source": "local_template",
+                "content": content,
+                "source_path": str(local_path)
+            }
+        
+        # Try GitHub repo
+        github_result = prefetched
+        if github_result is None:
+            github_result = self._fetch_from_github(agent_name)
+            self._prune_cache()
+            self._save_etags()
+        if github_result["status"] == "success":
+            return github_result
         
+        # Create new agent
+        return self._create_agent(agent_name, required_capabilities)
+    
+    def _fetch_from_github(self, agent_name: str, decode: bool = True) -> Dict:
+        """
+        Attempt to fetch agent from GitHub repo.
+        
+        A previously fetched copy is revalidated with a conditional GET
+        and reused on 304, or when GitHub cannot be reached. Successful
+        results name the cached file in "source_path"; with decode=False
+        they carry no "content", for callers that only copy the file.
+        """
+        url = f"{self.GITHUB_REPO}/{agent_name}.md"
+        cached, validators = self._read_cache(agent_name)
+        
+        try:
+            status, headers, body = _http_get(url, headers=validators)
+            if status == 200:
+                self._write_cache(agent_name, body, headers)
+                result = {
+                    "status": "success",
+                    "agent": agent_name,
+                    "source": "github_repo",
+                    "url": url,
+                    "source_path": str(self._cache_dir / f"{agent_name}.md")
+                }
+                if decode:
+                    result["content"] = body.decode('utf-8')
+                return result
+            if cached and (status == 304 or status in RETRY_STATUSES):
+                result = self._cached_result(agent_name, url, decode)
+                if result:
+                    return result
+            if status != 404:
+                # 404 just means the repo has no such agent; anything else
+                # is worth knowing about before a generic agent is generated
+                print(f"recruit: fetching {url} failed: HTTP {status}", file=sys.stderr)
+            return {
+                "status": "not_found",
+                "agent": agent_name,
+                "error": f"HTTP {status}",
+                "attempted_url": url
+            }
+        except Exception as e:
+            result = cached and self._cached_result(agent_name, url, decode)
+            fallback = "using cached copy" if result else "no cached copy"
+            print(f"recruit: fetching {url} failed: {e} ({fallback})", file=sys.stderr)
+            if result:
+                return result
+            return {
+                "status": "error",
+                "agent": agent_name,
+                "error": str(e),
+                "attempted_url": url
+            }
+    
+    def _read_cache(self, agent_name: str) -> Tuple[bool, Dict[str, str]]:
+        """Whether GitHub's copy of an agent is cached, and the headers to
+        revalidate it with."""
+        with self._etags_lock:
+            validators = self._etags.get(agent_name)
+        if not validators or not (self._cache_dir / f"{agent_name}.md").exists():
+            return False, {}
+        return True, dict(validators)
+    
+    def _cached_result(self, agent_name: str, url: str, decode: bool) -> Optional[Dict]:
+        """Serve an agent from the cache, marking it recently used (None if
+        the cached copy has become unreadable)."""
+        body_path = self._cache_dir / f"{agent_name}.md"
+        try:
+            content = body_path.read_text(encoding='utf-8') if decode else None
+            os.utime(body_path)
+        except (OSError, UnicodeDecodeError):
+            return None
+        
+        result = {
+            "status": "success",
+            "agent": agent_name,
+            "source": "cache",
+            "url": url,
+            "source_path": str(body_path)
+        }
+        if decode:
+            result["content"] = content
+        return result
+    
+    def _write_cache(self, agent_name: str, body: bytes, headers: http.client.HTTPMessage):
+        """Store a fetched agent and its validators (trimming the cache is
+        left to _prune_cache, once the fetched files have been used)."""
+        self._cache_dir.mkdir(parents=True, exist_ok=True)
+        _atomic_write(self._cache_dir / f"{agent_name}.md", body)
+        # The index itself is only written by _save_etags: a crash before
+        # then only costs a refetch
+        validators = {}
+        if headers.get("ETag"):
+            validators["If-None-Match"] = headers["ETag"]
+        if headers.get("Last-Modified"):
+            validators["If-Modified-Since"] = headers["Last-Modified"]
+        with self._etags_lock:
+            if validators:
+                self._etags[agent_name] = validators
+            else:
+                self._etags.pop(agent_name, None)
+            self._etags_dirty = True
+    
+    def _save_etags(self):
+        """Write the revalidation index back if any fetch changed it."""
+        with self._etags_lock:
+            if not self._etags_dirty:
+                return
+            data = _dumps(self._etags)
+            self._etags_dirty = False
+        self._etag_index_path.parent.mkdir(parents=True, exist_ok=True)
+        _atomic_write(self._etag_index_path, data)
+    
+    def _prune_cache(self):
+        """Drop the least recently used agents beyond CACHE_MAX_ENTRIES."""
+        entries = []
+        try:
+            scan = os.scandir(self._cache_dir)
+        except FileNotFoundError:
+            return  # nothing fetched yet
+        with scan:
+            for entry in scan:
+                if entry.name.endswith(".md"):
+                    try:
+                        entries.append((entry.stat().st_mtime, entry.name[:-3]))
+                    except FileNotFoundError:
+                        continue
+        if len(entries) <= self.CACHE_MAX_ENTRIES:
+            return
+        
+        entries.sort()
+        for _, name in entries[:-self.CACHE_MAX_ENTRIES]:
+            (self._cache_dir / f"{name}.md").unlink(missing_ok=True)
+            with self._etags_lock:
+                if self._etags.pop(name, None) is not None:
+                    self._etags_dirty = True
+    
+    def _bulk_fetch(self, agent_names: List[str]) -> Dict[str, Dict]:
+        """Fetch several agents from GitHub concurrently, keyed by name."""
+        names = list(dict.fromkeys(agent_names))
+        if not names:
+            return {}
+        with ThreadPoolExecutor(max_workers=min(MAX_FETCH_WORKERS, len(names))) as pool:
+            # Deploys copy the fetched file as is, so skip decoding it
+            results = pool.map(lambda name: self._fetch_from_github(name, decode=False), names)
+            return dict(zip(names, results))
+    
+    def _create_agent(self, agent_name: str, capabilities: Optional[List[str]]) -> Dict:
+        """Create new agent based on patterns."""
         return {
             "status": "created",
             "agent": agent_name,
             "source": "generated",
-            "content": content
+            "content": _render_agent(agent_name, tuple(capabilities or ()))
         }
     
-    def _generate_capabilities_section(self, role: str, capabilities: Optional[List[str]]) -> str:
-        """Generate capabilities section based on role."""
-        if capabilities:
-            caps_list = "\n".join([f"- {cap}" for cap in capabilities])
-            return f"""
-Primary capabilities:
-{caps_list}
-
-Additional expertise:
-- Best practices and standards
-- Quality assurance
-- Team collaboration
-- Documentation
-"""
-        else:
-            return """
-- Domain expertise in {role}
-- Best practices and standards
-- Quality assurance
-- Team collaboration
-- Continuous improvement
-- Documentation
-"""
+    def _ensure_dirs(self):
+        """Create agents/pending/ on the first deploy only."""
+        if not self._dirs_ready:
+            os.makedirs(self.agents_pending, exist_ok=True)
+            self._dirs_ready = True
     
     def deploy_recruited_agents(self, agents: List[str], project_context: Dict) -> Dict:
         """
@@ -235,24 +580,42 @@ Additional expertise:
         Returns:
             Dict with deployment results
         """
-        self.agents_pending.mkdir(parents=True, exist_ok=True)
+        self._ensure_dirs()
         
         results = {
             "recruited": [],
             "failed": []
         }
         
+        # One directory listing instead of a stat per agent
+        try:
+            local_set = {entry.name[:-3] for entry in os.scandir(self.local_templates)
+                         if entry.name.endswith(".md")}
+        except FileNotFoundError:
+            local_set = set()
+        
+        # GitHub fetches are independent and network-bound: issue them all
+        # at once, so the wait is the slowest fetch rather than the sum
+        fetched = self._bulk_fetch([
+            agent_name for agent_name in agents
+            if agent_name not in local_set
+        ])
+        
         for agent_name in agents:
             try:
                 # Recruit agent
-                recruit_result = self.recruit(agent_name)
+                recruit_result = self._recruit(agent_name, None,
+                                               is_local=agent_name in local_set,
+                                               prefetched=fetched.get(agent_name))
                 
                 if recruit_result["status"] in ["success", "found_local", "created"]:
                     # Save to pending directory
                     output_path = self.agents_pending / f"{agent_name}.md"
-                    
-                    with open(output_path, 'w') as f:
-                        f.write(recruit_result["content"])
+                    if "source_path" in recruit_result:
+                        # Already on disk: copy the bytes, no decode/encode round trip
+                        _atomic_copy(recruit_result["source_path"], output_path)
+                    else:
+                        _atomic_write(output_path, recruit_result["content"].encode('utf-8'))
                     
                     results["recruited"].append({
                         "agent": agent_name,
@@ -270,6 +633,10 @@ Additional expertise:
                     "reason": str(e)
                 })
         
+        # Trim the cache only now that every fetched file has been copied, and
+        # write the index once for the whole batch rather than once per fetch
+        self._prune_cache()
+        self._save_etags()
         return results
 
 
@@ -283,13 +650,13 @@ def main():
     
     context = {}
     if len(sys.argv) > 2:
-        with open(sys.argv[2]) as f:
-            context = json.load(f)
+        with open(sys.argv[2], 'rb') as f:
+            context = _loads(f.read())
     
     recruiter = AgentRecruiter()
     results = recruiter.deploy_recruited_agents(agent_names, context)
     
-    print(json.dumps(results, indent=2))
+    print(_dumps(results).decode())
 
 
 if __name__ == "__main__":
@@ -11,20 +11,141 @@ import json
 import os
 import re
 import sys
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
+from functools import cached_property
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Any, Dict, List, Optional
+
+
+try:
+    import orjson
+except ImportError:  # Optional speedup; stdlib json is used without it
+    orjson = None
+
+
+def _dumps(obj: Any) -> bytes:
+    """Serialize to indented UTF-8 JSON bytes (orjson when installed)."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    return json.dumps(obj, indent=2).encode()
+
+
+def _loads(data: bytes) -> Any:
+    """Parse JSON bytes (orjson when installed)."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+# YAML frontmatter: everything between the leading "---" and the next one
+_FRONTMATTER_RE = re.compile(r"\A---(.*?)---(.*)\Z", re.DOTALL)
+
+# The identity paragraph ("You are a ..." up to and including the first
+# blank line after it), which Round 1 sections are inserted after
+_IDENTITY_RE = re.compile(
+    r"^You(?: are|'re) a.*\n(?:[^\S\n]*\S.*\n)*[^\S\n]*(\n|\Z)",
+    re.MULTILINE,
+)
+
+
+def _atomic_write(path: Path, data: bytes):
+    """Write data to path in one write(2) via a tmp file and os.replace."""
+    tmp_path = f"{path}.{os.getpid()}.tmp"  # per process: workers may share a target
+    fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        view = memoryview(data)
+        while view:  # os.write may write less than asked
+            view = view[os.write(fd, view):]
+    finally:
+        os.close(fd)
+    os.replace(tmp_path, path)
+
+
+# Round 1 sections. The project section is filled in per project; the
+# communication protocol reference is the same for every agent.
+_PROJECT_SECTION = """
+## Project Context
+
+**Project:** {project_name}
+**Technologies:** {tech}
+**Specification:** See `{spec_doc}`
+
+**Key Resources:**
+- Job Board: `.claude/job-board.json`
+- Messages: `.claude/communications/`
+- Project Spec: `{spec_path}`
+- Audit Log: `.claude/audit-trail.jsonl`
+
+"""
+
+_COMM_SECTION = """
+## Communication Protocol
+
+**IMPORTANT**: You operate within a coordinated multi-agent system.
+
+**Core Communication Rules:**
+1. **Query context-manager** before starting work to get current system state
+2. **Update job board** immediately when taking/completing tasks
+3. **Broadcast critical updates** via urgent messages
+4. **Log all significant decisions** to audit trail
+5. **Request human review** for conflicts or major decisions
+
+**Message Types:**
+- `urgent`: Broadcast immediately (system-wide)
+- `normal`: Queued message (specific recipient or channel)
+- `low`: Background notification
+
+**Meta-Orchestrators** (your coordinators):
+- `context-manager`: Information storage and retrieval
+- `agent-manager`: Team coordination and training
+- `multi-agent-orchestrator`: Workflow execution
+
+**Communication Format:**
+```json
+{
+  "from": "your-agent-id",
+  "to": "recipient-agent-id or channel",
+  "priority": "urgent|normal|low",
+  "message": "Your message",
+  "context": {"task_id": "...", "related_docs": ["..."]}
+}
+```
+
+**Always check messages** before starting work - coordination prevents duplicate effort!
+
+"""
 
 
 class AgentSpecializer:
     """Specializes template agents for project-specific needs."""
     
+    # Templates checked against one directory listing rather than a stat each
+    LISTDIR_THRESHOLD = 4
+    # Rosters specialized across worker processes (smaller ones aren't worth the startup)
+    PARALLEL_THRESHOLD = 8
+    
     def __init__(self, project_root: str = "."):
-        self.project_root = Path(project_root).resolve()
-        self.claude_dir = self.project_root / ".claude"
-        self.agents_dir = self.claude_dir / "agents"
-        self.templates_dir = Path(__file__).parent.parent / "templates" / "agents"
-        
+        self._project_root = project_root
+        self._dirs_ready = False
+    
+    # Paths are resolved on first use and then kept
+    @cached_property
+    def project_root(self) -> Path:
+        return Path(self._project_root).resolve()
+    
+    @cached_property
+    def claude_dir(self) -> Path:
+        return self.project_root / ".claude"
+    
+    @cached_property
+    def agents_dir(self) -> Path:
+        return self.claude_dir / "agents"
+    
+    @cached_property
+    def templates_dir(self) -> Path:
+        return Path(__file__).parent.parent / "templates" / "agents"
+    
     def specialize_agent(self, template_path: Path, project_context: Dict, round_num: int = 1) -> str:
         """
         Specialize a template agent for the project.
@@ -40,6 +161,22 @@ class AgentSpecializer:
         with open(template_path) as f:
             content = f.read()
         
+        m = _FRONTMATTER_RE.match(content)
+        if m:
+            # Neither round touches the frontmatter: keep it verbatim and
+            # only rework what follows, instead of splitting and rebuilding
+            frontmatter, header_end = m.group(1), m.start(2)
+            if round_num == 1:
+                # Round 1 sees the same stripped body, and the header the same
+                # blank line after it, as in the rebuilt form below; only the
+                # template's final newline is kept
+                rest = content[header_end:]
+                specialized = self._round1_specialization(rest.strip(), project_context, frontmatter)
+                if rest.endswith("\n") and not specialized.endswith("\n"):
+                    specialized += "\n"
+                return f"{content[:header_end]}\n\n{specialized}"
+            return self._round2_specialization(content.rstrip(), project_context, frontmatter)
+        
         # Extract YAML frontmatter
         frontmatter, body = self._split_frontmatter(content)
         
@@ -53,10 +190,9 @@ class AgentSpecializer:
     
     def _split_frontmatter(self, content: str) -> tuple[str, str]:
         """Split YAML frontmatter from body."""
-        if content.startswith("---"):
-            parts = content.split("---", 2)
-            if len(parts) >= 3:
-                return parts[1].strip(), parts[2].strip()
+        m = _FRONTMATTER_RE.match(content)
+        if m:
+            return m.group(1).strip(), m.group(2).strip()
         return "", content
     
     def _round1_specialization(self, body: str, context: Dict, frontmatter: str) -> str:
@@ -69,79 +205,32 @@ class AgentSpecializer:
         - Links to job board and message system
         - References to meta-orchestrators
         """
-        # Add project context section at the beginning
-        project_section = f"""
-## Project Context
-
-**Project:** {context.get('project_name', 'Unknown')}
-**Technologies:** {', '.join(context.get('tech_stack', []))}
-**Specification:** See `{context.get('spec_files', ['project docs'])[0] if context.get('spec_files') else 'project docs'}`
-
-**Key Resources:**
-- Job Board: `.claude/job-board.json`
-- Messages: `.claude/communications/`
-- Project Spec: `{context.get('spec_files', ['specs/'])[0] if context.get('spec_files') else 'specs/'}`
-- Audit Log: `.claude/audit-trail.jsonl`
-
-"""
+        # Context values, looked up once
+        project_name = context.get('project_name', 'Unknown')
+        tech = ', '.join(context.get('tech_stack', ()))
+        spec_files = context.get('spec_files')
+        spec_doc = spec_files[0] if spec_files else 'project docs'
+        spec_path = spec_files[0] if spec_files else 'specs/'
         
-        # Add communication protocol reference
-        comm_section = """
-## Communication Protocol
-
-**IMPORTANT**: You operate within a coordinated multi-agent system.
-
-**Core Communication Rules:**
-1. **Query context-manager** before starting work to get current system state
-2. **Update job board** immediately when taking/completing tasks
-3. **Broadcast critical updates** via urgent messages
-4. **Log all significant decisions** to audit trail
-5. **Request human review** for conflicts or major decisions
-
-**Message Types:**
-- `urgent`: Broadcast immediately (system-wide)
-- `normal`: Queued message (specific recipient or channel)
-- `low`: Background notification
-
-**Meta-Orchestrators** (your coordinators):
-- `context-manager`: Information storage and retrieval
-- `agent-manager`: Team coordination and training
-- `multi-agent-orchestrator`: Workflow execution
-
-**Communication Format:**
-```json
-{
-  "from": "your-agent-id",
-  "to": "recipient-agent-id or channel",
-  "priority": "urgent|normal|low",
-  "message": "Your message",
-  "context": {"task_id": "...", "related_docs": ["..."]}
-}
-```
-
-**Always check messages** before starting work - coordination prevents duplicate effort!
-
-"""
+        # Add project context section at the beginning, then the
+        # communication protocol reference
+        project_section = _PROJECT_SECTION.format(
+            project_name=project_name, tech=tech, spec_doc=spec_doc, spec_path=spec_path)
+        comm_section = _COMM_SECTION
         
         # Insert sections after the main identity paragraph
-        lines = body.split('\n')
-        insert_idx = 0
-        for i, line in enumerate(lines):
-            if line.startswith("You are a") or line.startswith("You're a"):
-                # Find end of paragraph
-                for j in range(i+1, len(lines)):
-                    if lines[j].strip() == "":
-                        insert_idx = j + 1
-                        break
-                break
-        
-        if insert_idx > 0:
-            lines.insert(insert_idx, project_section)
-            lines.insert(insert_idx + 1, comm_section)
-            body = '\n'.join(lines)
+        # Each branch builds the result with one join, not a chain of
+        # concatenations that copies the growing body at every step
+        m = _IDENTITY_RE.search(body)
+        if m and m.group(1):
+            end = m.end()
+            body = ''.join((body[:end], project_section, '\n', comm_section, '\n', body[end:]))
+        elif m:
+            # The blank line closing the paragraph is the body's last line
+            body = '\n'.join((body, project_section, comm_section))
         else:
             # Fallback: prepend
-            body = project_section + comm_section + body
+            body = ''.join((project_section, comm_section, body))
         
         return body
     
@@ -190,45 +279,90 @@ class AgentSpecializer:
         body = body + "\n\n" + domain_section
         return body
     
+    def _specialize_to(self, template_path: str, project_context: Dict, round_num: int,
+                       output_path: str) -> Optional[str]:
+        """Specialize one template into output_path; returns the error, if any."""
+        try:
+            specialized = self.specialize_agent(Path(template_path), project_context, round_num)
+            _atomic_write(Path(output_path), specialized.encode('utf-8'))
+        except Exception as e:
+            return str(e)
+        return None
+    
+    def _ensure_dirs(self):
+        """Create agents/ and agents/pending/ on the first deploy only."""
+        if not self._dirs_ready:
+            os.makedirs(self.agents_dir / "pending", exist_ok=True)
+            self._dirs_ready = True
+    
     def deploy_agents(self, agent_names: List[str], project_context: Dict, round_num: int = 1):
         """
         Deploy specialized agents to .claude/agents/ directory.
         
         Agents go to pending/ for Round 1 (await approval).
         """
-        self.agents_dir.mkdir(parents=True, exist_ok=True)
+        self._ensure_dirs()
         
         if round_num == 1:
             target_dir = self.agents_dir / "pending"
         else:
             target_dir = self.agents_dir
         
-        target_dir.mkdir(parents=True, exist_ok=True)
-        
         deployed = []
         failed = []
         
+        templates_prefix = str(self.templates_dir) + os.sep
+        available = None
+        if len(agent_names) > self.LISTDIR_THRESHOLD:
+            try:
+                available = set(os.listdir(self.templates_dir))
+            except FileNotFoundError:
+                available = set()
+        
+        # (agent_name, template_path, output_path); paths None if no template
+        plan = []
         for agent_name in agent_names:
-            template_path = self.templates_dir / f"{agent_name}.md"
+            template_path = Path(templates_prefix + agent_name + ".md")
             
-            if not template_path.exists():
+            if available is not None:
+                found = f"{agent_name}.md" in available
+            else:
+                found = template_path.exists()
+            if found:
+                plan.append((agent_name, template_path, target_dir / f"{agent_name}.md"))
+            else:
+                plan.append((agent_name, None, None))
+        
+        # Each agent is independent CPU-bound string work, so large rosters
+        # are spread over processes; workers write their own output files
+        jobs = [(str(t), project_context, round_num, str(o)) for _, t, o in plan if t is not None]
+        workers = min(os.cpu_count() or 1, len(jobs))
+        if len(jobs) >= self.PARALLEL_THRESHOLD and workers > 1:
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                errors = iter(list(pool.map(_specialize_one, *zip(*jobs))))
+        else:
+            errors = (self._specialize_to(*job) for job in jobs)
+        
+        for agent_name, template_path, output_path in plan:
+            if template_path is None:
                 failed.append({"agent": agent_name, "reason": "template_not_found"})
                 continue
             
-            try:
-                specialized = self.specialize_agent(template_path, project_context, round_num)
-                
-                output_path = target_dir / f"{agent_name}.md"
-                with open(output_path, 'w') as f:
-                    f.write(specialized)
-                
+            error = next(errors)
+            if error is None:
                 deployed.append({"agent": agent_name, "path": str(output_path)})
-            except Exception as e:
-                failed.append({"agent": agent_name, "reason": str(e)})
+            else:
+                failed.append({"agent": agent_name, "reason": error})
         
         return {"deployed": deployed, "failed": failed}
 
 
+def _specialize_one(template_path: str, project_context: Dict, round_num: int,
+                    output_path: str) -> Optional[str]:
+    """AgentSpecializer._specialize_to for worker processes."""
+    return AgentSpecializer()._specialize_to(template_path, project_context, round_num, output_path)
+
+
 def main():
     """CLI entry point."""
     if len(sys.argv) < 3:
@@ -239,13 +373,13 @@ def main():
     agent_names = sys.argv[2].split(',')
     round_num = int(sys.argv[3]) if len(sys.argv) > 3 else 1
     
-    with open(context_file) as f:
-        project_context = json.load(f)
+    with open(context_file, 'rb') as f:
+        project_context = _loads(f.read())
     
     specializer = AgentSpecializer()
     result = specializer.deploy_agents(agent_names, project_context, round_num)
     
-    print(json.dumps(result, indent=2))
+    print(_dumps(result).decode())
 
 
 if __name__ == "__main__":